@@ -1,11 +1,14 @@
+import io
 import logging
 import os
-import tempfile
 
 import streamlit as st
 from crosstab_parser import parse_workbook
-from pptx_exporter import export_pptx
-from deck_update import update_presentation, update_presentation_with_unmapped, _parse_alt_text
+from pptx_exporter import CHART_LABEL_MAP, CHART_LABELS, export_pptx
+from deck_update import (
+    update_presentation, update_presentation_with_unmapped,
+    _parse_alt_descr, _parse_alt_text, _read_alt_descr,
+)
 from pptx import Presentation
 from smart_match import SmartMatcher
 from ai_insights import generate_all_insights
@@ -16,21 +19,21 @@ logging.basicConfig(
     format="%(levelname)s | %(name)s | %(message)s",
 )
 
+# Per-table widget constants (built once, not on every rerun of the table loop)
+_MULTI_SERIES_TYPES = frozenset({"Grouped Bar (2)", "Grouped Bar (3)", "Multi-Line"})
+_METRIC_TYPE_DISPLAY = ("Percentage", "Number", "Currency")
+_SORT_EXCLUDE_HINTS = ("other", "none", "don't know", "no answer", "prefer not", "n/a")
+
 
-def _save_temp(data_buf, suffix: str, session_key: str) -> str:
-    """Write *data_buf* to a NamedTemporaryFile, store the path in session_state,
-    and clean up any previous temp file stored under the same key."""
-    old = st.session_state.get(session_key)
-    if old and os.path.exists(old):
-        try:
-            os.unlink(old)
-        except OSError:
-            pass
-    tmp = tempfile.NamedTemporaryFile(delete=False, suffix=suffix)
-    tmp.write(data_buf if isinstance(data_buf, bytes) else data_buf.getbuffer())
-    tmp.close()
-    st.session_state[session_key] = tmp.name
-    return tmp.name
+@st.cache_data(show_spinner=False)
+def _parse_workbook_cached(file_bytes: bytes) -> dict:
+    """Parse an uploaded crosstab once per distinct file content.
+
+    Streamlit hashes *file_bytes* for the cache key, so widget reruns reuse the
+    parsed dict instead of re-reading every sheet.  ``cache_data`` hands back a
+    copy on each hit, so callers may mutate the result freely.
+    """
+    return parse_workbook(io.BytesIO(file_bytes))
 
 
 def _render_diff_table(old_tv: dict, new_table: dict):
@@ -128,107 +131,169 @@ def _render_diff_table(old_tv: dict, new_table: dict):
     legend_cols[2].markdown('<span style="background:#f8d7da;padding:2px 8px;border-radius:3px;">Removed rows</span>', unsafe_allow_html=True)
 
 
+# Alt-text types that link a shape to a crosstab table
+_TRACKED_ALT_TYPES = frozenset({
+    "chart", "table", "question_text", "text_question", "text_base", "text_title",
+    "text_callout", "text_takeaway", "text_analysis", "text_chart_title", "ai_insight",
+})
+
+
+def _new_existing_entry(table_title: str) -> dict:
+    return {
+        "title": table_title,
+        "question_text": "",
+        "base_text": "",
+        "chart_type": "bar_h",
+        "custom_base_description": "",  # Store custom base description
+        "custom_question": "",  # Store custom question text
+        "callouts": [],  # Initialize callouts list
+        # Presence flags for connected objects
+        "has_chart": False,
+        "has_table": False,
+        "has_title": False,
+        "has_base": False,
+        "has_question": False,
+        "has_callouts": False
+    }
+
+
+def _read_existing_chart(shape, alt, entry):
+    entry["has_chart"] = True
+    if "column" in alt:
+        entry["chart_column"] = alt.get("column")
+
+
+def _read_existing_table(shape, alt, entry):
+    entry["has_table"] = True
+    if shape.has_table:
+        tbl = shape.table
+        headers = []
+        for c in range(len(tbl.columns)):
+            headers.append(tbl.cell(0, c).text_frame.text.strip())
+        rows_data = []
+        for r in range(1, len(tbl.rows)):
+            row_vals = []
+            for c in range(len(tbl.columns)):
+                row_vals.append(tbl.cell(r, c).text_frame.text.strip())
+            rows_data.append(row_vals)
+        entry["table_values"] = {
+            "headers": headers,
+            "rows": rows_data,
+        }
+
+
+def _read_existing_question(text, alt, entry):
+    question_text = text
+    if question_text.startswith("Question: "):
+        question_text = question_text[10:]  # Remove "Question: " prefix
+    entry["question_text"] = question_text
+    entry["custom_question"] = question_text
+    entry["has_question"] = True
+
+
+def _read_existing_base(text, alt, entry):
+    base_text = text
+    entry["base_text"] = base_text
+    entry["has_base"] = True
+
+    parsed_base = parse_base_text(base_text)
+    if parsed_base["description"]:
+        entry["custom_base_description"] = parsed_base["description"]
+
+
+def _read_existing_title(text, alt, entry):
+    entry["title"] = text
+    entry["has_title"] = True
+
+
+def _read_existing_callout(text, alt, entry):
+    entry["callouts"].append({
+        "row_label": alt.get("row", alt.get("row_label", "")),
+        "column_key": alt.get("column", "Total"),
+        "text": text,
+        "position": (0.5, 7.0, 9.0, 0.4),  # Default position
+        "font_size": 12,
+        "font_bold": True,
+        "metric_type": alt.get("metric_type", "percentage")
+    })
+    entry["has_callouts"] = True
+
+
+# alt "type" -> reader; tracked types without a reader only register the table.
+# Shape readers get the shape, text readers get its text frame's text (read once).
+_EXISTING_SHAPE_READERS = {
+    "chart": _read_existing_chart,
+    "table": _read_existing_table,
+}
+_EXISTING_TEXT_READERS = {
+    "question_text": _read_existing_question,
+    "text_question": _read_existing_question,
+    "text_base": _read_existing_base,
+    "text_title": _read_existing_title,
+    "text_callout": _read_existing_callout,
+}
+
+
 def parse_existing_powerpoint(pptx_file):
     """Parse existing PowerPoint to extract current content and settings."""
     try:
         prs = Presentation(pptx_file)
         existing_content = {}
-        
+
         for slide in prs.slides:
             for shape in slide.shapes:
-                alt = _parse_alt_text(shape)
-                
-                if alt.get("type") in ["chart", "table", "question_text", "text_question", "text_base", "text_title", "text_callout", "text_takeaway", "text_analysis", "text_chart_title", "ai_insight"]:
-                    table_title = alt.get("table_title")
-                    if table_title:
-                        if table_title not in existing_content:
-                            existing_content[table_title] = {
-                                "title": table_title,
-                                "question_text": "",
-                                "base_text": "",
-                                "chart_type": "bar_h",
-                                "custom_base_description": "",  # Store custom base description
-                                "custom_question": "",  # Store custom question text
-                                "callouts": [],  # Initialize callouts list
-                                # Presence flags for connected objects
-                                "has_chart": False,
-                                "has_table": False,
-                                "has_title": False,
-                                "has_base": False,
-                                "has_question": False,
-                                "has_callouts": False
-                            }
-                        
-                        # Track object presence
-                        if alt.get("type") == "chart":
-                            existing_content[table_title]["has_chart"] = True
-                            if "column" in alt:
-                                existing_content[table_title]["chart_column"] = alt.get("column")
-                        elif alt.get("type") == "table":
-                            existing_content[table_title]["has_table"] = True
-                            if shape.has_table:
-                                tbl = shape.table
-                                headers = []
-                                for c in range(len(tbl.columns)):
-                                    headers.append(tbl.cell(0, c).text_frame.text.strip())
-                                rows_data = []
-                                for r in range(1, len(tbl.rows)):
-                                    row_vals = []
-                                    for c in range(len(tbl.columns)):
-                                        row_vals.append(tbl.cell(r, c).text_frame.text.strip())
-                                    rows_data.append(row_vals)
-                                existing_content[table_title]["table_values"] = {
-                                    "headers": headers,
-                                    "rows": rows_data,
-                                }
-
-                        # Extract question text
-                        if alt.get("type") in ["question_text", "text_question"] and hasattr(shape, "text_frame"):
-                            question_text = shape.text_frame.text
-                            if question_text.startswith("Question: "):
-                                question_text = question_text[10:]  # Remove "Question: " prefix
-                            existing_content[table_title]["question_text"] = question_text
-                            existing_content[table_title]["custom_question"] = question_text
-                            existing_content[table_title]["has_question"] = True
-                        
-                        # Extract base text
-                        elif alt.get("type") == "text_base" and hasattr(shape, "text_frame"):
-                            base_text = shape.text_frame.text
-                            existing_content[table_title]["base_text"] = base_text
-                            existing_content[table_title]["has_base"] = True
-                            
-                            parsed_base = parse_base_text(base_text)
-                            if parsed_base["description"]:
-                                existing_content[table_title]["custom_base_description"] = parsed_base["description"]
-                        
-                        # Extract chart title
-                        elif alt.get("type") == "text_title" and hasattr(shape, "text_frame"):
-                            existing_content[table_title]["title"] = shape.text_frame.text
-                            existing_content[table_title]["has_title"] = True
-                        
-                        # Extract text callouts
-                        elif alt.get("type") == "text_callout" and hasattr(shape, "text_frame"):
-                            if "callouts" not in existing_content[table_title]:
-                                existing_content[table_title]["callouts"] = []
-                            
-                            callout_text = shape.text_frame.text
-                            callout_info = {
-                                "row_label": alt.get("row", alt.get("row_label", "")),
-                                "column_key": alt.get("column", "Total"),
-                                "text": callout_text,
-                                "position": (0.5, 7.0, 9.0, 0.4),  # Default position
-                                "font_size": 12,
-                                "font_bold": True,
-                                "metric_type": alt.get("metric_type", "percentage")
-                            }
-                            existing_content[table_title]["callouts"].append(callout_info)
-                            existing_content[table_title]["has_callouts"] = True
-        
+                # Cheap probe on the raw descr: most slide chrome has no
+                # table link, so skip it before building the alt dict.
+                descr = _read_alt_descr(shape)
+                if "table_title" not in descr.lower():
+                    continue
+                alt = _parse_alt_descr(descr)
+                kind = alt.get("type")
+                if kind not in _TRACKED_ALT_TYPES:
+                    continue
+                table_title = alt.get("table_title")
+                if not table_title:
+                    continue
+
+                entry = existing_content.get(table_title)
+                if entry is None:
+                    entry = existing_content[table_title] = _new_existing_entry(table_title)
+                if kind in _EXISTING_SHAPE_READERS:
+                    _EXISTING_SHAPE_READERS[kind](shape, alt, entry)
+                elif kind in _EXISTING_TEXT_READERS and shape.has_text_frame:
+                    _EXISTING_TEXT_READERS[kind](shape.text_frame.text, alt, entry)
+
         return existing_content
     except Exception as e:
         st.error(f"Error parsing PowerPoint: {e}")
         return {}
 
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _generate_insights_cached(file_bytes: bytes, selections: dict) -> dict:
+    """Run the AI insight pass once per workbook and selection set.
+
+    Keyed on the uploaded bytes rather than the parsed tables, so a repeat
+    Export doesn't re-hash every table or call the model again.
+    """
+    tables = _parse_workbook_cached(file_bytes)["tables"]
+    return generate_all_insights(tables, selections=selections)
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _export_report_bytes(file_bytes: bytes, selections: dict, ai_insights: dict = None) -> bytes:
+    """Build the new-report deck in memory, reusing it for identical inputs."""
+    tables = _parse_workbook_cached(file_bytes)["tables"]
+    buf = io.BytesIO()
+    export_pptx(tables, selections, buf, ai_insights=ai_insights)
+    return buf.getvalue()
+
+
+@st.cache_data(show_spinner=False)
+def _parse_existing_powerpoint_cached(file_bytes: bytes) -> dict:
+    """Walk an uploaded deck's shapes once per distinct file content."""
+    return parse_existing_powerpoint(io.BytesIO(file_bytes))
+
 st.set_page_config(page_title="Report Relay", layout="wide")
 
 st.title("Report Relay")
@@ -296,8 +361,8 @@ if workflow_type == "Create New Report":
     
     if uploaded:
         with st.spinner("Parsing workbook..."):
-            xlsx_path = _save_temp(uploaded, ".xlsx", "_tmp_xlsx")
-            data = parse_workbook(xlsx_path)
+            st.session_state["_xlsx_bytes"] = uploaded.getvalue()
+            data = _parse_workbook_cached(st.session_state["_xlsx_bytes"])
             st.session_state.data = data
 
         st.success(f"Found {len(data['tables'])} tables")
@@ -334,7 +399,7 @@ if workflow_type == "Create New Report":
         # Default selections
         col1, col2 = st.columns(2)
         with col1:
-            default_choice = st.selectbox("Default visualization", ["Horizontal Bar", "Vertical Bar", "Donut", "Line", "Grouped Bar (2)", "Grouped Bar (3)", "Multi-Line", "Table Only", "Chart + Table"], index=0)
+            default_choice = st.selectbox("Default visualization", CHART_LABELS, index=0)
             apply_all_btn = st.button("Apply chart type to all")
         
         with col2:
@@ -348,9 +413,9 @@ else:
     
     if existing_ppt:
         with st.spinner("Parsing existing PowerPoint..."):
-            existing_content = parse_existing_powerpoint(existing_ppt)
+            st.session_state["_pptx_bytes"] = existing_ppt.getvalue()
+            existing_content = _parse_existing_powerpoint_cached(st.session_state["_pptx_bytes"])
             st.session_state.existing_content = existing_content
-            _save_temp(existing_ppt, ".pptx", "_tmp_pptx")
 
         if existing_content:
             st.success(f"Found connections for {len(existing_content)} tables")
@@ -370,8 +435,8 @@ else:
         
         if uploaded:
             with st.spinner("Parsing workbook..."):
-                xlsx_path = _save_temp(uploaded, ".xlsx", "_tmp_xlsx")
-                data = parse_workbook(xlsx_path)
+                st.session_state["_xlsx_bytes"] = uploaded.getvalue()
+                data = _parse_workbook_cached(st.session_state["_xlsx_bytes"])
                 st.session_state.data = data
 
             st.success(f"Found {len(data['tables'])} tables in crosstab")
@@ -453,6 +518,7 @@ else:
 if st.session_state.data is not None:
     data = st.session_state.data
     existing_content = st.session_state.existing_content
+    id_to_title = {t["id"]: t["title"] for t in data["tables"]}
     
     # Ensure default_column and apply_column_btn are defined for both workflows
     if workflow_type == "Create New Report":
@@ -502,12 +568,11 @@ if st.session_state.data is not None:
                     st.markdown(f"- … and {_remaining} more")
 
             with cols[1]:
-                options = ["Horizontal Bar", "Vertical Bar", "Donut", "Line", "Grouped Bar (2)", "Grouped Bar (3)", "Multi-Line", "Table Only", "Chart + Table"]
                 if apply_all_btn:
                     choice = default_choice
                 else:
                     choice = st.session_state["selections"].get(tid, {}).get("chart_type_label", default_choice)
-                choice = st.selectbox("Chart type", options, key=f"ctype_{tid}", index=options.index(choice))
+                choice = st.selectbox("Chart type", CHART_LABELS, key=f"ctype_{tid}", index=CHART_LABELS.index(choice))
                 
                 # Column selection for this table
                 # Keep Data column as banners only, add Metric selector when available
@@ -595,9 +660,8 @@ if st.session_state.data is not None:
                     combined_selected = combined_labels[0]
 
                 # Multi-column selection for grouped / multi-series chart types
-                multi_series_types = {"Grouped Bar (2)", "Grouped Bar (3)", "Multi-Line"}
                 multi_columns_selected = None
-                if choice in multi_series_types:
+                if choice in _MULTI_SERIES_TYPES:
                     n_series = 3 if choice == "Grouped Bar (3)" else 2
                     default_multi = st.session_state["selections"].get(tid, {}).get("column_keys", [])
                     if not default_multi or len(default_multi) < 2:
@@ -638,26 +702,17 @@ if st.session_state.data is not None:
                     title_val = st.text_input(title_label, value=default_title, key=f"title_{tid}")
 
                 # Base text logic - preserve custom descriptions while updating N values
-                def _find_base_idx(labels):
-                    for i, lab in enumerate(labels):
-                        if isinstance(lab, str) and lab.strip().lower().startswith("base"):
-                            return i
-                    return None
-                
-                base_idx = _find_base_idx(t["row_labels"])
+                # Base row / plain "Total" column are resolved at parse time
+                base_idx = meta.get("base_row_idx")
                 # Determine the Total column under the selected metric if applicable
                 total_idx = None
-                total_candidates = []
                 if (" | " in (combined_selected or "")):
                     # Prefer banner-qualified by current metric first (Banner | Metric)
                     metric_name = (current_metric or "").strip()
-                    if metric_name:
-                        total_candidates.append(f"Total | {metric_name}")
-                total_candidates.append("Total")
-                for cand in total_candidates:
-                    if cand in t["col_labels"]:
-                        total_idx = t["col_labels"].index(cand)
-                        break
+                    if metric_name and f"Total | {metric_name}" in t["col_labels"]:
+                        total_idx = t["col_labels"].index(f"Total | {metric_name}")
+                if total_idx is None:
+                    total_idx = meta.get("total_col_idx")
                 if total_idx is None:
                     total_idx = 0 if t["col_labels"] else None
                 
@@ -726,7 +781,7 @@ if st.session_state.data is not None:
                 suggested_excludes = []
                 for row in available_rows:
                     row_lower = row.lower().strip()
-                    if any(pattern in row_lower for pattern in ["other", "none", "don't know", "no answer", "prefer not", "n/a"]):
+                    if any(pattern in row_lower for pattern in _SORT_EXCLUDE_HINTS):
                         suggested_excludes.append(row)
                 
                 # Row exclusion selection
@@ -806,7 +861,7 @@ if st.session_state.data is not None:
                         callout_banner_default = selected_col if selected_col in banners else (banners[0] if banners else "")
                         callout_banner = st.selectbox("Callout banner", banners, key=f"callout_banner_{tid}", index=banners.index(callout_banner_default) if callout_banner_default in banners else 0)
                         # Metric type selector (display capitalized, store lowercase)
-                        metric_type_display = ["Percentage", "Number", "Currency"]
+                        metric_type_display = _METRIC_TYPE_DISPLAY
                         default_metric_type = st.session_state["selections"].get(tid, {}).get("callout_metric_type", "percentage")
                         def_idx = metric_type_display.index(default_metric_type.capitalize()) if default_metric_type and default_metric_type.capitalize() in metric_type_display else 0
                         selected_metric_display = st.selectbox("Callout metric type", metric_type_display, key=f"callout_metric_type_{tid}", index=def_idx)
@@ -867,7 +922,7 @@ if st.session_state.data is not None:
                                 help="Customize your callout text. Use [Value] as a placeholder for the actual data value."
                             )
                             # Metric type dropdown for existing callout (display capitalized, store lowercase)
-                            mt_display = ["Percentage", "Number", "Currency"]
+                            mt_display = _METRIC_TYPE_DISPLAY
                             mt_current = existing_callout.get('metric_type', 'percentage')
                             mt_idx = mt_display.index(mt_current.capitalize()) if mt_current and mt_current.capitalize() in mt_display else 0
                             mt_updated_display = st.selectbox("Metric type", mt_display, index=mt_idx, key=f"existing_callout_metric_{tid}_{i}")
@@ -910,7 +965,7 @@ if st.session_state.data is not None:
                                 key=f"callout_text_{tid}_{i}",
                                 help="Customize your callout text. Use [Value] as a placeholder for the actual data value."
                             )
-                            mt_display = ["Percentage", "Number", "Currency"]
+                            mt_display = _METRIC_TYPE_DISPLAY
                             mt_current = callout.get('metric_type', 'percentage')
                             mt_idx = mt_display.index(mt_current.capitalize()) if mt_current and mt_current.capitalize() in mt_display else 0
                             mt_updated_display = st.selectbox("Metric type", mt_display, index=mt_idx, key=f"callout_metric_{tid}_{i}")
@@ -936,20 +991,9 @@ if st.session_state.data is not None:
                         st.divider()
 
             # Build selections dictionary
-            chart_label_to_key = {
-                "Horizontal Bar":    "bar_h",
-                "Vertical Bar":      "bar_v",
-                "Donut":             "donut",
-                "Line":              "line",
-                "Grouped Bar (2)":   "grouped_bar_2",
-                "Grouped Bar (3)":   "grouped_bar_3",
-                "Multi-Line":        "multi_line",
-                "Table Only":        "table_only",
-                "Chart + Table":     "chart_table",
-            }
             selection_dict = {
                 "chart_type_label": choice,
-                "chart_type": chart_label_to_key.get(choice, "bar_h"),
+                "chart_type": CHART_LABEL_MAP.get(choice, "bar_h"),
                 # Persist both banner and metric plus the resolved combined label for export
                 "banner_key": selected_col,
                 "metric_key": current_metric,
@@ -973,7 +1017,9 @@ if st.session_state.data is not None:
                 if user_callouts:
                     selection_dict["callouts"] = user_callouts
             
-            st.session_state["selections"][tid] = selection_dict
+            # Only touch session state when a widget actually changed the entry
+            if st.session_state["selections"].get(tid) != selection_dict:
+                st.session_state["selections"][tid] = selection_dict
 
     # Export/Update section
     if st.session_state.data is not None:
@@ -994,16 +1040,14 @@ if st.session_state.data is not None:
                     "enable_sorting": v.get("enable_sorting", False),
                     "excluded_rows": v.get("excluded_rows", [])
                 } for tid, v in st.session_state["selections"].items()}
-                out = _save_temp(b"", ".pptx", "_tmp_out_pptx")
                 ai_data = None
                 try:
                     with st.spinner("Generating AI insights..."):
-                        ai_data = generate_all_insights(data["tables"], selections=sels)
+                        ai_data = _generate_insights_cached(st.session_state["_xlsx_bytes"], sels)
                 except Exception as e:
                     st.warning(f"AI insights skipped: {e}")
-                export_pptx(data["tables"], sels, out, ai_insights=ai_data)
-                with open(out, "rb") as f:
-                    st.download_button("Download report.pptx", f, file_name="report.pptx", mime="application/vnd.openxmlformats-officedocument.presentationml.presentation")
+                report_bytes = _export_report_bytes(st.session_state["_xlsx_bytes"], sels, ai_data)
+                st.download_button("Download report.pptx", report_bytes, file_name="report.pptx", mime="application/vnd.openxmlformats-officedocument.presentationml.presentation")
         
         else:
             # UPDATE EXISTING REPORT
@@ -1027,7 +1071,7 @@ if st.session_state.data is not None:
                 st.session_state.match_overrides = {}
 
             if st.button("Preview Matches", key="preview_matches"):
-                prs_preview = Presentation(st.session_state["_tmp_pptx"])
+                prs_preview = Presentation(io.BytesIO(st.session_state["_pptx_bytes"]))
                 matcher = SmartMatcher(data["tables"])
                 shapes_meta = []
                 for slide in prs_preview.slides:
@@ -1055,12 +1099,10 @@ if st.session_state.data is not None:
                 # Build title → resolved column_key from current selections
                 _title_to_col = {}
                 for _tid, _sel in st.session_state["selections"].items():
-                    for _t in data["tables"]:
-                        if _t["id"] == _tid:
-                            _title_to_col[_t["title"]] = (
-                                _sel.get("column_key") or _sel.get("banner_key") or "Total"
-                            )
-                            break
+                    if _tid in id_to_title:
+                        _title_to_col[id_to_title[_tid]] = (
+                            _sel.get("column_key") or _sel.get("banner_key") or "Total"
+                        )
 
                 with st.expander("Match Review", expanded=True):
                     # Approve All / Skip unmatched helper
@@ -1169,20 +1211,19 @@ if st.session_state.data is not None:
                 # Convert selections to use table titles as keys with all fields
                 table_selections = {}
                 for tid, v in st.session_state["selections"].items():
-                    for t in data["tables"]:
-                        if t["id"] == tid:
-                            table_selections[t["title"]] = {
-                                "chart_type": v.get("chart_type", "bar_h"),
-                                "column_key": v.get("column_key", "Total"),
-                                "column_keys": v.get("column_keys"),
-                                "title": v.get("title"),
-                                "base_text": v.get("base_text"),
-                                "question_text": v.get("question_text"),
-                                "callouts": v.get("callouts", []),
-                                "enable_sorting": v.get("enable_sorting", False),
-                                "excluded_rows": v.get("excluded_rows", []),
-                            }
-                            break
+                    if tid not in id_to_title:
+                        continue
+                    table_selections[id_to_title[tid]] = {
+                        "chart_type": v.get("chart_type", "bar_h"),
+                        "column_key": v.get("column_key", "Total"),
+                        "column_keys": v.get("column_keys"),
+                        "title": v.get("title"),
+                        "base_text": v.get("base_text"),
+                        "question_text": v.get("question_text"),
+                        "callouts": v.get("callouts", []),
+                        "enable_sorting": v.get("enable_sorting", False),
+                        "excluded_rows": v.get("excluded_rows", []),
+                    }
 
                 # Build SmartMatcher with user overrides from match review
                 overrides = st.session_state.get("match_overrides", {})
@@ -1196,11 +1237,10 @@ if st.session_state.data is not None:
                 def _on_progress(pct: float):
                     progress_bar.progress(min(pct, 1.0), text=f"Updating... {pct:.0%}")
 
-                out_path = _save_temp(b"", ".pptx", "_tmp_updated_pptx")
                 updated = update_presentation_with_unmapped(
-                    st.session_state["_tmp_pptx"],
-                    st.session_state["_tmp_xlsx"],
-                    out_path,
+                    io.BytesIO(st.session_state["_pptx_bytes"]),
+                    io.BytesIO(st.session_state["_xlsx_bytes"]),
+                    io.BytesIO(),
                     table_selections, data["tables"], existing_content,
                     matcher=matcher,
                     progress_callback=_on_progress,
@@ -1208,8 +1248,7 @@ if st.session_state.data is not None:
 
                 progress_bar.progress(1.0, text="Update complete!")
 
-                with open(updated, "rb") as f:
-                    st.download_button("Download updated_report.pptx", f, file_name="updated_report.pptx", mime="application/vnd.openxmlformats-officedocument.presentationml.presentation")
+                st.download_button("Download updated_report.pptx", updated.getvalue(), file_name="updated_report.pptx", mime="application/vnd.openxmlformats-officedocument.presentationml.presentation")
 
 # Show instructions when no data is loaded
 if st.session_state.data is None:
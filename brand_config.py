@@ -70,6 +70,22 @@ PALETTE_RED = [
 ALL_PALETTES = [PALETTE_BLUE, PALETTE_GREEN, PALETTE_PURPLE, PALETTE_RED]
 PALETTE_NAMES = ["blue", "green", "purple", "red"]
 
+_PALETTES_BY_NAME = {
+    "blue":   PALETTE_BLUE,
+    "green":  PALETTE_GREEN,
+    "purple": PALETTE_PURPLE,
+    "red":    PALETTE_RED,
+}
+
+# Palette shade indices to use for 1–5 series (see get_chart_colors)
+_SERIES_SHADES = {
+    1: (0,),
+    2: (0, 4),
+    3: (0, 2, 4),
+    4: (0, 1, 3, 4),
+    5: (0, 1, 2, 3, 4),
+}
+
 
 def get_palette(name: str = "blue") -> List[RGBColor]:
     """
@@ -77,13 +93,7 @@ def get_palette(name: str = "blue") -> List[RGBColor]:
     Valid names: 'blue', 'green', 'purple', 'red'
     Defaults to blue if name is unrecognised.
     """
-    mapping = {
-        "blue":   PALETTE_BLUE,
-        "green":  PALETTE_GREEN,
-        "purple": PALETTE_PURPLE,
-        "red":    PALETTE_RED,
-    }
-    return mapping.get(name.lower(), PALETTE_BLUE)
+    return _PALETTES_BY_NAME.get(name.lower(), PALETTE_BLUE)
 
 
 def get_chart_colors(n_series: int, palette_name: str = "blue") -> List[RGBColor]:
@@ -99,18 +109,10 @@ def get_chart_colors(n_series: int, palette_name: str = "blue") -> List[RGBColor
     """
     palette = get_palette(palette_name)   # list of 5 RGBColor objects (index 0–4)
 
-    selection_map = {
-        1: [0],
-        2: [0, 4],
-        3: [0, 2, 4],
-        4: [0, 1, 3, 4],
-        5: [0, 1, 2, 3, 4],
-    }
-
     if n_series <= 0:
         return []
     if n_series <= 5:
-        indices = selection_map[n_series]
+        indices = _SERIES_SHADES[n_series]
     else:
         # More than 5 series: repeat palette cyclically
         indices = [(i % 5) for i in range(n_series)]
@@ -97,24 +97,55 @@ def _format_code_for(value_format: str) -> str:
     return "General"
 
 
+def _cache_matches(
+    cache: Optional[etree._Element],
+    head: List[Tuple[str, Dict[str, str], Optional[str]]],
+    points: List[Tuple[int, str]],
+) -> bool:
+    """True when *cache* already holds exactly what a rebuild would write.
+
+    *head* lists the leading ``(tag, attrib, text)`` children (ptCount,
+    formatCode); *points* the ``(idx, text)`` of each following ``c:pt``.
+    """
+    if cache is None or cache.attrib:
+        return False
+    kids = list(cache)
+    if len(kids) != len(head) + len(points):
+        return False
+    for el, (tag, attrib, text) in zip(kids, head):
+        if el.tag != tag or el.attrib != attrib or len(el) or (el.text or "") != (text or ""):
+            return False
+    for el, (idx, text) in zip(kids[len(head):], points):
+        if el.tag != f"{_C}pt" or el.attrib != {"idx": str(idx)} or len(el) != 1:
+            return False
+        v = el[0]
+        if v.tag != f"{_C}v" or v.attrib or len(v) or (v.text or "") != text:
+            return False
+    return True
+
+
 def _rebuild_str_cache(parent: etree._Element, categories: List[str]):
     """Replace (or create) the ``c:strCache`` under *parent* with new categories."""
     # parent is c:cat or c:tx
     str_ref = parent.find(f"{_C}strRef")
     target = str_ref if str_ref is not None else parent
 
+    texts = [str(cat) if cat is not None else "" for cat in categories]
     old_cache = target.find(f"{_C}strCache")
+    if _cache_matches(old_cache, [(f"{_C}ptCount", {"val": str(len(texts))}, None)],
+                      list(enumerate(texts))):
+        return
     if old_cache is not None:
         target.remove(old_cache)
 
     cache = etree.SubElement(target, f"{_C}strCache")
     pt_count = etree.SubElement(cache, f"{_C}ptCount")
-    pt_count.set("val", str(len(categories)))
-    for idx, cat in enumerate(categories):
+    pt_count.set("val", str(len(texts)))
+    for idx, text in enumerate(texts):
         pt = etree.SubElement(cache, f"{_C}pt")
         pt.set("idx", str(idx))
         v = etree.SubElement(pt, f"{_C}v")
-        v.text = str(cat) if cat is not None else ""
+        v.text = text
 
 
 def _rebuild_num_cache(
@@ -126,7 +157,14 @@ def _rebuild_num_cache(
     num_ref = parent.find(f"{_C}numRef")
     target = num_ref if num_ref is not None else parent
 
+    points = [(idx, str(val)) for idx, val in enumerate(values) if val is not None]
     old_cache = target.find(f"{_C}numCache")
+    head = [
+        (f"{_C}formatCode", {}, format_code),
+        (f"{_C}ptCount", {"val": str(len(values))}, None),
+    ]
+    if _cache_matches(old_cache, head, points):
+        return
     if old_cache is not None:
         target.remove(old_cache)
 
@@ -135,13 +173,11 @@ def _rebuild_num_cache(
     fc.text = format_code
     pt_count = etree.SubElement(cache, f"{_C}ptCount")
     pt_count.set("val", str(len(values)))
-    for idx, val in enumerate(values):
-        if val is None:
-            continue
+    for idx, text in points:
         pt = etree.SubElement(cache, f"{_C}pt")
         pt.set("idx", str(idx))
         v_el = etree.SubElement(pt, f"{_C}v")
-        v_el.text = str(val)
+        v_el.text = text
 
 
 def _rebuild_tx_cache(ser_el: etree._Element, name: str):
@@ -227,10 +263,8 @@ def patch_chart_series(
     if not series_data:
         return
 
-    all_values = []
-    for _, _, vals in series_data:
-        all_values.extend(v for v in vals if v is not None)
     if value_format == "auto":
+        all_values = [v for _, _, vals in series_data for v in vals if v is not None]
         value_format = detect_value_format(all_values)
     fmt_code = _format_code_for(value_format)
 
@@ -257,12 +291,11 @@ def patch_chart_series(
         if order_el is not None:
             order_el.set("val", str(idx_val))
         plot.append(new_ser)
-        existing = plot.findall(f"{_C}ser")
+        existing.append(new_ser)
 
     # Shrink: remove trailing surplus series
     while len(existing) > n_needed:
-        plot.remove(existing[-1])
-        existing = plot.findall(f"{_C}ser")
+        plot.remove(existing.pop())
 
     # Update each series' data
     for i, (name, cats, vals) in enumerate(series_data):
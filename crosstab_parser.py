@@ -4,8 +4,14 @@ crosstab_parser — Parse Q-style crosstab workbooks into structured table dicts
 
 import json
 import logging
-from typing import Any, Dict, List, Optional, Tuple
-
+import os
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+from sys import intern
+from typing import IO, Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import openpyxl
 import pandas as pd
 
 logger = logging.getLogger("report_relay.crosstab_parser")
@@ -19,6 +25,8 @@ DEFAULT_PARSE_OPTIONS: Dict[str, Any] = {
     "footnote_threshold": 0.10,
     "min_block_rows": 2,
     "min_block_cols": 2,
+    # Worker threads for per-sheet block extraction (None = executor default).
+    "max_workers": None,
 }
 
 FOOTNOTE_SUBSTRING_PATTERNS = [
@@ -28,6 +36,17 @@ FOOTNOTE_SUBSTRING_PATTERNS = [
     "fieldwork", "survey", "methodology", "data collection",
 ]
 
+# pandas' default na_values: string cells equal to one of these are read as
+# missing.  Kept as a copy so the parser doesn't import pandas internals.
+_NA_STRINGS = frozenset({
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan",
+    "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None",
+    "n/a", "nan", "null",
+})
+
+# Legacy .xls workbooks are OLE2 compound files; openpyxl only reads .xlsx.
+_OLE2_MAGIC = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+
 FOOTNOTE_PREFIXES = [
     "source:", "note:", "notes:", "n =", "n=", "*", "#", "\u2020", "\u2021",
 ]
@@ -44,42 +63,90 @@ def _merge_options(user_opts: Optional[Dict[str, Any]]) -> Dict[str, Any]:
     return opts
 
 
+def _is_legacy_xls(src: Union[str, IO[bytes]]) -> bool:
+    """True when *src* holds an OLE2 (.xls) workbook rather than an .xlsx."""
+    if isinstance(src, (str, os.PathLike)):
+        with open(src, "rb") as f:
+            head = f.read(len(_OLE2_MAGIC))
+    else:
+        pos = src.tell()
+        head = src.read(len(_OLE2_MAGIC))
+        src.seek(pos)
+    return head == _OLE2_MAGIC
+
+
+def _read_sheets(src: Union[str, IO[bytes]]) -> List[Tuple[str, pd.DataFrame]]:
+    """Load every worksheet as a raw, header-less DataFrame.
+
+    Reads .xlsx cell values straight from openpyxl's read-only rows, opened
+    the way ``pd.ExcelFile`` opens them, which skips pandas' per-cell
+    conversion.  Missing cells and string cells matching pandas' default NA
+    strings (see _NA_STRINGS) become NaN, matching what
+    ``pd.ExcelFile.parse(header=None)`` produces.  Legacy .xls files still go
+    through ``pd.ExcelFile`` (needs xlrd).
+    """
+    if _is_legacy_xls(src):
+        xls = pd.ExcelFile(src)
+        return [(s, xls.parse(s, header=None)) for s in xls.sheet_names]
+
+    wb = openpyxl.load_workbook(src, read_only=True, data_only=True, keep_links=False)
+    try:
+        sheets: List[Tuple[str, pd.DataFrame]] = []
+        for ws in wb.worksheets:
+            # Don't trust the stored <dimension>; some writers emit "A1" only.
+            ws.reset_dimensions()
+            raw = pd.DataFrame(list(ws.iter_rows(values_only=True)))
+            raw = raw.astype(object).where(raw.notna() & ~raw.isin(_NA_STRINGS),
+                                           np.nan).infer_objects()
+            sheets.append((ws.title, raw))
+        return sheets
+    finally:
+        wb.close()
+
+
 def _find_blocks(df: pd.DataFrame, opts: Dict[str, Any]) -> List[Tuple[int, int]]:
     min_cells = opts["min_non_null_cells"]
     min_rows = opts["min_block_rows"]
     min_cols = opts["min_block_cols"]
 
-    empty_row = df.isna().all(axis=1)
+    # Block width is the sheet width, so a too-narrow sheet has no blocks.
+    if df.shape[1] < min_cols:
+        return []
+
+    nn_per_row = df.notna().to_numpy().sum(axis=1)
+    empty_row = nn_per_row == 0
+    # Non-zero diffs of the True-padded empty mask mark where each run of
+    # non-empty rows starts and where it stops (exclusive), in pairs.
+    padded = np.concatenate(([True], empty_row, [True])).astype(np.int8)
+    edges = np.flatnonzero(np.diff(padded)).reshape(-1, 2)
+    nn_cumsum = np.concatenate(([0], np.cumsum(nn_per_row)))
+
     blocks: List[Tuple[int, int]] = []
-    start = None
-    for i, is_empty in enumerate(list(empty_row) + [True]):
-        if start is None and not is_empty:
-            start = i
-        elif start is not None and is_empty:
-            end = i - 1
-            sub = df.iloc[start:end + 1]
-            if (sub.notna().sum().sum() >= min_cells
-                    and sub.shape[0] >= min_rows
-                    and sub.shape[1] >= min_cols):
-                blocks.append((start, end))
-            start = None
+    for start, stop in edges:
+        # Cheap shape test first, density range query only for survivors
+        if stop - start < min_rows:
+            continue
+        if nn_cumsum[stop] - nn_cumsum[start] < min_cells:
+            continue
+        blocks.append((int(start), int(stop) - 1))
     return blocks
 
 
 def _strip_edges(df: pd.DataFrame) -> pd.DataFrame:
-    df2 = df.copy()
-    while df2.shape[0] > 0 and df2.iloc[0].isna().all():
-        df2 = df2.iloc[1:]
-    while df2.shape[0] > 0 and df2.iloc[-1].isna().all():
-        df2 = df2.iloc[:-1]
-    while df2.shape[1] > 0 and df2.iloc[:, 0].isna().all():
-        df2 = df2.iloc[:, 1:]
-    while df2.shape[1] > 0 and df2.iloc[:, -1].isna().all():
-        df2 = df2.iloc[:, :-1]
-    return df2
-
-
-def _is_footnote_row(label: str, row_data: pd.Series, threshold: float) -> bool:
+    """Trim all-empty leading/trailing rows and columns with a single slice."""
+    notna = df.notna().to_numpy()
+    rows_any = notna.any(axis=1)
+    cols_any = notna.any(axis=0)
+    if not rows_any.any():
+        return df.iloc[0:0, 0:0]
+    r0 = int(rows_any.argmax())
+    r1 = len(rows_any) - int(rows_any[::-1].argmax())
+    c0 = int(cols_any.argmax())
+    c1 = len(cols_any) - int(cols_any[::-1].argmax())
+    return df.iloc[r0:r1, c0:c1]
+
+
+def _is_footnote_row(label: str, non_null_count: int, total_cols: int, threshold: float) -> bool:
     """Determine whether a body row is a footnote.
 
     Checks prefix kill-list first (always fires), then substring patterns,
@@ -95,22 +162,188 @@ def _is_footnote_row(label: str, row_data: pd.Series, threshold: float) -> bool:
         if pattern in label_lower:
             return True
 
-    total_cols = len(row_data)
     if total_cols > 0:
-        non_null_count = row_data.count()
         if (non_null_count / total_cols) < threshold:
             return True
 
     return False
 
 
+def _to_value_lists(arr: np.ndarray) -> List[List[Any]]:
+    """Convert a numeric block to row lists of Python scalars, ``None`` for NaN."""
+    out = arr.astype(object)
+    out[pd.isna(arr)] = None
+    return out.tolist()
+
+
+def _parse_sheet(s: str, raw: pd.DataFrame, opts: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Extract every table block from one raw sheet frame."""
+    footnote_threshold = opts["footnote_threshold"]
+    blocks = _find_blocks(raw, opts)
+    logger.debug("Sheet '%s': found %d block(s)", s, len(blocks))
+
+    sheet_tables: List[Dict[str, Any]] = []
+    for bi, (st, en) in enumerate(blocks, start=1):
+        sub = raw.iloc[st:en + 1, :]
+        sub = _strip_edges(sub)
+        if sub.shape[0] < 2 or sub.shape[1] < 2:
+            continue
+
+        # --- Title detection fallback (first-row single-cell title) ---
+        # Before running header detection, check whether the first row of
+        # the block is a standalone title (single non-empty cell in col A).
+        title_consumed_first_row = False
+        first_row = sub.iloc[0]
+        non_empty_first = first_row.dropna()
+        if (len(non_empty_first) == 1
+                and non_empty_first.index[0] == sub.columns[0]):
+            detected_title = str(non_empty_first.values[0]).strip()
+            if detected_title:
+                title_consumed_first_row = True
+                sub = sub.iloc[1:].reset_index(drop=True)
+                if sub.shape[0] < 2:
+                    continue
+                logger.debug(
+                    "Sheet '%s' block %d: consumed first-row title '%s'",
+                    s, bi, detected_title,
+                )
+
+        # --- Header detection ---
+        lookahead = min(5, sub.shape[0])
+        nn_counts = [int(sub.iloc[r].notna().sum()) for r in range(lookahead)]
+        if nn_counts:
+            banner_row_idx = int(max(range(len(nn_counts)), key=lambda i: nn_counts[i]))
+        else:
+            banner_row_idx = 0
+
+        metric_row_idx: Optional[int] = None
+        if banner_row_idx > 0:
+            above_count = nn_counts[banner_row_idx - 1]
+            banner_count = nn_counts[banner_row_idx]
+            if above_count >= 2 and above_count <= max(2, int(banner_count * 0.8)):
+                metric_row_idx = banner_row_idx - 1
+
+        # Build header labels
+        banner_row = sub.iloc[banner_row_idx].fillna("").astype(str).tolist()
+        if metric_row_idx is not None:
+            raw_metric_row = sub.iloc[metric_row_idx].astype(str).tolist()
+            metric_row_ff = []
+            last = ""
+            for cell in raw_metric_row:
+                c = "" if cell is None or str(cell).strip() == "nan" else str(cell)
+                if c.strip():
+                    last = c
+                metric_row_ff.append(last)
+        else:
+            metric_row_ff = [""] * len(banner_row)
+
+        # Body starts after the banner row
+        body = sub.iloc[banner_row_idx + 1:].reset_index(drop=True)
+
+        # First column = row labels; remaining columns = numeric data
+        row_labels_raw = body.iloc[:, 0].fillna("").astype(str).tolist()
+        # One coercion pass over the flattened cells instead of one per column.
+        data_cells = body.iloc[:, 1:].to_numpy(dtype=object)
+        data_part_raw = pd.to_numeric(data_cells.ravel(), errors="coerce").reshape(data_cells.shape)
+        n_data_cols = data_part_raw.shape[1]
+        row_non_null = pd.notna(data_part_raw).sum(axis=1)
+
+        # --- Footnote filtering ---
+        rows_to_keep: List[int] = []
+        footnotes_removed = 0
+        for i, label in enumerate(row_labels_raw):
+            if not label.strip():
+                continue
+            if _is_footnote_row(label, int(row_non_null[i]), n_data_cols, footnote_threshold):
+                footnotes_removed += 1
+                continue
+            rows_to_keep.append(i)
+
+        if footnotes_removed:
+            logger.debug(
+                "Sheet '%s' block %d: removed %d footnote row(s)",
+                s, bi, footnotes_removed,
+            )
+
+        if rows_to_keep:
+            row_labels = [intern(row_labels_raw[i]) for i in rows_to_keep]
+            data_part = data_part_raw[rows_to_keep]
+        else:
+            row_labels = [intern(lab) for lab in row_labels_raw]
+            data_part = data_part_raw
+
+        # --- Column labels ---
+        # Labels repeat across tables ("Total", age bands, regions...); interning
+        # makes every table share one string object per distinct label.
+        col_banners = [intern(str(b).strip()) for b in banner_row[1:n_data_cols + 1]]
+        col_groups = metric_row_ff[1:n_data_cols + 1]
+        col_groups = [intern(g.strip()) if isinstance(g, str) and g.strip() != "" else "" for g in col_groups]
+        col_labels = [
+            intern(f"{b} | {g}" if g else str(b))
+            for g, b in zip(col_groups, col_banners)
+        ]
+
+        # --- Title resolution ---
+        title = None
+        if title_consumed_first_row:
+            title = detected_title
+        else:
+            top_header_idx = metric_row_idx if metric_row_idx is not None else banner_row_idx
+            for r in range(int(top_header_idx)):
+                row_vals = sub.iloc[r].dropna().astype(str).tolist()
+                if row_vals:
+                    title = row_vals[0]
+                    break
+        if not title:
+            title = f"{s} table {bi}"
+
+        # Lookups the UI needs on every rerun, resolved once here.
+        base_row_idx = next(
+            (i for i, lab in enumerate(row_labels) if lab.strip().lower().startswith("base")),
+            None,
+        )
+        total_col_idx = col_labels.index("Total") if "Total" in col_labels else None
+
+        table_id = f"{s}#{bi}"
+        tdict = {
+            "id": table_id,
+            "sheet": s,
+            "title": title,
+            "row_labels": row_labels,
+            "col_labels": col_labels,
+            "values": _to_value_lists(data_part),
+            "meta": {
+                "block_start": int(st),
+                "block_end": int(en),
+                "col_banners": col_banners,
+                "col_groups": col_groups,
+                "base_row_idx": base_row_idx,
+                "total_col_idx": total_col_idx,
+            },
+        }
+        sheet_tables.append(tdict)
+    return sheet_tables
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
 
-def parse_workbook(path: str, parse_options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+def _source_name(src: Union[str, IO[bytes]]) -> str:
+    """Best-effort display name for a workbook path or file-like object."""
+    if isinstance(src, str):
+        return src
+    return getattr(src, "name", None) or "<in-memory workbook>"
+
+
+def parse_workbook(src: Union[str, IO[bytes]],
+                   parse_options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """Parse a Q-style crosstab workbook into a dict.
 
+    *src* may be a filesystem path or a binary file-like object (e.g. an
+    ``io.BytesIO`` wrapping an upload), so callers never need to round-trip
+    through a temp file.
+
     Returns::
 
         {
@@ -122,153 +355,33 @@ def parse_workbook(path: str, parse_options: Optional[Dict[str, Any]] = None) ->
               "row_labels": [...],
               "col_labels": [...],
               "values": [[...], ...],
-              "meta": {"block_start": 12, "block_end": 35, ...}
+              "meta": {"block_start": 12, "block_end": 35,
+                       "base_row_idx": 0, "total_col_idx": 3, ...}
             },
             ...
           ]
         }
 
+    ``values`` is deliberately row-major lists of Python scalars (``None`` for
+    missing cells) rather than an ndarray/Arrow table: the exporter, deck
+    updater, AI-insight cache key and ``to_json`` all consume it as such.
+    Blocks stay NumPy-backed during parsing and are converted exactly once.
+
     *parse_options* can override any key in ``DEFAULT_PARSE_OPTIONS``.
     """
     opts = _merge_options(parse_options)
-    footnote_threshold = opts["footnote_threshold"]
-
-    xls = pd.ExcelFile(path)
-    tables: List[Dict[str, Any]] = []
-
-    for s in xls.sheet_names:
-        raw = xls.parse(s, header=None)
-        blocks = _find_blocks(raw, opts)
-        logger.debug("Sheet '%s': found %d block(s)", s, len(blocks))
-
-        for bi, (st, en) in enumerate(blocks, start=1):
-            sub = raw.iloc[st:en + 1, :]
-            sub = _strip_edges(sub)
-            if sub.shape[0] < 2 or sub.shape[1] < 2:
-                continue
-
-            # --- Title detection fallback (first-row single-cell title) ---
-            # Before running header detection, check whether the first row of
-            # the block is a standalone title (single non-empty cell in col A).
-            title_consumed_first_row = False
-            first_row = sub.iloc[0]
-            non_empty_first = first_row.dropna()
-            if (len(non_empty_first) == 1
-                    and non_empty_first.index[0] == sub.columns[0]):
-                detected_title = str(non_empty_first.values[0]).strip()
-                if detected_title:
-                    title_consumed_first_row = True
-                    sub = sub.iloc[1:].reset_index(drop=True)
-                    if sub.shape[0] < 2:
-                        continue
-                    logger.debug(
-                        "Sheet '%s' block %d: consumed first-row title '%s'",
-                        s, bi, detected_title,
-                    )
-
-            # --- Header detection ---
-            lookahead = min(5, sub.shape[0])
-            nn_counts = [int(sub.iloc[r].notna().sum()) for r in range(lookahead)]
-            if nn_counts:
-                banner_row_idx = int(max(range(len(nn_counts)), key=lambda i: nn_counts[i]))
-            else:
-                banner_row_idx = 0
-
-            metric_row_idx: Optional[int] = None
-            if banner_row_idx > 0:
-                above_count = nn_counts[banner_row_idx - 1]
-                banner_count = nn_counts[banner_row_idx]
-                if above_count >= 2 and above_count <= max(2, int(banner_count * 0.8)):
-                    metric_row_idx = banner_row_idx - 1
-
-            # Build header labels
-            banner_row = sub.iloc[banner_row_idx].fillna("").astype(str).tolist()
-            if metric_row_idx is not None:
-                raw_metric_row = sub.iloc[metric_row_idx].astype(str).tolist()
-                metric_row_ff = []
-                last = ""
-                for cell in raw_metric_row:
-                    c = "" if cell is None or str(cell).strip() == "nan" else str(cell)
-                    if c.strip():
-                        last = c
-                    metric_row_ff.append(last)
-            else:
-                metric_row_ff = [""] * len(banner_row)
-
-            # Body starts after the banner row
-            body = sub.iloc[banner_row_idx + 1:].reset_index(drop=True)
-
-            # First column = row labels; remaining columns = numeric data
-            row_labels_raw = body.iloc[:, 0].fillna("").astype(str).tolist()
-            data_part_raw = body.iloc[:, 1:].apply(pd.to_numeric, errors="coerce")
-
-            # --- Footnote filtering ---
-            rows_to_keep: List[int] = []
-            footnotes_removed = 0
-            for i, label in enumerate(row_labels_raw):
-                if not label.strip():
-                    continue
-                if _is_footnote_row(label, data_part_raw.iloc[i], footnote_threshold):
-                    footnotes_removed += 1
-                    continue
-                rows_to_keep.append(i)
-
-            if footnotes_removed:
-                logger.debug(
-                    "Sheet '%s' block %d: removed %d footnote row(s)",
-                    s, bi, footnotes_removed,
-                )
-
-            if rows_to_keep:
-                row_labels = [row_labels_raw[i] for i in rows_to_keep]
-                data_part = data_part_raw.iloc[rows_to_keep].reset_index(drop=True)
-            else:
-                row_labels = row_labels_raw
-                data_part = data_part_raw
-
-            data_part = data_part.where(pd.notna(data_part), None)
-
-            # --- Column labels ---
-            col_banners = [str(b).strip() for b in banner_row[1:len(data_part.columns) + 1]]
-            col_groups = metric_row_ff[1:len(data_part.columns) + 1]
-            col_groups = [g.strip() if isinstance(g, str) and g.strip() != "" else "" for g in col_groups]
-            col_labels = [
-                (f"{b} | {g}" if g else str(b))
-                for g, b in zip(col_groups, col_banners)
-            ]
-
-            # --- Title resolution ---
-            title = None
-            if title_consumed_first_row:
-                title = detected_title
-            else:
-                top_header_idx = metric_row_idx if metric_row_idx is not None else banner_row_idx
-                for r in range(int(top_header_idx)):
-                    row_vals = sub.iloc[r].dropna().astype(str).tolist()
-                    if row_vals:
-                        title = row_vals[0]
-                        break
-            if not title:
-                title = f"{s} table {bi}"
-
-            table_id = f"{s}#{bi}"
-            tdict = {
-                "id": table_id,
-                "sheet": s,
-                "title": title,
-                "row_labels": row_labels,
-                "col_labels": col_labels,
-                "values": data_part.values.tolist(),
-                "meta": {
-                    "block_start": int(st),
-                    "block_end": int(en),
-                    "col_banners": col_banners,
-                    "col_groups": col_groups,
-                },
-            }
-            tables.append(tdict)
-
-    logger.info("Parsed %d table(s) from '%s'", len(tables), path)
+    sheets = _read_sheets(src)
+
+    # Workbook reading stays sequential (openpyxl streams from one zip handle);
+    # block extraction is pandas/NumPy work and is fanned out per sheet.
+    if len(sheets) > 1:
+        with ThreadPoolExecutor(max_workers=opts["max_workers"]) as ex:
+            per_sheet = list(ex.map(_parse_sheet, *zip(*sheets), repeat(opts)))
+    else:
+        per_sheet = [_parse_sheet(s, raw, opts) for s, raw in sheets]
+    tables: List[Dict[str, Any]] = [t for sheet_tables in per_sheet for t in sheet_tables]
+
+    logger.info("Parsed %d table(s) from '%s'", len(tables), _source_name(src))
     return {"tables": tables}
 
 
@@ -5,11 +5,16 @@ Matches shapes to tables via alt-text metadata, updates chart data (preserving
 formatting), refreshes table cells, question/base/title text, and callouts.
 """
 
+import io
 import logging
 import math
+import os
 import re
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Dict, Any, List, Optional, Tuple
 
+import numpy as np
 from pptx import Presentation
 
 from chart_data_patcher import detect_value_format, patch_chart_data, patch_chart_series
@@ -24,123 +29,196 @@ from text_utils import (
 
 logger = logging.getLogger("report_relay.deck_update")
 
+_P_NSMAP = {"p": "http://schemas.openxmlformats.org/presentationml/2006/main"}
+_P_CNVPR = "{%s}cNvPr" % _P_NSMAP["p"]
+# Shape elements whose cNvPr descr carries mapping alt text
+_ALT_TEXT_TAGS = frozenset("{%s}%s" % (_P_NSMAP["p"], t) for t in ("sp", "graphicFrame"))
+_A = "{http://schemas.openxmlformats.org/drawingml/2006/main}"
+
 EXCLUDE_PREFIXES = ("base", "mean", "average", "avg")
+# Pre-alt-text shape names for question/base boxes; counted, not rewritten
+_LEGACY_TEXT_NAMES = frozenset(("TEXT_QUESTION", "OBJ_QUESTION", "TEXT_BASE", "OBJ_BASE"))
+
+_WS_RE = re.compile(r"\s+")
+# First number (optionally comma-grouped, decimal, percent) in callout text
+_CALLOUT_NUM_RE = re.compile(r"[-+]?\d{1,3}(?:,\d{3})*(?:\.\d+)?%?")
 
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=4096)
 def _norm(s: str) -> str:
-    return re.sub(r"\s+", " ", (s or "")).strip().lower()
-
+    # Labels and alt-text keys repeat across every slide, so memoise.
+    return _WS_RE.sub(" ", s).strip().lower() if s else ""
 
-def _parse_alt_text(shape) -> Dict[str, str]:
-    """Parse alt text with enhanced flexibility for manual editing."""
-    out: Dict[str, str] = {}
 
+def _read_alt_descr(shape) -> str:
+    """Return the raw alt-text (cNvPr ``descr``) of *shape*, or ""."""
+    alt = ""
     try:
-        if hasattr(shape, "element"):
-            c_nv_pr = None
-            if "graphicFrame" in shape.element.tag:
-                c_nv_pr = shape.element.find(
-                    ".//p:cNvPr",
-                    namespaces={"p": "http://schemas.openxmlformats.org/presentationml/2006/main"},
-                )
-            elif "sp" in shape.element.tag:
-                c_nv_pr = shape.element.find(
-                    ".//p:cNvPr",
-                    namespaces={"p": "http://schemas.openxmlformats.org/presentationml/2006/main"},
-                )
-            alt = c_nv_pr.get("descr") if c_nv_pr is not None and c_nv_pr.get("descr") else ""
-        else:
-            alt = ""
+        el = getattr(shape, "element", None)
+        if el is not None and el.tag in _ALT_TEXT_TAGS:
+            c_nv_pr = next(el.iter(_P_CNVPR), None)
+            if c_nv_pr is not None:
+                alt = c_nv_pr.get("descr") or ""
     except (AttributeError, TypeError):
         alt = ""
 
     if not alt:
         try:
-            alt = shape.alternative_text or ""
-        except (AttributeError, ValueError):
+            # Not present on python-pptx 1.x shapes; getattr avoids the raise
+            alt = getattr(shape, "alternative_text", "") or ""
+        except ValueError:
             alt = ""
+    return alt
+
 
+def _parse_alt_descr(alt: str) -> Dict[str, str]:
+    """Parse raw alt text into a ``{normalised key: value}`` dict."""
+    out: Dict[str, str] = {}
+    if not alt or ":" not in alt:
+        return out
     for line in alt.splitlines():
         line = line.strip()
-        if ":" in line:
-            if " : " in line:
-                k, v = line.split(" : ", 1)
-            else:
-                k, v = line.split(":", 1)
+        # Prefer a spaced " : " separator so "Title : A:B" keeps "A:B"
+        k, sep, v = line.partition(" : ")
+        if not sep:
+            k, sep, v = line.partition(":")
+        if sep:
             out[_norm(k)] = v.strip()
     return out
 
 
-def _exclude_indices(labels: List[str], extra_excludes: Optional[List[str]] = None) -> set:
-    """Return indices to exclude based on default prefixes and optional explicit names."""
-    ex = set()
-    extra_norm = []
-    if extra_excludes:
-        for it in extra_excludes:
-            if it is None:
-                continue
-            s = _norm(str(it))
-            if s:
-                extra_norm.append(s)
-    for i, lab in enumerate(labels):
-        if not isinstance(lab, str):
-            continue
-        nlab = _norm(lab)
-        if nlab.startswith(EXCLUDE_PREFIXES):
-            ex.add(i)
-            continue
-        for pat in extra_norm:
-            if not pat:
+def _parse_alt_text(shape) -> Dict[str, str]:
+    """Parse alt text with enhanced flexibility for manual editing."""
+    return _parse_alt_descr(_read_alt_descr(shape))
+
+
+_SlideIndex = Dict[Tuple[Optional[str], Optional[str]], List[Tuple[int, Any, Dict[str, str]]]]
+
+
+def _index_slide_shapes(shapes, alt_cache: Optional[dict] = None) -> _SlideIndex:
+    """Group a slide's shapes by alt-text ``(type, table_title)``.
+
+    Each entry is ``(position, shape, alt)`` in slide order, so the text and
+    callout passes can fetch just their shapes for one table.  *alt_cache*
+    maps ``id(shape.element)`` to already-parsed alt text and is filled in
+    as shapes are parsed; the caller keeps the shapes alive while it is used.
+    """
+    by_key: _SlideIndex = {}
+    for pos, shp in enumerate(shapes):
+        key = id(shp.element)
+        alt = alt_cache.get(key) if alt_cache is not None else None
+        if alt is None:
+            raw = _read_alt_descr(shp)
+            # Only alt text with a "type" key is indexed; don't parse the rest
+            if "type" not in raw.lower():
                 continue
-            if nlab == pat or nlab.startswith(pat):
-                ex.add(i)
-                break
-    return ex
+            alt = _parse_alt_descr(raw)
+            if alt_cache is not None:
+                alt_cache[key] = alt
+        if "type" in alt:
+            by_key.setdefault((alt["type"], alt.get("table_title")), []).append((pos, shp, alt))
+    return by_key
+
+
+def _slide_entries(slide_index: _SlideIndex, types: Tuple[str, ...], title) -> list:
+    """Entries of *slide_index* for any of *types* and *title*, in slide order."""
+    if len(types) == 1:
+        return slide_index.get((types[0], title), [])
+    entries = [e for t in types for e in slide_index.get((t, title), ())]
+    entries.sort(key=lambda e: e[0])
+    return entries
+
+
+def _label_norms(labels: List[str]) -> List[Optional[str]]:
+    """``_norm`` of each string label; None for non-string labels."""
+    return [_norm(lab) if isinstance(lab, str) else None for lab in labels]
+
+
+def _exclude_indices(labels: List[str], extra_excludes: Optional[List[str]] = None,
+                     norm_labels: Optional[List[Optional[str]]] = None) -> set:
+    """Return indices to exclude based on default prefixes and optional explicit names.
+
+    *norm_labels* may carry ``_label_norms(labels)`` when already computed.
+    """
+    prefixes = EXCLUDE_PREFIXES
+    if extra_excludes:
+        # An exact match is also a prefix match, so one tuple covers both
+        extra = tuple(s for s in (_norm(str(it)) for it in extra_excludes if it is not None) if s)
+        prefixes = prefixes + extra
+    if norm_labels is None:
+        norm_labels = _label_norms(labels)
+    return {i for i, n in enumerate(norm_labels) if n is not None and n.startswith(prefixes)}
 
 
 def _row_index_map(labels: List[str]) -> Dict[str, int]:
     return {_norm(l): i for i, l in enumerate(labels)}
 
 
-def _choose_col_idx(col_labels: List[str], col_key: Optional[str]) -> Optional[int]:
+def _col_pos_map(col_labels: List[str]) -> Dict[str, int]:
+    """Map each column label to its first position (matches ``list.index``)."""
+    pos: Dict[str, int] = {}
+    for i, c in enumerate(col_labels):
+        pos.setdefault(c, i)
+    return pos
+
+
+def _choose_col_idx(col_labels: List[str], col_key: Optional[str],
+                    col_pos: Optional[Dict[str, int]] = None) -> Optional[int]:
     if not col_labels:
         return None
-    if col_key and col_key in col_labels:
-        return col_labels.index(col_key)
-    for cand in ["Total", "Overall", "All", "Base"]:
-        if cand in col_labels:
-            return col_labels.index(cand)
+    if col_pos is None:
+        col_pos = _col_pos_map(col_labels)
+    if col_key and col_key in col_pos:
+        return col_pos[col_key]
+    for cand in ("Total", "Overall", "All", "Base"):
+        if cand in col_pos:
+            return col_pos[cand]
     return 0
 
 
-def _series_from_table(table: Dict[str, Any], col_idx: Optional[int], exclude_rows: set):
-    cats, vals = [], []
+def _chart_value(val) -> Optional[float]:
+    """Coerce a cell to a chart point; None for missing or non-finite values.
+
+    Parsed cells are float, int or None, so those take a plain branch; the
+    try/except only guards the rare string or object cell.
+    """
+    if isinstance(val, (float, int)):
+        x = float(val)
+    elif val is None:
+        return None
+    else:
+        try:
+            x = float(val)
+        except (ValueError, TypeError):
+            return None
+    return x if math.isfinite(x) else None
+
+
+def _series_from_table(table: Dict[str, Any], col_idx: Optional[int], exclude_rows: set,
+                       keep_rows: Optional[List[int]] = None,
+                       grid: Optional[List[list]] = None):
+    """Return ``(categories, values)`` for one column, skipping *exclude_rows*.
+
+    *keep_rows*, when given, is the precomputed complement of *exclude_rows*;
+    *grid* is ``values`` already coerced by :func:`_value_grid`.
+    """
     row_labels = table["row_labels"]
-    values = table["values"]
-    for i, lab in enumerate(row_labels):
-        if i in exclude_rows:
-            continue
-        cats.append(lab)
-        if col_idx is None:
-            vals.append(None)
-        else:
-            row = values[i]
-            val = row[col_idx] if col_idx < len(row) else None
-            if val is not None:
-                try:
-                    float_val = float(val)
-                    if math.isnan(float_val) or math.isinf(float_val):
-                        val = None
-                    else:
-                        val = float_val
-                except (ValueError, TypeError):
-                    val = None
-            vals.append(val)
-    return cats, vals
+    if keep_rows is None:
+        keep_rows = [i for i in range(len(row_labels)) if i not in exclude_rows]
+    cats = [row_labels[i] for i in keep_rows]
+    if col_idx is None:
+        return cats, [None] * len(cats)
+    if grid is None:
+        values = table["values"]
+        return cats, [
+            _chart_value(values[i][col_idx]) if col_idx < len(values[i]) else None
+            for i in keep_rows
+        ]
+    return cats, [grid[i][col_idx] if col_idx < len(grid[i]) else None for i in keep_rows]
 
 
 def _find_base_row_idx(row_labels: List[str]) -> Optional[int]:
@@ -151,12 +229,148 @@ def _find_base_row_idx(row_labels: List[str]) -> Optional[int]:
     return None
 
 
-def _get_base_n(table: Dict[str, Any], col_key: Optional[str] = None) -> Optional[int]:
+def _fmt_cell(val) -> str:
+    """Table-cell text for one value: one decimal, blank when not a finite number."""
+    x = _chart_value(val)
+    # Same spelling as the vectorised path in _format_cells
+    return "" if x is None else "%.1f" % x
+
+
+def _float_grid(values: List[list]) -> Optional[np.ndarray]:
+    """``values`` as a 2-D float array, or None when ragged or non-numeric."""
+    try:
+        arr = np.array(values, dtype=float)
+    except (ValueError, TypeError):
+        return None
+    return arr if arr.ndim == 2 else None
+
+
+def _format_cells(values: List[list], arr: Optional[np.ndarray],
+                  rows: List[Optional[int]], cols: List[Optional[int]]) -> List[List[str]]:
+    """Cell text for every (row, col) of *rows* x *cols*, per :func:`_fmt_cell`.
+
+    *arr* is ``_float_grid(values)``; when present the selected cells are
+    gathered with fancy indexing and masked in NumPy, then formatted from
+    native floats.  None or out-of-range positions give "".
+    """
+    if arr is None:
+        def _at(j, ci):
+            if j is None or ci is None or j >= len(values) or ci >= len(values[j]):
+                return ""
+            return _fmt_cell(values[j][ci])
+        return [[_at(j, ci) for ci in cols] for j in rows]
+
+    n_r, n_c = arr.shape
+    r_ok = np.array([j is not None and j < n_r for j in rows], dtype=bool)
+    c_ok = np.array([ci is not None and ci < n_c for ci in cols], dtype=bool)
+    if not r_ok.any() or not c_ok.any():
+        return [[""] * len(cols) for _ in rows]
+    sub = arr[np.ix_(
+        np.array([j if ok else 0 for j, ok in zip(rows, r_ok)], dtype=np.intp),
+        np.array([ci if ok else 0 for ci, ok in zip(cols, c_ok)], dtype=np.intp),
+    )]
+    ok = np.isfinite(sub)
+    ok &= r_ok[:, None]
+    ok &= c_ok[None, :]
+    # %-formatting Python floats beats np.char.mod, which boxes each cell anyway
+    shown = np.where(ok, sub, np.nan).tolist()
+    return [["%.1f" % x if x == x else "" for x in row] for row in shown]
+
+
+def _value_grid(values: List[list], arr: Optional[np.ndarray]) -> List[list]:
+    """Coerce a whole ``values`` grid with :func:`_chart_value` semantics.
+
+    *arr* is ``_float_grid(values)``.
+    """
+    if arr is None:
+        return [[_chart_value(v) for v in row] for row in values]
+    out = arr.astype(object)
+    out[~np.isfinite(arr)] = None
+    return out.tolist()
+
+
+@dataclass
+class _TableIndex:
+    """Label lookups for one crosstab table, built once per update run.
+
+    Every chart, table and text shape bound to the same table reuses these
+    instead of rescanning ``row_labels``.  Kept beside the table rather than
+    on it, since the table dicts belong to the caller (e.g. app session state).
+    """
+    row_idx: Dict[str, int]         # normalised row label -> row index
+    col_pos: Dict[str, int]         # column label -> first column index
+    row_norm: List[Optional[str]]   # _label_norms(row_labels)
+    exclude: set                    # rows dropped by EXCLUDE_PREFIXES
+    keep: List[int]                 # row indices not in ``exclude``
+    base_row_idx: Optional[int]
+    _floats: Optional[np.ndarray] = field(default=None, repr=False)
+    _floats_ready: bool = field(default=False, repr=False)
+    _chart_values: Optional[List[list]] = field(default=None, repr=False)
+    _excludes: Dict[tuple, tuple] = field(default_factory=dict, repr=False)
+
+    def float_values(self, table: Dict[str, Any]) -> Optional[np.ndarray]:
+        """``values`` as a 2-D float array (None if ragged/non-numeric), cached."""
+        if not self._floats_ready:
+            self._floats = _float_grid(table.get("values", []))
+            self._floats_ready = True
+        return self._floats
+
+    def cell_text(self, table: Dict[str, Any], rows: List[Optional[int]],
+                  cols: List[Optional[int]]) -> List[List[str]]:
+        """Formatted text for the *rows* x *cols* cells a table shape shows."""
+        return _format_cells(table.get("values", []), self.float_values(table), rows, cols)
+
+    def chart_values(self, table: Dict[str, Any]) -> List[list]:
+        """``values`` coerced to chart points (float or None), built on first use."""
+        if self._chart_values is None:
+            self._chart_values = _value_grid(table.get("values", []), self.float_values(table))
+        return self._chart_values
+
+    def rows_excluding(self, terms: Optional[List[str]]) -> Tuple[set, List[int]]:
+        """``(exclude, keep)`` row indices with the alt-text *terms* also dropped.
+
+        Charts on one table tend to repeat the same ``exclude_rows`` list, so
+        each distinct list is resolved once.
+        """
+        if not terms:
+            return self.exclude, self.keep
+        key = tuple(terms)
+        hit = self._excludes.get(key)
+        if hit is None:
+            ex = _exclude_indices(self.row_norm, terms, self.row_norm)
+            hit = (ex, [i for i in range(len(self.row_norm)) if i not in ex])
+            self._excludes[key] = hit
+        return hit
+
+    @classmethod
+    def build(cls, table: Dict[str, Any]) -> "_TableIndex":
+        row_labels = table.get("row_labels", [])
+        # Normalise each label once; every row lookup below derives from it
+        row_norm = _label_norms(row_labels)
+        exclude = _exclude_indices(row_labels, norm_labels=row_norm)
+        return cls(
+            row_idx={(_norm(lab) if n is None else n): i
+                     for i, (lab, n) in enumerate(zip(row_labels, row_norm))},
+            col_pos=_col_pos_map(table.get("col_labels", [])),
+            row_norm=row_norm,
+            exclude=exclude,
+            keep=[i for i in range(len(row_labels)) if i not in exclude],
+            base_row_idx=next(
+                (i for i, n in enumerate(row_norm) if n is not None and n.startswith("base")),
+                None,
+            ),
+        )
+
+
+def _get_base_n(table: Dict[str, Any], col_key: Optional[str] = None,
+                index: Optional[_TableIndex] = None) -> Optional[int]:
     """Extract base N from the table for a given column."""
-    base_idx = _find_base_row_idx(table.get("row_labels", []))
+    if index is None:
+        index = _TableIndex.build(table)
+    base_idx = index.base_row_idx
     if base_idx is None:
         return None
-    ci = _choose_col_idx(table.get("col_labels", []), col_key or "Total")
+    ci = _choose_col_idx(table.get("col_labels", []), col_key or "Total", index.col_pos)
     if ci is None:
         return None
     values = table.get("values", [])
@@ -175,20 +389,27 @@ def _get_base_n(table: Dict[str, Any], col_key: Optional[str] = None) -> Optiona
 def _update_chart(shape, table: Dict[str, Any], col_key: Optional[str],
                   explicit_rows: Optional[List[str]],
                   exclude_terms: Optional[List[str]] = None,
-                  column_keys: Optional[List[str]] = None):
+                  column_keys: Optional[List[str]] = None,
+                  index: Optional[_TableIndex] = None,
+                  alt: Optional[Dict[str, str]] = None):
     """Update chart data in-place via XML patching (preserves all formatting)."""
     chart = shape.chart
-    alt = _parse_alt_text(shape)
-    ex = _exclude_indices(table["row_labels"], exclude_terms)
+    if alt is None:
+        alt = _parse_alt_text(shape)
+    if index is None:
+        index = _TableIndex.build(table)
+    col_labels = table["col_labels"]
+    ex, keep = index.rows_excluding(exclude_terms)
 
     # --- Extract data series ---
     multi_series: Optional[List[tuple]] = None
     if column_keys and len(column_keys) >= 2:
         cats = None
         multi_series = []
+        grid = index.chart_values(table)
         for ck in column_keys:
-            ci = _choose_col_idx(table["col_labels"], ck)
-            c, v = _series_from_table(table, ci, ex)
+            ci = _choose_col_idx(col_labels, ck, index.col_pos)
+            c, v = _series_from_table(table, ci, ex, keep, grid)
             if cats is None:
                 cats = c
             multi_series.append((ck, v))
@@ -196,22 +417,22 @@ def _update_chart(shape, table: Dict[str, Any], col_key: Optional[str],
             cats = []
         vals = multi_series[0][1] if multi_series else []
     else:
-        col_idx = _choose_col_idx(table["col_labels"], col_key)
+        col_idx = _choose_col_idx(col_labels, col_key, index.col_pos)
         if explicit_rows:
-            idx_map = _row_index_map(table["row_labels"])
-            cats, vals = [], []
-            for lab in explicit_rows:
-                j = idx_map.get(_norm(lab))
-                if j is None or j in ex:
-                    continue
-                cats.append(lab)
-                if col_idx is None:
-                    vals.append(None)
-                else:
-                    row = table["values"][j]
-                    vals.append(row[col_idx] if col_idx < len(row) else None)
+            # Resolve every requested row first, then gather in one pass
+            idx_map = index.row_idx
+            picked = [(lab, j) for lab, j in
+                      ((lab, idx_map.get(_norm(lab))) for lab in explicit_rows)
+                      if j is not None and j not in ex]
+            cats = [lab for lab, _ in picked]
+            if col_idx is None:
+                vals = [None] * len(picked)
+            else:
+                values = table["values"]
+                vals = [values[j][col_idx] if col_idx < len(values[j]) else None
+                        for _, j in picked]
         else:
-            cats, vals = _series_from_table(table, col_idx, ex)
+            cats, vals = _series_from_table(table, col_idx, ex, keep, index.chart_values(table))
 
     # --- Patch chart data at XML level (formatting stays intact) ---
     value_fmt = detect_value_format(vals, alt)
@@ -232,38 +453,65 @@ def _update_chart(shape, table: Dict[str, Any], col_key: Optional[str],
 # Table update
 # ---------------------------------------------------------------------------
 
-def _update_table(shape, table: Dict[str, Any]):
+def _tc_text(tc) -> str:
+    """Text of an ``a:tc`` element, as ``cell.text_frame.text`` would read it.
+
+    Walks the XML directly so label scans skip python-pptx proxy objects
+    (and don't add a ``txBody`` to cells that lack one).
+    """
+    body = tc.find(f"{_A}txBody")
+    if body is None:
+        return ""
+    paras = []
+    for p in body.iterchildren(f"{_A}p"):
+        parts = []
+        for el in p.iterchildren(f"{_A}r", f"{_A}br", f"{_A}fld"):
+            if el.tag == f"{_A}br":
+                parts.append("\v")
+            else:
+                t = el.find(f"{_A}t")
+                parts.append((t.text or "") if t is not None else "")
+        paras.append("".join(parts))
+    return "\n".join(paras)
+
+
+def _tc_lone_run_text(tc) -> Optional[str]:
+    """Text of the first paragraph's run when it is the only one, else None."""
+    body = tc.find(f"{_A}txBody")
+    p = body.find(f"{_A}p") if body is not None else None
+    if p is None:
+        return None
+    runs = p.findall(f"{_A}r")
+    if len(runs) != 1:
+        return None
+    t = runs[0].find(f"{_A}t")
+    return (t.text or "") if t is not None else None
+
+
+def _update_table(shape, table: Dict[str, Any], index: Optional[_TableIndex] = None):
     if not shape.has_table:
         return
     tbl = shape.table
-    hdrs = []
-    for c in range(1, len(tbl.columns)):
-        txt = tbl.cell(0, c).text_frame.text.strip()
-        hdrs.append(txt)
-    col_labels = table["col_labels"]
-    col_map = [col_labels.index(h) if h in col_labels else None for h in hdrs]
-    idx_map = _row_index_map(table["row_labels"])
-
-    for r in range(1, len(tbl.rows)):
-        rlab = tbl.cell(r, 0).text_frame.text.strip()
-        j = idx_map.get(_norm(rlab))
-        for c in range(1, len(tbl.columns)):
-            txt = ""
-            ci = col_map[c - 1]
-            if j is not None and ci is not None:
-                try:
-                    val = table["values"][j][ci]
-                    if val is not None:
-                        float_val = float(val)
-                        if math.isnan(float_val) or math.isinf(float_val):
-                            txt = ""
-                        else:
-                            txt = f"{float_val:.1f}"
-                    else:
-                        txt = ""
-                except (ValueError, TypeError, IndexError):
-                    txt = ""
-
+    tr_lst = tbl._tbl.tr_lst
+    n_rows, n_cols = len(tr_lst), len(tbl.columns)
+    hdr_tcs = tr_lst[0].tc_lst if tr_lst else []
+    hdrs = [_tc_text(hdr_tcs[c]).strip() for c in range(1, n_cols)]
+    if index is None:
+        index = _TableIndex.build(table)
+    col_map = [index.col_pos.get(h) for h in hdrs]
+    idx_map = index.row_idx
+    row_map = [idx_map.get(_norm(_tc_text(tr_lst[r].tc_lst[0]).strip())) for r in range(1, n_rows)]
+    texts = index.cell_text(table, row_map, col_map)
+
+    for r in range(1, n_rows):
+        row_texts = texts[r - 1]
+        row_tcs = tr_lst[r].tc_lst
+        for c in range(1, n_cols):
+            txt = row_texts[c - 1]
+            # A lone run already holding txt would be rewritten unchanged;
+            # check the XML so untouched cells never get pptx proxies.
+            if c < len(row_tcs) and _tc_lone_run_text(row_tcs[c]) == txt:
+                continue
             safe_update_text(tbl.cell(r, c), txt)
 
     logger.info("Updated table data (preserving formatting) for table: %s", table.get("title"))
@@ -273,19 +521,37 @@ def _update_table(shape, table: Dict[str, Any]):
 # Shape finders
 # ---------------------------------------------------------------------------
 
-def _find_shape(slide, name: str):
-    for shp in slide.shapes:
-        if shp.name == name:
-            return shp
-    return None
+_ShapeNameIndex = Tuple[Dict[str, Any], List[Tuple[str, Any]]]
+
 
+def _shape_name_index(slide) -> _ShapeNameIndex:
+    """One pass over *slide*'s shapes for repeated name lookups.
 
-def _find_shapes_by_pattern(slide, pattern: str):
-    matches = []
+    Returns ``(by_name, lowered)``: the first shape per exact name, and
+    ``(lower-cased name, shape)`` in slide order for substring searches.
+    Build it after the slide's shapes stop changing.
+    """
+    by_name: Dict[str, Any] = {}
+    lowered: List[Tuple[str, Any]] = []
     for shp in slide.shapes:
-        if shp.name and pattern.lower() in shp.name.lower():
-            matches.append(shp)
-    return matches
+        by_name.setdefault(shp.name, shp)
+        if shp.name:
+            lowered.append((shp.name.lower(), shp))
+    return by_name, lowered
+
+
+def _find_shape(slide, name: str, name_index: Optional[_ShapeNameIndex] = None):
+    if name_index is None:
+        name_index = _shape_name_index(slide)
+    return name_index[0].get(name)
+
+
+def _find_shapes_by_pattern(slide, pattern: str,
+                            name_index: Optional[_ShapeNameIndex] = None):
+    if name_index is None:
+        name_index = _shape_name_index(slide)
+    needle = pattern.lower()
+    return [shp for low, shp in name_index[1] if needle in low]
 
 
 # ---------------------------------------------------------------------------
@@ -294,12 +560,15 @@ def _find_shapes_by_pattern(slide, pattern: str):
 
 def _match_shape(
     matcher: SmartMatcher, shape, selections: Optional[Dict[str, Any]] = None,
+    alt: Optional[Dict[str, str]] = None,
 ) -> Optional[Tuple[Dict[str, Any], Optional[str], Optional[List[str]]]]:
     """Use SmartMatcher to resolve a shape to (table, col_key, exclude_terms).
 
     Applies a selections override for ``column_key`` when present.
+    *alt* may carry the shape's already-parsed alt text.
     """
-    alt = _parse_alt_text(shape)
+    if alt is None:
+        alt = _parse_alt_text(shape)
     name = shape.name or ""
     result = matcher.match({"name": name, "alt": alt})
     if result is None or result.table is None:
@@ -323,12 +592,15 @@ def _match_shape(
 
 def _update_question_and_base(slide, table: Dict[str, Any],
                               selections: Optional[dict] = None,
-                              table_title: Optional[str] = None):
+                              table_title: Optional[str] = None,
+                              index: Optional[_TableIndex] = None,
+                              slide_index: Optional[_SlideIndex] = None):
     """Update question, base, and title text shapes on a slide.
 
     When *selections* contains an entry for *table_title*, values from that
     selection dict drive the update (question_text, base_text, title).
     Otherwise the function falls back to crosstab-derived defaults.
+    *slide_index* may carry the slide's :func:`_index_slide_shapes` result.
     """
     title_key = table_title or table.get("title", "")
     table_selection = None
@@ -336,17 +608,28 @@ def _update_question_and_base(slide, table: Dict[str, Any],
         table_selection = selections[title_key]
     elif selections:
         logger.debug("No selection found for table: %s", title_key)
+    _update_question_and_base_for(slide, table, table_selection, title_key, index, slide_index)
+
+
+def _update_question_and_base_for(slide, table: Dict[str, Any],
+                                  table_selection: Optional[dict], title_key: str,
+                                  index: Optional[_TableIndex] = None,
+                                  slide_index: Optional[_SlideIndex] = None):
+    """:func:`_update_question_and_base` with the table's selection already resolved."""
+    if slide_index is None:
+        slide_index = _index_slide_shapes(slide.shapes)
+    entries = _slide_entries(
+        slide_index, ("question_text", "text_question", "text_base", "text_title"), title_key,
+    )
 
-    for shape in slide.shapes:
-        alt = _parse_alt_text(shape)
-
+    for _, shape, alt in entries:
         # --- Question text ---
         if alt.get("type") in ("question_text", "text_question") and alt.get("table_title") == title_key:
-            if not hasattr(shape, "text_frame"):
+            if not shape.has_text_frame:
                 continue
             if table_selection and "question_text" in table_selection:
                 new_text = f"Question: {table_selection['question_text']}"
-                safe_update_text(shape, new_text, preserve_font=True)
+                safe_update_text(shape, new_text)
                 logger.info("Updated question text for table: %s", title_key)
             else:
                 current_text = shape.text_frame.text
@@ -363,14 +646,14 @@ def _update_question_and_base(slide, table: Dict[str, Any],
 
         # --- Base text ---
         elif alt.get("type") == "text_base" and alt.get("table_title") == title_key:
-            if not hasattr(shape, "text_frame"):
+            if not shape.has_text_frame:
                 continue
             if table_selection and "base_text" in table_selection:
                 base_text_template = table_selection["base_text"]
                 col_key_sel = table_selection.get("column_key")
 
                 if col_key_sel:
-                    new_n = _get_base_n(table, col_key_sel)
+                    new_n = _get_base_n(table, col_key_sel, index)
                 else:
                     new_n = None
 
@@ -381,24 +664,26 @@ def _update_question_and_base(slide, table: Dict[str, Any],
                 else:
                     new_text = base_text_template
 
-                safe_update_text(shape, new_text, preserve_font=True)
+                safe_update_text(shape, new_text)
                 logger.info("Updated base text for table: %s", title_key)
             else:
                 current_base_text = shape.text_frame.text
                 parsed = parse_base_text(current_base_text)
-                base_n = _get_base_n(table, "Total")
+                base_n = _get_base_n(table, "Total", index)
 
                 desc = parsed["description"] or "Total respondents"
                 new_text = format_base_text(desc, base_n)
                 safe_update_text(shape, new_text)
-                logger.info("Updated base text for table: %s (N=%s)", table.get("title"), format_number_with_commas(base_n))
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("Updated base text for table: %s (N=%s)",
+                                table.get("title"), format_number_with_commas(base_n))
 
         # --- Chart title ---
         elif alt.get("type") == "text_title" and alt.get("table_title") == title_key:
-            if not hasattr(shape, "text_frame"):
+            if not shape.has_text_frame:
                 continue
             if table_selection and "title" in table_selection:
-                safe_update_text(shape, table_selection["title"], preserve_font=True)
+                safe_update_text(shape, table_selection["title"])
                 logger.info("Updated chart title for table: %s", title_key)
             else:
                 current_text = shape.text_frame.text
@@ -413,7 +698,9 @@ def _update_question_and_base(slide, table: Dict[str, Any],
 # ---------------------------------------------------------------------------
 
 def _update_new_text_callout_system(slide, table: Dict[str, Any], col_key: Optional[str],
-                                    selections: Optional[Dict[str, Any]] = None):
+                                    selections: Optional[Dict[str, Any]] = None,
+                                    slide_index: Optional[_SlideIndex] = None,
+                                    index: Optional[_TableIndex] = None):
     """Update TextCallout shapes based on alt text mapping.
 
     When *selections* contains an entry for this table's title, the
@@ -424,19 +711,21 @@ def _update_new_text_callout_system(slide, table: Dict[str, Any], col_key: Optio
     table_title = table.get("title", "")
     sel = selections.get(table_title, {}) if selections else {}
     sel_callouts = sel.get("callouts", [])
+    row_lower: Optional[List[Optional[str]]] = None
 
-    for shape in slide.shapes:
-        alt = _parse_alt_text(shape)
+    if slide_index is None:
+        slide_index = _index_slide_shapes(slide.shapes)
 
-        if alt.get("type") != "text_callout" or alt.get("table_title") != table_title:
-            continue
-        if not hasattr(shape, "text_frame"):
+    for _, shape, alt in _slide_entries(slide_index, ("text_callout",), table_title):
+        if not shape.has_text_frame:
             continue
 
         row_label = alt.get("row", alt.get("row_label", ""))
         column = alt.get("column", "Total")
         metric_type = alt.get("metric_type", "percentage")
-        current_shape_text = shape.text_frame.text if hasattr(shape, "text_frame") else ""
+        # Read once: the shape is not written until the end of this pass
+        shape_text = shape.text_frame.text
+        current_shape_text = shape_text
 
         # Apply selection-level overrides for this callout
         if col_key:
@@ -456,22 +745,28 @@ def _update_new_text_callout_system(slide, table: Dict[str, Any], col_key: Optio
         new_text = ""
 
         if row_label:
-            row_labels = table.get("row_labels", [])
-            for i, label in enumerate(row_labels):
-                if isinstance(label, str) and row_label.lower() in label.lower():
+            if index is None:
+                index = _TableIndex.build(table)
+            if row_lower is None:
+                # Lower-cased once per table, not once per callout
+                row_lower = [lab.lower() if isinstance(lab, str) else None
+                             for lab in table.get("row_labels", [])]
+            needle = row_label.lower()
+            for i, label in enumerate(row_lower):
+                if label is not None and needle in label:
                     row_idx = i
                     break
 
-            col_labels = table.get("col_labels", [])
-            if column in col_labels:
-                col_idx = col_labels.index(column)
+            col_pos = index.col_pos
+            if column in col_pos:
+                col_idx = col_pos[column]
             else:
-                for fallback in ["Total", "Overall", "All", "Base"]:
-                    if fallback in col_labels:
-                        col_idx = col_labels.index(fallback)
+                for fallback in ("Total", "Overall", "All", "Base"):
+                    if fallback in col_pos:
+                        col_idx = col_pos[fallback]
                         break
                 if col_idx is None:
-                    col_idx = 0 if col_labels else None
+                    col_idx = 0 if col_pos else None
 
             if row_idx is not None and col_idx is not None:
                 try:
@@ -494,9 +789,9 @@ def _update_new_text_callout_system(slide, table: Dict[str, Any], col_key: Optio
                             if current_shape_text and "[Value]" in current_shape_text:
                                 new_text = current_shape_text.replace("[Value]", formatted_value)
                             elif current_shape_text:
-                                pattern = re.compile(r"[-+]?\d{1,3}(?:,\d{3})*(?:\.\d+)?%?")
-                                if pattern.search(current_shape_text):
-                                    new_text = pattern.sub(formatted_value, current_shape_text, count=1)
+                                if _CALLOUT_NUM_RE.search(current_shape_text):
+                                    new_text = _CALLOUT_NUM_RE.sub(formatted_value, current_shape_text,
+                                                                   count=1)
                                 else:
                                     new_text = f"{row_label}: {formatted_value}"
                             else:
@@ -507,8 +802,7 @@ def _update_new_text_callout_system(slide, table: Dict[str, Any], col_key: Optio
         if not new_text:
             new_text = current_shape_text if current_shape_text else f"{row_label}: [Value]"
 
-        current_text = shape.text_frame.text
-        if current_text != new_text:
+        if shape_text != new_text:
             safe_update_text(shape, new_text)
             logger.info("Updated text callout '%s' for table: %s", row_label, table.get("title"))
 
@@ -517,58 +811,70 @@ def _update_new_text_callout_system(slide, table: Dict[str, Any], col_key: Optio
 # Core slide-processing loop (shared by both entry points)
 # ---------------------------------------------------------------------------
 
-def _process_slides(prs, data: Dict[str, Any], selections: Optional[dict] = None,
-                    matcher: Optional[SmartMatcher] = None,
-                    progress_callback=None) -> dict:
-    """Walk all slides/shapes, update charts/tables/text, return update counts.
+def _table_selection(selections: Optional[dict], table_title: Optional[str]) -> Optional[dict]:
+    """The selections entry for *table_title*, or None when there is none."""
+    if selections and table_title and table_title in selections:
+        return selections[table_title]
+    return None
 
-    *progress_callback*, when provided, is called with a float 0.0–1.0
-    after each slide is processed.
+
+def _update_linked_text(slide, table: Dict[str, Any], selections: Optional[dict],
+                        table_sel: Optional[dict], callout_col: Optional[str],
+                        index: _TableIndex, slide_index: _SlideIndex):
+    """Refresh the question/base/title and callout shapes bound to *table*.
+
+    *table_sel* is ``_table_selection(selections, title)``.
     """
-    if matcher is None:
-        matcher = SmartMatcher(data["tables"])
+    _update_question_and_base_for(slide, table, table_sel, table.get("title", ""),
+                                  index, slide_index)
+    _update_new_text_callout_system(slide, table, callout_col, selections, slide_index, index)
 
-    update_log = {
-        "charts_updated": 0,
-        "tables_updated": 0,
-        "text_updated": 0,
-        "shapes_skipped": 0,
-        "matched_titles": set(),
-        "match_report": [],
-    }
 
-    slides = list(prs.slides)
-    total_slides = len(slides) or 1
+def _process_slide(slide, matcher: SmartMatcher, selections: Optional[dict],
+                   update_log: dict, index_for) -> None:
+    """Update one slide's charts, tables and linked text, counting into *update_log*.
 
-    for slide_idx, slide in enumerate(slides):
-        for shp in slide.shapes:
-            name = shp.name or ""
-            alt = _parse_alt_text(shp)
+    *index_for* maps a table dict to its run-wide :class:`_TableIndex`.
+    """
+    # Materialise once; parsed alt text is shared with the slide index,
+    # which the question/callout passes build on first use
+    shapes = list(slide.shapes)
+    alt_cache: Dict[int, Dict[str, str]] = {}
+    slide_index: Optional[_SlideIndex] = None
+    for shp in shapes:
+        name = shp.name or ""
+        is_chart = getattr(shp, "has_chart", False)
+        is_table = shp.has_table
+        # Other shapes only need their alt text for an auto_update flag, so
+        # the raw descr is probed first; most slide chrome has none at all
+        raw_alt = _read_alt_descr(shp)
+        if is_chart or is_table or (raw_alt and "auto_update" in raw_alt.lower()):
+            alt = alt_cache[id(shp.element)] = _parse_alt_descr(raw_alt)
+        else:
+            alt = {}
 
-            if alt.get("auto_update", "yes").lower() == "no":
-                update_log["shapes_skipped"] += 1
-                continue
+        if alt.get("auto_update", "yes").lower() == "no":
+            update_log["shapes_skipped"] += 1
+            continue
 
-            # --- Charts ---
+        # --- Charts ---
+        if is_chart:
             try:
-                _chart_obj = shp.chart  # noqa: F841 — access triggers AttributeError for non-charts
-                mapping = _match_shape(matcher, shp, selections)
+                mapping = _match_shape(matcher, shp, selections, alt)
                 if mapping:
                     table, col_key, exclude_terms = mapping
-                    sel_col_keys = None
+                    index = index_for(table)
                     table_title = table.get("title")
-                    if selections and table_title and table_title in selections:
-                        sel_col_keys = selections[table_title].get("column_keys")
+                    table_sel = _table_selection(selections, table_title)
                     _update_chart(shp, table, col_key, explicit_rows=None,
-                                  exclude_terms=exclude_terms, column_keys=sel_col_keys)
-
-                    sel_for_qb = None
-                    table_title = table.get("title")
-                    if selections and table_title and table_title in selections:
-                        sel_for_qb = selections
+                                  exclude_terms=exclude_terms,
+                                  column_keys=table_sel.get("column_keys") if table_sel else None,
+                                  index=index, alt=alt)
 
-                    _update_question_and_base(slide, table, sel_for_qb, table_title)
-                    _update_new_text_callout_system(slide, table, col_key, selections)
+                    if slide_index is None:
+                        slide_index = _index_slide_shapes(shapes, alt_cache)
+                    _update_linked_text(slide, table, selections, table_sel,
+                                        col_key, index, slide_index)
 
                     update_log["charts_updated"] += 1
                     update_log["matched_titles"].add(table_title)
@@ -577,38 +883,80 @@ def _process_slides(prs, data: Dict[str, Any], selections: Optional[dict] = None
                     logger.debug("Chart '%s' has no table mapping - preserving as-is", name)
                     update_log["shapes_skipped"] += 1
             except (ValueError, AttributeError):
-                pass
+                logger.debug("Chart '%s' could not be updated", name, exc_info=True)
+
+        # --- Tables ---
+        if is_table:
+            mapping = _match_shape(matcher, shp, selections, alt)
+            if mapping:
+                table, col_key, exclude_terms = mapping
+                index = index_for(table)
+                _update_table(shp, table, index)
+
+                table_title = table.get("title")
+                table_sel = _table_selection(selections, table_title)
+                callout_col = col_key
+                if table_sel is not None:
+                    callout_col = table_sel.get("column_key") or col_key
+
+                if slide_index is None:
+                    slide_index = _index_slide_shapes(shapes, alt_cache)
+                _update_linked_text(slide, table, selections, table_sel,
+                                    callout_col, index, slide_index)
+
+                update_log["tables_updated"] += 1
+                update_log["matched_titles"].add(table_title)
+                logger.info("Updated table with mapping for table: %s", table_title)
+            else:
+                logger.debug("Table '%s' has no table mapping - preserving as-is", name)
+                update_log["shapes_skipped"] += 1
 
-            # --- Tables ---
-            if shp.has_table:
-                mapping = _match_shape(matcher, shp, selections)
-                if mapping:
-                    table, col_key, exclude_terms = mapping
-                    _update_table(shp, table)
+        # Legacy named text objects
+        if name in _LEGACY_TEXT_NAMES:
+            update_log["text_updated"] += 1
 
-                    sel_for_qb = None
-                    table_title = table.get("title")
-                    if selections and table_title and table_title in selections:
-                        sel_for_qb = selections
 
-                    _update_question_and_base(slide, table, sel_for_qb, table_title)
+def _process_slides(prs, data: Optional[Dict[str, Any]], selections: Optional[dict] = None,
+                    matcher: Optional[SmartMatcher] = None,
+                    progress_callback=None) -> dict:
+    """Walk all slides/shapes, update charts/tables/text, return update counts.
 
-                    callout_col = col_key
-                    if selections and table_title and table_title in selections:
-                        callout_col = selections[table_title].get("column_key") or col_key
-                    _update_new_text_callout_system(slide, table, callout_col, selections)
+    *data* is only consulted to build a matcher when *matcher* is None.
+    *progress_callback*, when provided, is called with a float 0.0–1.0
+    after each slide is processed.
 
-                    update_log["tables_updated"] += 1
-                    update_log["matched_titles"].add(table_title)
-                    logger.info("Updated table with mapping for table: %s", table_title)
-                else:
-                    logger.debug("Table '%s' has no table mapping - preserving as-is", name)
-                    update_log["shapes_skipped"] += 1
+    Slides are processed serially on purpose: the per-shape work is
+    GIL-bound Python/lxml tree mutation, SmartMatcher's match report is
+    order-sensitive (duplicate downgrades), and callers such as the
+    Streamlit app drive UI widgets from *progress_callback*, which must
+    stay on the calling thread.
+    """
+    if matcher is None:
+        matcher = SmartMatcher(data["tables"])
+
+    update_log = {
+        "charts_updated": 0,
+        "tables_updated": 0,
+        "text_updated": 0,
+        "shapes_skipped": 0,
+        "matched_titles": set(),
+        "match_report": [],
+    }
+
+    # Per-table lookups, shared by every shape bound to the same table
+    table_indexes: Dict[int, _TableIndex] = {}
+
+    def _index_for(table: Dict[str, Any]) -> _TableIndex:
+        idx = table_indexes.get(id(table))
+        if idx is None:
+            idx = table_indexes[id(table)] = _TableIndex.build(table)
+        return idx
 
-            # Legacy named text objects
-            if name in ("TEXT_QUESTION", "OBJ_QUESTION", "TEXT_BASE", "OBJ_BASE"):
-                update_log["text_updated"] += 1
+    slides = list(prs.slides)
+    total_slides = len(slides) or 1
 
+    for slide_idx, slide in enumerate(slides):
+        _process_slide(slide, matcher, selections, update_log, _index_for)
         if progress_callback:
             progress_callback((slide_idx + 1) / total_slides)
 
@@ -617,23 +965,66 @@ def _process_slides(prs, data: Dict[str, Any], selections: Optional[dict] = None
 
 
 def _log_update_summary(update_log: dict, unmapped_tables: Optional[list] = None):
-    """Emit a structured update summary to the logger."""
-    logger.info("=" * 50)
-    logger.info("UPDATE SUMMARY")
-    logger.info("=" * 50)
-    logger.info("Charts updated: %d", update_log["charts_updated"])
-    logger.info("Tables updated: %d", update_log["tables_updated"])
-    logger.info("Text objects updated: %d", update_log["text_updated"])
-    logger.info("Shapes preserved (no mapping): %d", update_log["shapes_skipped"])
+    """Emit a structured update summary to the logger, as one record."""
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    rule = "=" * 50
+    lines = [
+        rule,
+        "UPDATE SUMMARY",
+        rule,
+        "Charts updated: %d" % update_log["charts_updated"],
+        "Tables updated: %d" % update_log["tables_updated"],
+        "Text objects updated: %d" % update_log["text_updated"],
+        "Shapes preserved (no mapping): %d" % update_log["shapes_skipped"],
+    ]
 
     if unmapped_tables:
-        logger.info("Unmapped tables added to summary page: %d", len(unmapped_tables))
-        for t in unmapped_tables[:5]:
-            logger.info("  - %s", t["title"])
+        lines.append("Unmapped tables added to summary page: %d" % len(unmapped_tables))
+        lines.extend("  - %s" % t["title"] for t in unmapped_tables[:5])
         if len(unmapped_tables) > 5:
-            logger.info("  ... and %d more", len(unmapped_tables) - 5)
+            lines.append("  ... and %d more" % (len(unmapped_tables) - 5))
+
+    lines.append(rule)
+    logger.info("%s", "\n".join(lines))
+
+
+# ---------------------------------------------------------------------------
+# Workbook loading
+# ---------------------------------------------------------------------------
+
+@lru_cache(maxsize=16)
+def _parse_workbook_at(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse *path*; *mtime_ns*/*size* only key the cache so edits re-parse."""
+    return parse_workbook(path)
+
+
+def _load_workbook(src) -> Dict[str, Any]:
+    """Parse a crosstab, reusing earlier results for an unchanged file path.
+
+    The cached dict is shared between callers and must not be mutated.
+    File-like sources are always parsed afresh.
+    """
+    if isinstance(src, (str, os.PathLike)):
+        st = os.stat(src)
+        return _parse_workbook_at(os.fspath(src), st.st_mtime_ns, st.st_size)
+    return parse_workbook(src)
 
-    logger.info("=" * 50)
+
+def _save_presentation(prs, dst) -> None:
+    """Save *prs* to *dst*, writing a file path in one sequential write.
+
+    python-pptx emits each part as a separate small zip write; buffering the
+    package first keeps slow or network filesystems to a single write call.
+    File-like targets (e.g. the app's BytesIO) are saved into directly.
+    """
+    if isinstance(dst, (str, os.PathLike)):
+        buf = io.BytesIO()
+        prs.save(buf)
+        with open(dst, "wb") as f:
+            f.write(buf.getbuffer())
+    else:
+        prs.save(dst)
 
 
 # ---------------------------------------------------------------------------
@@ -649,6 +1040,9 @@ def update_presentation(pptx_in: str, crosstab_xlsx: str, pptx_out: str,
                         progress_callback=None) -> str:
     """Update an existing PowerPoint with new crosstab data.
 
+    *pptx_in*, *crosstab_xlsx* and *pptx_out* may be filesystem paths or
+    binary file-like objects.
+
     Args:
         selections: Optional mapping keyed by **table title** (not id)::
 
@@ -658,7 +1052,8 @@ def update_presentation(pptx_in: str, crosstab_xlsx: str, pptx_out: str,
                            "enable_sorting": bool, "excluded_rows": list}}
 
         matcher: Optional pre-configured ``SmartMatcher``.  When *None*,
-            one is created internally from the parsed workbook tables.
+            one is created internally from the parsed workbook tables;
+            otherwise *crosstab_xlsx* is not read at all.
 
         progress_callback: Optional callable(float) invoked with 0.0–1.0
             progress after each slide.
@@ -668,12 +1063,13 @@ def update_presentation(pptx_in: str, crosstab_xlsx: str, pptx_out: str,
         existing deck are listed on an appended summary slide.
     """
     prs = Presentation(pptx_in)
-    data = parse_workbook(crosstab_xlsx)
 
+    data = None
     if matcher is None:
+        data = _load_workbook(crosstab_xlsx)
         matcher = SmartMatcher(data["tables"])
 
-    if selections:
+    if selections and logger.isEnabledFor(logging.DEBUG):
         logger.debug("Selections provided: %s", list(selections.keys()))
 
     update_log = _process_slides(prs, data, selections, matcher=matcher,
@@ -690,7 +1086,7 @@ def update_presentation(pptx_in: str, crosstab_xlsx: str, pptx_out: str,
 
     _log_update_summary(update_log, unmapped_tables if include_unmapped_summary else None)
 
-    prs.save(pptx_out)
+    _save_presentation(prs, pptx_out)
     return pptx_out
 
 
@@ -9,96 +9,153 @@ It can be used to:
 4. Validate existing mappings
 """
 
+import ast
 import json
 import logging
-from typing import Dict, Any, List
+import posixpath
+import zipfile
+from typing import Dict, Any, List, Tuple
 
+from lxml import etree
 from pptx import Presentation
 from crosstab_parser import parse_workbook
 
 logger = logging.getLogger("report_relay.mapping_helper")
 
+_P = "{http://schemas.openxmlformats.org/presentationml/2006/main}"
+_A = "{http://schemas.openxmlformats.org/drawingml/2006/main}"
+_P_CNVPR = _P + "cNvPr"
+_R_ID = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id"
+_PKG_REL = "{http://schemas.openxmlformats.org/package/2006/relationships}Relationship"
+_OFFICE_DOC_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"
+_CHART_URI = "http://schemas.openxmlformats.org/drawingml/2006/chart"
+_TABLE_URI = "http://schemas.openxmlformats.org/drawingml/2006/table"
+# spTree children python-pptx exposes as slide.shapes
+_SHAPE_TAGS = tuple(_P + t for t in ("sp", "grpSp", "graphicFrame", "cxnSp", "pic", "contentPart"))
+_SP_TREE = _P + "spTree"
+# Shape-name conventions that signal an intended (but missing) mapping
+_MAPPING_NAME_PREFIXES = ("CHART_", "TABLE_", "TEXT_")
+
+def _part_rels(zf: zipfile.ZipFile, part_name: str) -> Dict[str, Tuple[str, str]]:
+    """Map rId -> (relationship type, member name) for *part_name*'s internal rels."""
+    base_dir, file_name = posixpath.split(part_name)
+    rels = etree.fromstring(zf.read(posixpath.join(base_dir, "_rels", file_name + ".rels")))
+    out = {}
+    for rel in rels.iter(_PKG_REL):
+        if rel.get("TargetMode") == "External":
+            continue
+        target = rel.get("Target") or ""
+        if target.startswith("/"):
+            member = target[1:]
+        else:
+            member = posixpath.normpath(posixpath.join(base_dir, target))
+        out[rel.get("Id")] = (rel.get("Type"), member)
+    return out
+
+def _slide_part_names(zf: zipfile.ZipFile) -> List[str]:
+    """Slide XML member names, in presentation (not file-name) order."""
+    pres_name = next(member for rel_type, member in _part_rels(zf, "").values()
+                     if rel_type == _OFFICE_DOC_REL)
+    slide_rels = _part_rels(zf, pres_name)
+    pres = etree.fromstring(zf.read(pres_name))
+    return [slide_rels[sld.get(_R_ID)][1] for sld in pres.iter(_P + "sldId")]
+
+def _xml_shape_fields(el) -> Dict[str, Any]:
+    """Name, chart/table flags and alt text of one spTree child.
+
+    Mirrors what python-pptx reports for the same shape: ``has_chart`` /
+    ``has_table`` come from the graphicData URI, and the descr is read for
+    sp-type and graphicFrame shapes.
+    """
+    c_nv_pr = next(el.iter(_P_CNVPR), None)
+    uri = None
+    if el.tag == _P + "graphicFrame":
+        graphic_data = el.find(f"{_A}graphic/{_A}graphicData")
+        if graphic_data is not None:
+            uri = graphic_data.get("uri")
+    alt_text = ""
+    if c_nv_pr is not None and ('graphicFrame' in el.tag or 'sp' in el.tag):
+        alt_text = c_nv_pr.get('descr') or ""
+    return {
+        "name": c_nv_pr.get("name", "") if c_nv_pr is not None else "",
+        "has_chart": uri == _CHART_URI,
+        "has_table": uri == _TABLE_URI,
+        "alt_text": alt_text,
+    }
+
+def _sp_has_text(el) -> bool:
+    """True when ``shape.text_frame.text.strip()`` would be non-empty.
+
+    Only ``p:sp`` shapes have a text frame; its text is blank unless some
+    run or field holds a non-whitespace character.
+    """
+    if el.tag != _P + "sp":
+        return False
+    body = el.find(_P + "txBody")
+    if body is None:
+        return False
+    return any((t.text or "").strip()
+               for path in (f"{_A}p/{_A}r/{_A}t", f"{_A}p/{_A}fld/{_A}t")
+               for t in body.iterfind(path))
+
+def _iter_slide_shapes(zf: zipfile.ZipFile, slide_name: str):
+    """Yield the top-level shape elements of one slide, streaming its XML.
+
+    Each element is cleared once the caller has read it, so memory stays at
+    roughly one shape rather than one slide.
+    """
+    with zf.open(slide_name) as f:
+        for _, el in etree.iterparse(f, events=("end",), tag=_SHAPE_TAGS):
+            parent = el.getparent()
+            if parent is None or parent.tag != _SP_TREE:
+                continue
+            yield el
+            el.clear()
+            while el.getprevious() is not None:
+                del parent[0]
+
 def list_all_shapes(pptx_path: str) -> List[Dict[str, Any]]:
-    """List all shapes in a PowerPoint file with their current mapping status."""
-    prs = Presentation(pptx_path)
+    """List all shapes in a PowerPoint file with their current mapping status.
+
+    Reads the slide XML straight from the package instead of loading a
+    ``Presentation``, so large decks (and their media) are never held in memory.
+    """
     shapes_info = []
     
-    for slide_num, slide in enumerate(prs.slides, 1):
-        for shape_num, shape in enumerate(slide.shapes, 1):
-            # Check if shape has chart (GraphicFrame with chart)
-            has_chart = False
-            try:
-                if hasattr(shape, "chart") and shape.chart is not None:
-                    has_chart = True
-            except (ValueError, AttributeError):
-                pass
-            
-            # Check if shape has table
-            has_table = False
-            try:
-                if hasattr(shape, "has_table") and shape.has_table:
-                    has_table = True
-            except (ValueError, AttributeError):
-                pass
-            
-            shape_info = {
-                "slide": slide_num,
-                "shape_num": shape_num,
-                "name": shape.name or f"Unnamed_{slide_num}_{shape_num}",
-                "type": "unknown",
-                "has_chart": has_chart,
-                "has_table": has_table,
-                "alt_text": "",
-                "mapping_status": "unmapped"
-            }
-            
-            # Determine shape type
-            if shape_info["has_chart"]:
-                shape_info["type"] = "chart"
-            elif shape_info["has_table"]:
-                shape_info["type"] = "table"
-            elif hasattr(shape, "text_frame") and shape.text_frame.text.strip():
-                shape_info["type"] = "text"
-            else:
-                shape_info["type"] = "other"
-            
-            # Get alt text
-            try:
-                # Method 1: Try to read from XML descr attribute (most reliable)
-                alt_text = ""
-                if hasattr(shape, 'element'):
-                    # Look for the cNvPr element which contains the description
-                    c_nv_pr = None
-                    
-                    # For GraphicFrame (charts/tables)
-                    if 'graphicFrame' in shape.element.tag:
-                        c_nv_pr = shape.element.find('.//p:cNvPr', namespaces={'p': 'http://schemas.openxmlformats.org/presentationml/2006/main'})
-                    # For Shape (text boxes, etc.)
-                    elif 'sp' in shape.element.tag:
-                        c_nv_pr = shape.element.find('.//p:cNvPr', namespaces={'p': 'http://schemas.openxmlformats.org/presentationml/2006/main'})
-                    
-                    if c_nv_pr is not None and c_nv_pr.get('descr'):
-                        alt_text = c_nv_pr.get('descr')
+    with zipfile.ZipFile(pptx_path) as zf:
+        for slide_num, slide_name in enumerate(_slide_part_names(zf), 1):
+            for shape_num, el in enumerate(_iter_slide_shapes(zf, slide_name), 1):
+                fields = _xml_shape_fields(el)
+                shape_info = {
+                    "slide": slide_num,
+                    "shape_num": shape_num,
+                    "name": fields["name"] or f"Unnamed_{slide_num}_{shape_num}",
+                    "type": "unknown",
+                    "has_chart": fields["has_chart"],
+                    "has_table": fields["has_table"],
+                    "alt_text": fields["alt_text"],
+                    "mapping_status": "unmapped"
+                }
                 
-                # Method 2: Fallback to alternative_text property (if it exists)
-                if not alt_text:
-                    try:
-                        alt_text = shape.alternative_text or ""
-                    except (AttributeError, ValueError):
-                        alt_text = ""
+                # Determine shape type
+                if shape_info["has_chart"]:
+                    shape_info["type"] = "chart"
+                elif shape_info["has_table"]:
+                    shape_info["type"] = "table"
+                elif _sp_has_text(el):
+                    shape_info["type"] = "text"
+                else:
+                    shape_info["type"] = "other"
                 
-                shape_info["alt_text"] = alt_text
-            except Exception:
-                shape_info["alt_text"] = ""
-            
-            # Determine mapping status
-            if shape_info["alt_text"]:
-                if "table_title:" in shape_info["alt_text"] or "type:" in shape_info["alt_text"]:
-                    shape_info["mapping_status"] = "mapped"
-                elif shape_info["name"].startswith(("CHART_", "TABLE_", "TEXT_")):
-                    shape_info["mapping_status"] = "named_but_unmapped"
+                # Determine mapping status
+                alt_text = shape_info["alt_text"]
+                if alt_text:
+                    if "table_title:" in alt_text or "type:" in alt_text:
+                        shape_info["mapping_status"] = "mapped"
+                    elif shape_info["name"].startswith(_MAPPING_NAME_PREFIXES):
+                        shape_info["mapping_status"] = "named_but_unmapped"
             
-            shapes_info.append(shape_info)
+                shapes_info.append(shape_info)
     
     return shapes_info
 
@@ -142,13 +199,35 @@ def generate_mapping_template(pptx_path: str, crosstab_path: str = None) -> str:
 
     return json.dumps(template_obj, indent=4)
 
+def _load_mapping_file(mapping_file_path: str) -> Dict[str, Any]:
+    """Read a mapping file as data.
+
+    JSON templates are loaded directly.  Older ``.py`` templates are parsed,
+    not executed: each top-level ``NAME = <literal>`` assignment is read with
+    ``ast.literal_eval``.
+    """
+    with open(mapping_file_path, 'r') as f:
+        source = f.read()
+    if not mapping_file_path.endswith(".py"):
+        return json.loads(source)
+    
+    data = {}
+    for node in ast.parse(source, filename=mapping_file_path).body:
+        if isinstance(node, ast.Assign):
+            for target in node.targets:
+                if isinstance(target, ast.Name):
+                    try:
+                        data[target.id] = ast.literal_eval(node.value)
+                    except ValueError:
+                        pass
+    return data
+
 def apply_mapping_from_file(pptx_path: str, mapping_file_path: str, output_path: str = None) -> str:
-    """Apply mappings from a JSON file to a PowerPoint presentation."""
+    """Apply mappings from a JSON (or legacy ``.py``) file to a PowerPoint presentation."""
     if output_path is None:
         output_path = pptx_path.replace(".pptx", "_mapped.pptx")
     
-    with open(mapping_file_path, 'r') as f:
-        data = json.load(f)
+    data = _load_mapping_file(mapping_file_path)
     
     mappings = data.get("mappings") or data.get("MAPPINGS")
     if not mappings:
@@ -179,6 +258,12 @@ def validate_mappings(pptx_path: str, crosstab_path: str) -> Dict[str, Any]:
     """Validate existing mappings against crosstab data."""
     shapes_info = list_all_shapes(pptx_path)
     data = parse_workbook(crosstab_path)
+    # Column labels of the first table per title; doubles as the title index
+    col_index: Dict[str, set] = {}
+    for table in data["tables"]:
+        title = table.get("title")
+        if title not in col_index:
+            col_index[title] = set(table.get("col_labels", []))
     
     validation_results = {
         "total_shapes": len(shapes_info),
@@ -196,33 +281,27 @@ def validate_mappings(pptx_path: str, crosstab_path: str) -> Dict[str, Any]:
             alt_text = shape["alt_text"]
             mapping = {}
             for line in alt_text.splitlines():
-                if ":" in line and not line.startswith("---"):
-                    key, value = line.split(":", 1)
+                key, sep, value = line.partition(":")
+                if sep and not line.startswith("---"):
                     mapping[key.strip()] = value.strip()
             
             # Validate mapping
             if "table_title" in mapping:
                 table_title = mapping["table_title"]
-                table_found = False
-                
-                for table in data["tables"]:
-                    if table.get("title") == table_title:
-                        table_found = True
-                        
-                        # Validate column if specified
-                        if "column" in mapping and shape["type"] == "chart":
-                            column = mapping["column"]
-                            if column not in table.get("col_labels", []):
-                                validation_results["issues"].append(
-                                    f"Shape '{shape['name']}': Column '{column}' not found in table '{table_title}'"
-                                )
-                                validation_results["invalid_mappings"] += 1
-                                break
-                        else:
-                            validation_results["valid_mappings"] += 1
-                        break
                 
-                if not table_found:
+                table_cols = col_index.get(table_title)
+                if table_cols is not None:
+                    # Validate column if specified
+                    if "column" in mapping and shape["type"] == "chart":
+                        column = mapping["column"]
+                        if column not in table_cols:
+                            validation_results["issues"].append(
+                                f"Shape '{shape['name']}': Column '{column}' not found in table '{table_title}'"
+                            )
+                            validation_results["invalid_mappings"] += 1
+                    else:
+                        validation_results["valid_mappings"] += 1
+                else:
                     validation_results["issues"].append(
                         f"Shape '{shape['name']}': Table '{table_title}' not found in crosstab"
                     )
@@ -4,12 +4,22 @@ Uses Template_ReportSlides.pptx layouts and populates placeholders.
 Branding sourced entirely from brand_config.py.
 """
 
+import gc
+import io
 import json
 import logging
+import math
 import os
+import posixpath
+import re
+import tempfile
 import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from copy import deepcopy
+from numbers import Integral, Real
+from functools import lru_cache
 from typing import Dict, Any, List, Optional
+from xml.sax.saxutils import escape as xml_escape
 from dataclasses import dataclass
 from lxml import etree
 
@@ -22,6 +32,8 @@ from pptx.enum.chart import XL_CHART_TYPE
 from pptx.chart.data import ChartData, CategoryChartData
 from pptx.dml.color import RGBColor
 from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.package import Part
+from pptx.opc.packuri import PackURI
 
 from brand_config import (
     BRAND,
@@ -38,6 +50,7 @@ from brand_config import (
     TEMPLATE_PATH, LAYOUT, PH, CHART_TEMPLATES_DIR,
 )
 from chart_data_patcher import detect_value_format
+from smart_match import label_hash
 
 
 # ---------------------------------------------------------------------------
@@ -99,6 +112,7 @@ _C_NS = "http://schemas.openxmlformats.org/drawingml/2006/chart"
 _A_NS = "http://schemas.openxmlformats.org/drawingml/2006/main"
 _C    = "{%s}" % _C_NS
 _A    = "{%s}" % _A_NS
+_P_CNVPR = "{http://schemas.openxmlformats.org/presentationml/2006/main}cNvPr"
 
 PLOT_TAG_MAP = {
     "bar_h":         f"{_C}barChart",
@@ -372,31 +386,27 @@ class TextCallout:
 # Alt-text / mapping helpers
 # ---------------------------------------------------------------------------
 
-def _set_alt_text(shape, mapping: dict):
-    try:
-        lines = [f"{k}: {v}" for k, v in mapping.items() if v is not None and v != ""]
-        alt_text_content = "\n".join(lines)
-        try:
-            if hasattr(shape, "alternative_text"):
-                shape.alternative_text = alt_text_content
-                return
-        except (AttributeError, ValueError):
-            pass
-        try:
-            if hasattr(shape, "element"):
-                ns = {"p": "http://schemas.openxmlformats.org/presentationml/2006/main"}
-                c_nv_pr = None
-                if "graphicFrame" in shape.element.tag:
-                    c_nv_pr = shape.element.find(".//p:cNvPr", namespaces=ns)
-                elif "sp" in shape.element.tag:
-                    c_nv_pr = shape.element.find(".//p:cNvPr", namespaces=ns)
-                if c_nv_pr is not None:
-                    c_nv_pr.set("descr", alt_text_content)
-                    return
-        except (AttributeError, TypeError):
-            pass
-    except (AttributeError, TypeError, KeyError):
-        pass
+# Leading alt-text lines per tag type; the per-shape fields follow them.
+_ALT_TYPE_LINES = {
+    "chart":            "type: chart\nexclude_rows: base, mean, average, avg",
+    "table":            "type: table\ncolumns: *\nexclude_rows: base, mean, average, avg",
+    "text_question":    "type: text_question",
+    "question_text":    "type: text_question",
+    "text_base":        "type: text_base",
+    "text_title":       "type: text_title",
+    "text_callout":     "type: text_callout",
+    "ai_insight":       "type: ai_insight",
+    "text_takeaway":    "type: text_takeaway",
+    "text_analysis":    "type: text_analysis",
+    "text_chart_title": "type: text_chart_title",
+}
+
+
+def _set_alt_text(shape, descr: str):
+    """Write *descr* into the shape's cNvPr descr attribute."""
+    c_nv_pr = next(shape.element.iter(_P_CNVPR), None)
+    if c_nv_pr is not None:
+        c_nv_pr.set("descr", descr)
 
 
 def _tag_shape(shape, obj_type: str, table_title: str, col_key=None,
@@ -405,37 +415,58 @@ def _tag_shape(shape, obj_type: str, table_title: str, col_key=None,
                row_labels=None, col_labels=None,
                sheet_name=None, block_index=None,
                value_format=None):
-    base = {"table_title": table_title, "column": col_key or "Total", "auto_update": "yes"}
-
+    lines = [_ALT_TYPE_LINES.get(obj_type) or f"type: {obj_type}"]
+    if obj_type == "text_callout":
+        if row_label:
+            lines.append(f"row: {row_label}")
+        lines.append(f"metric_type: {metric_type or 'percentage'}")
+    if table_title:
+        lines.append(f"table_title: {table_title}")
+    lines.append(f"column: {col_key or 'Total'}")
+    lines.append("auto_update: yes")
     if row_labels is not None:
-        from smart_match import label_hash
-        base["row_hash"] = label_hash(row_labels)
+        lines.append(f"row_hash: {label_hash(row_labels)}")
     if col_labels is not None:
-        from smart_match import label_hash
-        base["col_hash"] = label_hash(col_labels)
+        lines.append(f"col_hash: {label_hash(col_labels)}")
     if sheet_name:
-        base["sheet_name"] = sheet_name
+        lines.append(f"sheet_name: {sheet_name}")
     if block_index is not None:
-        base["block_index"] = str(block_index)
+        lines.append(f"block_index: {block_index}")
     if value_format:
-        base["value_format"] = value_format
-
-    type_map = {
-        "chart":           {"type": "chart", "exclude_rows": "base, mean, average, avg"},
-        "table":           {"type": "table", "columns": "*", "exclude_rows": "base, mean, average, avg"},
-        "text_question":   {"type": "text_question"},
-        "question_text":   {"type": "text_question"},
-        "text_base":       {"type": "text_base"},
-        "text_title":      {"type": "text_title"},
-        "text_callout":    {"type": "text_callout", "row": row_label or "",
-                            "metric_type": metric_type or "percentage"},
-        "ai_insight":      {"type": "ai_insight"},
-        "text_takeaway":   {"type": "text_takeaway"},
-        "text_analysis":   {"type": "text_analysis"},
-        "text_chart_title":{"type": "text_chart_title"},
-    }
-    extra = type_map.get(obj_type, {"type": obj_type})
-    _set_alt_text(shape, {**extra, **base})
+        lines.append(f"value_format: {value_format}")
+    _set_alt_text(shape, "\n".join(lines))
+
+
+# ---------------------------------------------------------------------------
+# Fixed slide geometry (EMU, computed once at import)
+# ---------------------------------------------------------------------------
+
+_CHART_BOUNDS = tuple(Inches(p) for p in (5.51, 1.64, 6.92, 4.43))
+_APPENDIX_TABLE_BOUNDS = tuple(Inches(p) for p in (5.60, 1.85, 6.82, 3.24))
+_GRIDLINE_WIDTH = Pt(0.5)
+
+
+def _cell_rpr(bold: bool = False):
+    """Build the shared run-properties element applied to data-table runs."""
+    rpr = etree.Element(f"{_A}rPr", nsmap={"a": _A_NS})
+    rpr.set("sz", str(FONT_SIZE["footnote"].centipoints))
+    if bold:
+        rpr.set("b", "1")
+    etree.SubElement(rpr, f"{_A}latin").set("typeface", FONT_BODY)
+    return rpr
+
+
+_CELL_RPR = _cell_rpr()
+_HEADER_CELL_RPR = _cell_rpr(bold=True)
+
+_EXEC_TITLE_BOUNDS = tuple(Inches(p) for p in (0.36, 0.2, 11.5, 0.75))
+_EXEC_CONTENT_BOUNDS = tuple(Inches(p) for p in (0.36, 1.15, 11.5, 5.6))
+_EXEC_RULE_BOUNDS = (Inches(0.36), Inches(1.0), Inches(11.5), Emu(36000))
+_EXEC_TITLE_SPACE = Pt(6)
+_EXEC_ANALYSIS_SPACE = Pt(1)
+_EXEC_MORE_SPACE = Pt(4)
+_EXEC_TITLE_SIZE = Pt(10)
+_EXEC_BODY_SIZE = Pt(9)
 
 
 # ---------------------------------------------------------------------------
@@ -465,6 +496,37 @@ def _remove_all_slides(prs: Presentation):
         prs.slides._sldIdLst.remove(sldId)
 
 
+class _PartnameAllocator:
+    """Drop-in for ``package.next_partname`` that scans the package once.
+
+    python-pptx walks every part in the package on each ``next_partname``
+    call (once per chart and per embedded workbook), which turns large
+    exports quadratic. This keeps the taken names per template and hands
+    out the lowest free number from a running counter instead.
+    """
+
+    def __init__(self, package):
+        self._package = package
+        self._taken: Dict[str, set] = {}
+        self._next: Dict[str, int] = {}
+
+    def __call__(self, tmpl: str) -> PackURI:
+        taken = self._taken.get(tmpl)
+        if taken is None:
+            prefix = tmpl[: (tmpl % 42).find("42")]
+            taken = self._taken[tmpl] = {
+                p.partname for p in self._package.iter_parts()
+                if p.partname.startswith(prefix)
+            }
+        n = self._next.get(tmpl, 1)
+        while tmpl % n in taken:
+            n += 1
+        partname = tmpl % n
+        taken.add(partname)
+        self._next[tmpl] = n + 1
+        return PackURI(partname)
+
+
 def _remove_placeholder(slide, ph_idx: int):
     """Remove a placeholder from the slide DOM to prevent template defaults from showing."""
     try:
@@ -501,93 +563,204 @@ def _detect_value_type(values, col_indices):
     return sample
 
 
+# ---------------------------------------------------------------------------
+# Embedded chart workbook
+# ---------------------------------------------------------------------------
+
+_XLSX_SHEET = "xl/worksheets/sheet1.xml"
+_XLSX_SHARED_STRINGS = "xl/sharedStrings.xml"
+_XLSX_WB_RELS = "xl/_rels/workbook.xml.rels"
+
+
+@lru_cache(maxsize=None)
+def _xlsx_skeleton() -> bytes:
+    """Every part of a python-pptx chart workbook except the worksheet.
+
+    Taken once from a real xlsxwriter-built blob so the static parts
+    (workbook, styles, theme, docProps) stay exactly what Office expects;
+    the shared-strings part is dropped because the sheet uses inline strings.
+    """
+    sample = CategoryChartData()
+    sample.categories = ["a"]
+    sample.add_series("s", (1,))
+    buf = io.BytesIO()
+    with zipfile.ZipFile(io.BytesIO(sample.xlsx_blob)) as src, \
+            zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as dst:
+        for name in src.namelist():
+            if name in (_XLSX_SHEET, _XLSX_SHARED_STRINGS):
+                continue
+            data = src.read(name)
+            if name in ("[Content_Types].xml", _XLSX_WB_RELS):
+                root = etree.fromstring(data)
+                for el in list(root):
+                    if (el.get("PartName") == "/" + _XLSX_SHARED_STRINGS
+                            or el.get("Target") == "sharedStrings.xml"):
+                        root.remove(el)
+                data = etree.tostring(root, xml_declaration=True,
+                                      encoding="UTF-8", standalone=True)
+            dst.writestr(name, data)
+    return buf.getvalue()
+
+
+def _xlsx_col(n: int) -> str:
+    """1-based column number to an Excel column letter ('A', 'AB', ...)."""
+    ref = ""
+    while n:
+        n, rem = divmod(n - 1, 26)
+        ref = chr(65 + rem) + ref
+    return ref
+
+
+def _xlsx_cell(ref: str, v) -> str:
+    """One Sheet1 <c> element; None and "" are left blank like xlsxwriter."""
+    if v is None or v == "":
+        return ""
+    if isinstance(v, Integral) and not isinstance(v, bool):
+        return f'<c r="{ref}"><v>{int(v)}</v></c>'
+    if isinstance(v, Real):
+        v = float(v)
+        return f'<c r="{ref}"><v>{v!r}</v></c>' if math.isfinite(v) else ""
+    return (f'<c r="{ref}" t="inlineStr"><is><t xml:space="preserve">'
+            f'{xml_escape(str(v))}</t></is></c>')
+
+
+class _ChartData(CategoryChartData):
+    """CategoryChartData whose workbook blob skips xlsxwriter.
+
+    Writes the same Sheet1 layout (categories in column A from row 2,
+    one column per series with its name in row 1) into the cached
+    workbook skeleton. Multi-level categories fall back to python-pptx.
+    """
+
+    @property
+    def xlsx_blob(self):
+        if self.categories.depth != 1:
+            return super().xlsx_blob
+        series_list = list(self)
+        cols = [_xlsx_col(2 + i) for i in range(len(series_list))]
+        columns = [[c.label for c in self.categories]] + [s.values for s in series_list]
+        parts = ['<row r="1">']
+        parts += [_xlsx_cell(f"{col}1", s.name) for col, s in zip(cols, series_list)]
+        parts.append("</row>")
+        for r in range(max(len(c) for c in columns)):
+            row_num = r + 2
+            parts.append(f'<row r="{row_num}">')
+            for col, values in zip(["A"] + cols, columns):
+                if r < len(values):
+                    parts.append(_xlsx_cell(f"{col}{row_num}", values[r]))
+            parts.append("</row>")
+
+        buf = io.BytesIO(_xlsx_skeleton())
+        with zipfile.ZipFile(buf, "a", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr(_XLSX_SHEET,
+                        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                        '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+                        f'<sheetData>{"".join(parts)}</sheetData></worksheet>')
+        return buf.getvalue()
+
+
 # ---------------------------------------------------------------------------
 # Chart formatting
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=None)
+def _series_colors(n_series: int, palette_name: str) -> tuple:
+    """get_chart_colors, resolved once per (series count, palette)."""
+    return tuple(get_chart_colors(n_series, palette_name))
+
+
 def _apply_chart_formatting(chart, palette_name: str, n_series: int,
                             value_sample: list, chart_kind: str = ""):
     """Apply brand-compliant formatting to a chart object."""
     num_fmt = get_data_label_format(value_sample)
     is_pie_type = chart_kind.lower() in ("donut", "doughnut", "pie")
 
+    label_size = FONT_SIZE["data_label"]
+
     chart.has_legend = n_series > 1 or is_pie_type
-    for s in chart.series:
-        s.data_labels.show_value = True
-        s.data_labels.number_format = num_fmt
+    # Each proxy access re-walks the chart XML, so bind them once.
+    series_list = list(chart.series)
+    for s in series_list:
+        dl = s.data_labels
+        dl.show_value = True
+        dl.number_format = num_fmt
         if not is_pie_type:
             try:
-                s.data_labels.position = 2
+                dl.position = 2
             except (AttributeError, ValueError):
                 pass
         try:
-            s.data_labels.font.name = FONT_BODY
-            s.data_labels.font.size = FONT_SIZE["data_label"]
-            s.data_labels.font.bold = True
+            font = dl.font
+            font.name = FONT_BODY
+            font.size = label_size
+            font.bold = True
         except (AttributeError, TypeError):
             pass
 
     if not is_pie_type:
         try:
-            chart.plots[0].gap_width = CHART_DEFAULTS["gap_width"]
+            plot = chart.plots[0]
+            plot.gap_width = CHART_DEFAULTS["gap_width"]
             if n_series > 1:
-                chart.plots[0].overlap = CHART_DEFAULTS["overlap"]
+                plot.overlap = CHART_DEFAULTS["overlap"]
         except (AttributeError, IndexError, TypeError):
             pass
 
         try:
-            gl = chart.value_axis.major_gridlines
-            gl.format.line.width = Pt(0.5)
-            gl.format.line.fore_color.rgb = GRIDLINE_COLOR
+            line = chart.value_axis.major_gridlines.format.line
+            line.width = _GRIDLINE_WIDTH
+            line.fore_color.rgb = GRIDLINE_COLOR
         except (AttributeError, TypeError):
             pass
 
         try:
-            chart.category_axis.has_title = False
-            chart.value_axis.has_title = False
-            chart.category_axis.tick_labels.font.size = FONT_SIZE["axis"]
-            chart.category_axis.tick_labels.font.name = FONT_BODY
-            chart.value_axis.tick_labels.font.size = FONT_SIZE["axis"]
-            chart.value_axis.tick_labels.font.name = FONT_BODY
+            axes = (chart.category_axis, chart.value_axis)
+            for axis in axes:
+                axis.has_title = False
+            axis_size = FONT_SIZE["axis"]
+            for axis in axes:
+                font = axis.tick_labels.font
+                font.size = axis_size
+                font.name = FONT_BODY
         except (AttributeError, TypeError):
             pass
 
-    colors = get_chart_colors(n_series, palette_name)
-    for i, series in enumerate(chart.series):
-        if i < len(colors):
-            fill = series.format.fill
-            fill.solid()
-            fill.fore_color.rgb = colors[i]
+    for series, rgb in zip(series_list, _series_colors(n_series, palette_name)):
+        fill = series.format.fill
+        fill.solid()
+        fill.fore_color.rgb = rgb
 
 
-def _add_data_table(slide, col_labels, row_labels, values, position=None):
-    """Add a formatted data table to the slide."""
+def _add_data_table(slide, col_labels, row_labels, values,
+                    bounds=_APPENDIX_TABLE_BOUNDS):
+    """Add a formatted data table to the slide; *bounds* is an EMU box."""
     rows = 1 + len(row_labels)
     cols = 1 + len(col_labels)
-    pos = position or (5.60, 1.85, 6.82, 3.24)
-    left, top, width, height = [Inches(p) for p in pos]
+    left, top, width, height = bounds
     table_shape = slide.shapes.add_table(rows, cols, left, top, width, height)
     table = table_shape.table
 
-    table.cell(0, 0).text = ""
-    for j, c in enumerate(col_labels, start=1):
-        cell = table.cell(0, j)
+    # table.cell(r, c) rebuilds the row and cell lists on every call, so
+    # walk each row's cells once instead.
+    table_rows = iter(table.rows)
+    header = iter(next(table_rows).cells)
+    next(header).text = ""
+    for cell, c in zip(header, col_labels):
         cell.text = str(c)
 
-    for i, rlab in enumerate(row_labels, start=1):
-        table.cell(i, 0).text = str(rlab)
-        for j, v in enumerate(values[i - 1][:len(col_labels)], start=1):
-            table.cell(i, j).text = "" if v is None else f"{v:.1f}"
-
-    for r in range(rows):
-        for c in range(cols):
-            tf = table.cell(r, c).text_frame
-            for para in tf.paragraphs:
-                for run in para.runs:
-                    run.font.name = FONT_BODY
-                    run.font.size = FONT_SIZE["footnote"]
-                    if r == 0:
-                        run.font.bold = True
+    for row, rlab, row_values in zip(table_rows, row_labels, values):
+        cells = iter(row.cells)
+        next(cells).text = str(rlab)
+        # zip stops at the table's last column, so long rows need no slice
+        for cell, v in zip(cells, row_values):
+            cell.text = "" if v is None else format(v, ".1f")
+
+    # Freshly set cell text has bare runs, so a prebuilt rPr can be
+    # dropped into each one without going through the font proxies.
+    for r, tr in enumerate(table._tbl.tr_lst):
+        rpr = _HEADER_CELL_RPR if r == 0 else _CELL_RPR
+        for run in tr.iter(f"{_A}r"):
+            run.insert(0, deepcopy(rpr))
 
     return table_shape
 
@@ -596,37 +769,56 @@ def _add_data_table(slide, col_labels, row_labels, values, position=None):
 # Row filtering / sorting
 # ---------------------------------------------------------------------------
 
-def _extract_base_text(table: Dict[str, Any], column_key: str = None) -> str:
-    """Extract base N from the table data for auto-populating the base text."""
-    row_labels = table.get("row_labels", [])
+def _extract_base_text(table: Dict[str, Any], column_key: str = None,
+                       base_rows: List[int] = None) -> str:
+    """Extract base N from the table data for auto-populating the base text.
+
+    *base_rows* (indices of "base" rows, as returned by _chart_rows) skips
+    the label scan when the caller already has them.
+    """
     col_labels = table.get("col_labels", [])
     values = table.get("values", [])
+    if base_rows is None:
+        base_rows = [i for i, label in enumerate(table.get("row_labels", []))
+                     if isinstance(label, str) and label.strip().lower().startswith("base")]
     col_idx = 0
     if column_key and column_key in col_labels:
         col_idx = col_labels.index(column_key)
     elif "Total" in col_labels:
         col_idx = col_labels.index("Total")
-    for i, label in enumerate(row_labels):
-        if isinstance(label, str) and label.strip().lower().startswith("base"):
-            if i < len(values) and col_idx < len(values[i]):
-                v = values[i][col_idx]
-                if v is not None:
-                    try:
-                        return f"n = {int(round(float(v))):,}"
-                    except (TypeError, ValueError):
-                        pass
+    for i in base_rows:
+        if i < len(values) and col_idx < len(values[i]):
+            v = values[i][col_idx]
+            if v is not None:
+                try:
+                    return f"n = {int(round(float(v))):,}"
+                except (TypeError, ValueError):
+                    pass
     return ""
 
 
-def _get_exclude_indices(row_labels):
-    """Return set of row indices that are metadata (base, mean, avg)."""
-    exclude = set()
+_META_ROW_PREFIXES = ("base", "mean", "average", "avg")
+
+
+def _chart_rows(row_labels, values):
+    """Split out the chartable rows, skipping metadata (base, mean, avg).
+
+    Returns ``(categories, data_rows, base_rows)`` built in a single pass;
+    *base_rows* holds the indices of the "base" rows for _extract_base_text.
+    """
+    categories, data_rows, base_rows = [], [], []
+    n_values = len(values)
     for i, rlab in enumerate(row_labels):
         if isinstance(rlab, str):
             lab = rlab.strip().lower()
-            if lab.startswith(("base", "mean", "average", "avg")):
-                exclude.add(i)
-    return exclude
+            if lab.startswith(_META_ROW_PREFIXES):
+                if lab.startswith("base"):
+                    base_rows.append(i)
+                continue
+        categories.append(rlab)
+        if i < n_values:
+            data_rows.append(values[i])
+    return categories, data_rows, base_rows
 
 
 def sort_table_rows(table: Dict[str, Any], column_key: str = "Total",
@@ -685,6 +877,8 @@ def add_chart_slide(prs, table: Dict[str, Any], chart_kind="bar_h",
         column_keys:  Multiple column keys for grouped/multi-series charts.
         insights:     {"takeaway", "analysis"} from AI.
         palette_name: Which brand palette to use.
+
+    Returns the slide's metadata dict (see _attach_report_meta).
     """
     spec = _resolve_chart_type(chart_kind)
     layout_key = spec["layout"]
@@ -720,9 +914,15 @@ def add_chart_slide(prs, table: Dict[str, Any], chart_kind="bar_h",
     ct = chart_title or table_title
     _fill_placeholder_text(slide, PH["chart_title"], ct, "text_chart_title", table_title)
 
+    # One pass over the rows serves both the base text and the chart data
+    row_labels = working_table["row_labels"]
+    col_labels = working_table["col_labels"]
+    values     = working_table["values"]
+    categories, data_rows, base_rows = _chart_rows(row_labels, values)
+
     # Question / Base (combined into one text box, separated by newline)
     auto_question = question_text or table_title
-    auto_base = base_text or _extract_base_text(working_table, column_key)
+    auto_base = base_text or _extract_base_text(working_table, column_key, base_rows)
     qbase_parts = []
     if auto_question:
         qbase_parts.append(f"Question: {auto_question}")
@@ -743,13 +943,6 @@ def add_chart_slide(prs, table: Dict[str, Any], chart_kind="bar_h",
             pass
 
     # --- Build chart data ---
-    row_labels = working_table["row_labels"]
-    col_labels = working_table["col_labels"]
-    values     = working_table["values"]
-    exclude_indices = _get_exclude_indices(row_labels)
-
-    categories = [lab for i, lab in enumerate(row_labels) if i not in exclude_indices]
-
     is_multi = spec["multi"] and column_keys and len(column_keys) > 1
     if is_multi:
         series_cols = column_keys
@@ -767,17 +960,13 @@ def add_chart_slide(prs, table: Dict[str, Any], chart_kind="bar_h",
     xl_type = spec["xl"]
 
     if xl_type is not None:
-        chart_data = CategoryChartData()
+        chart_data = _ChartData()
         chart_data.categories = categories
 
         value_sample = []
-        for ci_idx, (sc, ci) in enumerate(zip(series_cols, col_indices)):
-            sv = []
-            for i, row in enumerate(values):
-                if i in exclude_indices:
-                    continue
-                v = row[ci] if ci < len(row) else None
-                sv.append(v)
+        for sc, ci in zip(series_cols, col_indices):
+            sv = [row[ci] if ci < len(row) else None for row in data_rows]
+            for v in sv:
                 if v is not None:
                     try:
                         value_sample.append(float(v))
@@ -794,7 +983,7 @@ def add_chart_slide(prs, table: Dict[str, Any], chart_kind="bar_h",
             sp_elem = chart_ph._element
             sp_elem.getparent().remove(sp_elem)
         except KeyError:
-            cx, cy, cw, ch = Inches(5.51), Inches(1.64), Inches(6.92), Inches(4.43)
+            cx, cy, cw, ch = _CHART_BOUNDS
 
         chart_shape = slide.shapes.add_chart(xl_type, cx, cy, cw, ch, chart_data)
         chart = chart_shape.chart
@@ -811,14 +1000,13 @@ def add_chart_slide(prs, table: Dict[str, Any], chart_kind="bar_h",
 
     elif chart_kind.lower() in ("table_only", "table only"):
         tbl = _add_data_table(slide, col_labels, row_labels, values,
-                              position=(5.51, 1.64, 6.92, 4.43))
+                              bounds=_CHART_BOUNDS)
         _tag_shape(tbl, "table", table_title,
                    row_labels=row_labels, col_labels=col_labels,
                    sheet_name=_sheet_name, block_index=_block_index)
 
     if layout_key == "one_two_third_alt" and xl_type is not None:
-        tbl = _add_data_table(slide, col_labels, row_labels, values,
-                              position=(5.60, 1.85, 6.82, 3.24))
+        tbl = _add_data_table(slide, col_labels, row_labels, values)
         _tag_shape(tbl, "table", table_title,
                    row_labels=row_labels, col_labels=col_labels,
                    sheet_name=_sheet_name, block_index=_block_index)
@@ -839,8 +1027,8 @@ def add_chart_slide(prs, table: Dict[str, Any], chart_kind="bar_h",
             )
             _add_text_callout(slide, adj, working_table)
 
-    # Metadata box
-    meta = json.dumps({
+    return {
+        "slide_id": slide.slide_id,
         "table_key": table_title,
         "row_count": len(row_labels),
         "col_labels": col_labels,
@@ -848,14 +1036,7 @@ def add_chart_slide(prs, table: Dict[str, Any], chart_kind="bar_h",
         "callout_count": len(callouts) if callouts else 0,
         "enable_sorting": enable_sorting,
         "excluded_rows": excluded_rows or [],
-    })
-    meta_box = slide.shapes.add_textbox(Inches(0.0), Inches(7.4), Inches(0.1), Inches(0.2))
-    meta_box.name = "DATA_META"
-    tfm = meta_box.text_frame
-    tfm.clear()
-    r = tfm.paragraphs[0].add_run()
-    r.text = meta
-    r.font.size = Pt(1)
+    }
 
 
 def _add_text_callout(slide, callout: TextCallout, table_data=None):
@@ -892,7 +1073,7 @@ def add_executive_summary_slide(prs, insights: Dict[str, Dict[str, str]]):
     layout_idx = LAYOUT.get("section_header", 4)
     slide = prs.slides.add_slide(prs.slide_layouts[layout_idx])
 
-    title_box = slide.shapes.add_textbox(Inches(0.36), Inches(0.2), Inches(11.5), Inches(0.75))
+    title_box = slide.shapes.add_textbox(*_EXEC_TITLE_BOUNDS)
     tf = title_box.text_frame
     p = tf.paragraphs[0]
     run = p.add_run()
@@ -902,14 +1083,12 @@ def add_executive_summary_slide(prs, insights: Dict[str, Dict[str, str]]):
     run.font.name = EXEC_SUMMARY["title_font"]
     run.font.color.rgb = EXEC_SUMMARY["title_color"]
 
-    rule = slide.shapes.add_shape(
-        1, Inches(0.36), Inches(1.0), Inches(11.5), Emu(36000)
-    )
+    rule = slide.shapes.add_shape(1, *_EXEC_RULE_BOUNDS)
     rule.fill.solid()
     rule.fill.fore_color.rgb = FP_BLUE
     rule.line.fill.background()
 
-    content_box = slide.shapes.add_textbox(Inches(0.36), Inches(1.15), Inches(11.5), Inches(5.6))
+    content_box = slide.shapes.add_textbox(*_EXEC_CONTENT_BOUNDS)
     tf = content_box.text_frame
     tf.word_wrap = True
 
@@ -922,31 +1101,31 @@ def add_executive_summary_slide(prs, insights: Dict[str, Dict[str, str]]):
             analysis = tiers.get("analysis", "")
 
         p_title = tf.paragraphs[0] if idx == 0 else tf.add_paragraph()
-        p_title.space_before = Pt(6)
+        p_title.space_before = _EXEC_TITLE_SPACE
         run_title = p_title.add_run()
         run_title.text = f"▸  {title}"
         run_title.font.name = FONT_BODY
-        run_title.font.size = Pt(10)
+        run_title.font.size = _EXEC_TITLE_SIZE
         run_title.font.bold = True
         run_title.font.color.rgb = EXEC_SUMMARY["accent_color"]
 
         if analysis:
             p_analysis = tf.add_paragraph()
-            p_analysis.space_before = Pt(1)
+            p_analysis.space_before = _EXEC_ANALYSIS_SPACE
             run_analysis = p_analysis.add_run()
             run_analysis.text = f"    {analysis}"
             run_analysis.font.name = FONT_BODY
-            run_analysis.font.size = Pt(9)
+            run_analysis.font.size = _EXEC_BODY_SIZE
             run_analysis.font.bold = False
             run_analysis.font.color.rgb = TEXT_COLOR_PRIMARY
 
     if len(insights) > EXEC_SUMMARY["max_bullets"]:
         p_more = tf.add_paragraph()
-        p_more.space_before = Pt(4)
+        p_more.space_before = _EXEC_MORE_SPACE
         run_more = p_more.add_run()
         run_more.text = f"... and {len(insights) - EXEC_SUMMARY['max_bullets']} additional tables"
         run_more.font.name = FONT_BODY
-        run_more.font.size = Pt(9)
+        run_more.font.size = _EXEC_BODY_SIZE
         run_more.font.color.rgb = TEXT_COLOR_SECONDARY
 
 
@@ -963,24 +1142,100 @@ def export_pptx(tables: List[Dict[str, Any]], selections: Dict[str, Dict[str, An
     Args:
         tables:       List of table dicts from parse_workbook().
         selections:   Per-table configuration dict (keyed by table ID).
-        out_path:     Output .pptx file path.
+        out_path:     Output .pptx file path or binary file-like object.
         ai_insights:  Optional two-tier insights {title: {takeaway, analysis}}.
         report_palette: Color palette for the entire report (default "blue").
     """
+    prs, slide_meta = _build_presentation(tables, selections, ai_insights, report_palette)
+    _attach_report_meta(prs, slide_meta)
+    prs.save(out_path)
+    return out_path
+
+
+def export_pptx_streaming(tables: List[Dict[str, Any]],
+                          selections: Dict[str, Dict[str, Any]],
+                          out_path: str, ai_insights: Dict[str, Dict[str, str]] = None,
+                          report_palette: str = "blue", batch_size: int = 50,
+                          workers: int = 1):
+    """
+    Same output as export_pptx, built *batch_size* tables at a time.
+
+    Each batch is saved to a temporary deck and released before the next
+    one is built; the batches are then merged at the zip/OPC level so the
+    full slide set is never loaded as one object tree.  With *workers* > 1
+    the batches are rendered in that many worker processes.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+
+    with tempfile.TemporaryDirectory(prefix="pptx_batches_") as tmp_dir:
+        jobs = []
+        for start in range(0, max(len(tables), 1), batch_size):
+            chunk = tables[start:start + batch_size]
+            chunk_sel = {t["id"]: selections[t["id"]] for t in chunk if t["id"] in selections}
+            path = os.path.join(tmp_dir, f"batch_{len(jobs)}.pptx")
+            jobs.append((chunk, chunk_sel, ai_insights, report_palette, start == 0, path))
+
+        if workers > 1 and len(jobs) > 1:
+            with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+                results = list(pool.map(_render_batch, *zip(*jobs)))
+        else:
+            results = []
+            for job in jobs:
+                results.append(_render_batch(*job))
+                gc.collect()
+
+        logger.info("Merging %d batch deck(s) of up to %d tables",
+                    len(jobs), batch_size)
+        _merge_decks([job[-1] for job in jobs], out_path, batch_meta=results)
+    return out_path
+
+
+def _render_batch(tables, selections, ai_insights, report_palette,
+                  include_intro: bool, path: str):
+    """Build and save one batch deck; returns its slide metadata.
+
+    Module-level so ProcessPoolExecutor can pickle it.
+    """
+    prs, slide_meta = _build_presentation(tables, selections, ai_insights,
+                                          report_palette, include_intro=include_intro)
+    prs.save(path)
+    return slide_meta
+
+
+def _build_presentation(tables, selections, ai_insights=None,
+                        report_palette: str = "blue", include_intro: bool = True):
+    """Open the template and add the cover, summary and one slide per table.
+
+    Returns ``(prs, slide_meta)`` with one metadata dict per table slide.
+    """
     prs = _open_template()
+    package = prs.part.package
+    package.next_partname = _PartnameAllocator(package)
 
-    # Cover slide
-    cover = prs.slides.add_slide(prs.slide_layouts[LAYOUT["title_slide"]])
+    if include_intro:
+        # Cover slide
+        prs.slides.add_slide(prs.slide_layouts[LAYOUT["title_slide"]])
 
-    # Executive Summary (if AI insights provided)
-    if ai_insights:
-        add_executive_summary_slide(prs, ai_insights)
+        # Executive Summary (if AI insights provided)
+        if ai_insights:
+            add_executive_summary_slide(prs, ai_insights)
 
     # One slide per table
-    for table_idx, t in enumerate(tables):
+    specs = _slide_specs(tables, selections, ai_insights, report_palette)
+    return prs, add_chart_slides(prs, specs)
+
+
+def _slide_specs(tables, selections, ai_insights=None, palette_name: str = "blue"):
+    """Resolve every table's selection into add_chart_slide arguments.
+
+    Returns a list of ``(table, kwargs)`` pairs so the emit loop in
+    add_chart_slides does nothing but build slides.
+    """
+    specs = []
+    for t in tables:
         sel = selections.get(t["id"], {})
-        ctype = sel.get("chart_type", "bar_h")
-        title = sel.get("title") or t["title"]
+        table_title = t["title"]
 
         # Process callouts
         callouts = None
@@ -988,7 +1243,7 @@ def export_pptx(tables: List[Dict[str, Any]], selections: Dict[str, Dict[str, An
             callouts = []
             for cd in sel["callouts"]:
                 callouts.append(TextCallout(
-                    table_title   = t.get("title", ""),
+                    table_title   = table_title,
                     column_key    = cd.get("column_key", "Total"),
                     row_label     = cd.get("row_label", ""),
                     text          = cd.get("text"),
@@ -1002,19 +1257,15 @@ def export_pptx(tables: List[Dict[str, Any]], selections: Dict[str, Dict[str, An
                     auto_update   = cd.get("auto_update", True),
                 ))
 
-        palette_name = report_palette
-
         table_insights = {}
         if ai_insights:
-            table_insights = ai_insights.get(t["title"], {})
+            table_insights = ai_insights.get(table_title, {})
             if isinstance(table_insights, str):
                 table_insights = {"takeaway": "", "analysis": table_insights}
 
-        add_chart_slide(
-            prs,
-            t,
-            chart_kind     = ctype,
-            chart_title    = title,
+        specs.append((t, dict(
+            chart_kind     = sel.get("chart_type", "bar_h"),
+            chart_title    = sel.get("title") or table_title,
             base_text      = sel.get("base_text"),
             question_text  = sel.get("question_text"),
             callouts       = callouts,
@@ -1024,10 +1275,205 @@ def export_pptx(tables: List[Dict[str, Any]], selections: Dict[str, Dict[str, An
             column_keys    = sel.get("column_keys"),
             insights       = table_insights,
             palette_name   = palette_name,
-        )
+        )))
+    return specs
 
-    prs.save(out_path)
-    return out_path
+
+def add_chart_slides(prs, specs) -> List[Dict[str, Any]]:
+    """Add one chart slide per ``(table, kwargs)`` spec; returns their metadata."""
+    return [add_chart_slide(prs, table, **kwargs) for table, kwargs in specs]
+
+
+# ---------------------------------------------------------------------------
+# Report metadata part
+# ---------------------------------------------------------------------------
+
+REPORT_META_PARTNAME = "/ppt/customXml/report_meta.xml"
+_REPORT_META_TAG = "reportMeta"
+
+
+def _report_meta_xml(slide_meta: List[Dict[str, Any]]) -> bytes:
+    """Serialise the per-slide metadata as ``<reportMeta>`` holding a JSON array."""
+    root = etree.Element(_REPORT_META_TAG)
+    root.text = json.dumps(slide_meta)
+    return etree.tostring(root, xml_declaration=True, encoding="UTF-8", standalone=True)
+
+
+def _attach_report_meta(prs, slide_meta: List[Dict[str, Any]]):
+    """Store the metadata of every table slide in one custom XML part.
+
+    Replaces the per-slide hidden DATA_META textbox; entries are keyed by
+    ``slide_id`` (the slide's ``p:sldId/@id``), which stays valid when
+    slides are later added, removed or reordered.
+    """
+    part = Part(PackURI(REPORT_META_PARTNAME), "application/xml",
+                package=prs.part.package, blob=_report_meta_xml(slide_meta))
+    prs.part.relate_to(part, RT.CUSTOM_XML)
+
+
+# ---------------------------------------------------------------------------
+# Batch deck merging (zip/OPC level)
+# ---------------------------------------------------------------------------
+
+_PKG_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+_CT_NS = "http://schemas.openxmlformats.org/package/2006/content-types"
+_P_NS = "http://schemas.openxmlformats.org/presentationml/2006/main"
+_R_ID = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id"
+_SLIDE_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/slide"
+_PRES_PART = "ppt/presentation.xml"
+_PRES_RELS = "ppt/_rels/presentation.xml.rels"
+_CONTENT_TYPES = "[Content_Types].xml"
+# Template parts every batch shares; slides point at them but never own them.
+_SHARED_PART_DIRS = ("ppt/slideLayouts/", "ppt/slideMasters/", "ppt/theme/",
+                     "ppt/notesMasters/", "ppt/handoutMasters/")
+_NUMBERED_NAME_RE = re.compile(r"^(.*?)(\d*)(\.[^./]+)$")
+
+
+def _rels_name(part_name: str) -> str:
+    head, tail = posixpath.split(part_name)
+    return posixpath.join(head, "_rels", tail + ".rels")
+
+
+def _internal_rels(rels_root, part_name: str):
+    """Yield (rel element, absolute target) for the internal rels of a part."""
+    base = posixpath.dirname(part_name)
+    for rel in rels_root.iter(f"{{{_PKG_REL_NS}}}Relationship"):
+        if rel.get("TargetMode") == "External":
+            continue
+        yield rel, posixpath.normpath(posixpath.join(base, rel.get("Target")))
+
+
+class _PartNamer:
+    """Allocate unused zip member names as slideN/chartN-style counters."""
+
+    def __init__(self, taken):
+        self._taken = set(taken)
+        self._next: Dict[tuple, int] = {}
+
+    def fresh(self, name: str) -> str:
+        head, tail = posixpath.split(name)
+        m = _NUMBERED_NAME_RE.match(tail)
+        stem, ext = (m.group(1), m.group(3)) if m else (tail, "")
+        key = (head, stem, ext)
+        n = self._next.get(key, 1)
+        while True:
+            candidate = posixpath.join(head, f"{stem}{n}{ext}")
+            n += 1
+            if candidate not in self._taken:
+                break
+        self._next[key] = n
+        self._taken.add(candidate)
+        return candidate
+
+
+def _merge_decks(paths: List[str], out_path,
+                 batch_meta: List[List[Dict[str, Any]]] = None):
+    """Append the slides of ``paths[1:]`` to the deck at ``paths[0]``.
+
+    Slide-owned parts (slides, charts, embedded workbooks, ...) are copied
+    member by member under fresh names; template parts are shared.
+    *batch_meta*, when given, holds each deck's slide metadata; their
+    ``slide_id`` values are remapped to the merged ids and written as the
+    REPORT_META_PARTNAME part.
+    """
+    with zipfile.ZipFile(paths[0]) as first, \
+            zipfile.ZipFile(out_path, "w", zipfile.ZIP_DEFLATED) as out:
+        pres = etree.fromstring(first.read(_PRES_PART))
+        pres_rels = etree.fromstring(first.read(_PRES_RELS))
+        ctypes = etree.fromstring(first.read(_CONTENT_TYPES))
+        namer = _PartNamer(first.namelist())
+        for info in first.infolist():
+            if info.filename not in (_PRES_PART, _PRES_RELS, _CONTENT_TYPES):
+                out.writestr(info, first.read(info))
+
+        # The first batch always holds the cover slide, so sldIdLst exists
+        sld_id_lst = pres.find(f"{{{_P_NS}}}sldIdLst")
+        next_sld_id = max((int(e.get("id")) for e in sld_id_lst), default=255) + 1
+        next_rid = max((int(r.get("Id")[3:]) for r in pres_rels
+                        if r.get("Id", "").startswith("rId") and r.get("Id")[3:].isdigit()),
+                       default=0) + 1
+        overridden = {o.get("PartName") for o in ctypes.iter(f"{{{_CT_NS}}}Override")}
+        defaults = {d.get("Extension").lower() for d in ctypes.iter(f"{{{_CT_NS}}}Default")}
+
+        for batch_idx, path in enumerate(paths[1:], start=1):
+            with zipfile.ZipFile(path) as z:
+                members = set(z.namelist())
+                b_ctypes = etree.fromstring(z.read(_CONTENT_TYPES))
+                b_rels = etree.fromstring(z.read(_PRES_RELS))
+                b_pres = etree.fromstring(z.read(_PRES_PART))
+                targets = {rel.get("Id"): t for rel, t in _internal_rels(b_rels, _PRES_PART)}
+                sld_ids = list(b_pres.iterfind(f"{{{_P_NS}}}sldIdLst/{{{_P_NS}}}sldId"))
+                slides = [targets[e.get(_R_ID)] for e in sld_ids]
+
+                # Collect every part the batch's slides own, in visit order
+                renames: Dict[str, str] = {}
+                stack = list(reversed(slides))
+                while stack:
+                    name = stack.pop()
+                    if (name in renames or name not in members
+                            or name.startswith(_SHARED_PART_DIRS)):
+                        continue
+                    renames[name] = namer.fresh(name)
+                    rels = _rels_name(name)
+                    if rels in members:
+                        owned = [t for _, t in
+                                 _internal_rels(etree.fromstring(z.read(rels)), name)]
+                        stack.extend(reversed(owned))
+
+                for old, new in renames.items():
+                    out.writestr(new, z.read(old))
+                    rels = _rels_name(old)
+                    if rels in members:
+                        rels_root = etree.fromstring(z.read(rels))
+                        for rel, target in _internal_rels(rels_root, old):
+                            rel.set("Target", posixpath.relpath(
+                                renames.get(target, target), posixpath.dirname(new)))
+                        out.writestr(_rels_name(new), etree.tostring(
+                            rels_root, xml_declaration=True, encoding="UTF-8", standalone=True))
+
+                b_overrides = {o.get("PartName"): o.get("ContentType")
+                               for o in b_ctypes.iter(f"{{{_CT_NS}}}Override")}
+                for d in b_ctypes.iter(f"{{{_CT_NS}}}Default"):
+                    if d.get("Extension").lower() not in defaults:
+                        ctypes.insert(0, deepcopy(d))
+                        defaults.add(d.get("Extension").lower())
+                for old, new in renames.items():
+                    ct = b_overrides.get("/" + old)
+                    if ct and "/" + new not in overridden:
+                        etree.SubElement(ctypes, f"{{{_CT_NS}}}Override",
+                                         PartName="/" + new, ContentType=ct)
+                        overridden.add("/" + new)
+
+                id_map = {}
+                for sld_id, slide in zip(sld_ids, slides):
+                    rid = f"rId{next_rid}"
+                    next_rid += 1
+                    etree.SubElement(pres_rels, f"{{{_PKG_REL_NS}}}Relationship", Id=rid,
+                                     Type=_SLIDE_REL,
+                                     Target=posixpath.relpath(renames[slide], "ppt"))
+                    etree.SubElement(sld_id_lst, f"{{{_P_NS}}}sldId",
+                                     id=str(next_sld_id), **{_R_ID: rid})
+                    id_map[int(sld_id.get("id"))] = next_sld_id
+                    next_sld_id += 1
+                if batch_meta is not None:
+                    for meta in batch_meta[batch_idx]:
+                        meta["slide_id"] = id_map[meta["slide_id"]]
+
+        if batch_meta is not None:
+            meta_name = REPORT_META_PARTNAME.lstrip("/")
+            out.writestr(meta_name, _report_meta_xml(
+                [meta for metas in batch_meta for meta in metas]))
+            if "xml" not in defaults:
+                etree.SubElement(ctypes, f"{{{_CT_NS}}}Override",
+                                 PartName=REPORT_META_PARTNAME, ContentType="application/xml")
+            etree.SubElement(pres_rels, f"{{{_PKG_REL_NS}}}Relationship",
+                             Id=f"rId{next_rid}", Type=RT.CUSTOM_XML,
+                             Target=posixpath.relpath(meta_name, "ppt"))
+
+        for name, root in ((_PRES_PART, pres), (_PRES_RELS, pres_rels),
+                           (_CONTENT_TYPES, ctypes)):
+            out.writestr(name, etree.tostring(
+                root, xml_declaration=True, encoding="UTF-8", standalone=True))
 
 
 # ---------------------------------------------------------------------------
@@ -12,18 +12,29 @@ import logging
 import re
 from dataclasses import dataclass, field
 from difflib import SequenceMatcher
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 logger = logging.getLogger("report_relay.smart_match")
 
+# Shape-name tag: ("CHART" | "TABLE", "_" | ":", remainder)
+_NAME_TAG_RE = re.compile(r"(CHART|TABLE)([_:])(.*)", re.DOTALL)
+
 # ---------------------------------------------------------------------------
 # Normalisation helpers (shared with deck_update)
 # ---------------------------------------------------------------------------
 
+_WS_RE = re.compile(r"\s+")
+_PUNCT_RE = re.compile(r"[^\w\s]")
+
+
+@lru_cache(maxsize=4096)
 def _norm(s: str) -> str:
     """Normalize: collapse whitespace, strip punctuation, lowercase."""
-    t = re.sub(r"\s+", " ", (s or "")).strip().lower()
-    return re.sub(r"[^\w\s]", "", t).strip()
+    if not s:
+        return ""
+    t = _WS_RE.sub(" ", s).strip().lower()
+    return _PUNCT_RE.sub("", t).strip()
 
 
 def label_hash(labels: list) -> str:
@@ -61,6 +72,48 @@ class MatchResult:
     shape_type: str = "unknown"             # chart | table | unknown
 
 
+@dataclass
+class _TableProfile:
+    """Per-table matching features, computed once per SmartMatcher.
+
+    Label hashes and normalised label sets are only needed by Tier 2, so
+    they are filled in on first use.
+    """
+    table: Dict[str, Any]
+    norm_title: str
+    _row_hash: Optional[str] = field(default=None, repr=False)
+    _col_hash: Optional[str] = field(default=None, repr=False)
+    _row_set: Optional[set] = field(default=None, repr=False)
+    _col_set: Optional[set] = field(default=None, repr=False)
+    _col_labels: Optional[frozenset] = field(default=None, repr=False)
+
+    def row_hash(self) -> str:
+        if self._row_hash is None:
+            self._row_hash = label_hash(self.table.get("row_labels", []))
+        return self._row_hash
+
+    def col_hash(self) -> str:
+        if self._col_hash is None:
+            self._col_hash = label_hash(self.table.get("col_labels", []))
+        return self._col_hash
+
+    def row_set(self) -> set:
+        if self._row_set is None:
+            self._row_set = {_norm(r) for r in self.table.get("row_labels", [])}
+        return self._row_set
+
+    def col_set(self) -> set:
+        if self._col_set is None:
+            self._col_set = {_norm(c) for c in self.table.get("col_labels", [])}
+        return self._col_set
+
+    def has_col(self, label: str) -> bool:
+        """Exact (un-normalised) membership in ``col_labels``."""
+        if self._col_labels is None:
+            self._col_labels = frozenset(self.table.get("col_labels", []))
+        return label in self._col_labels
+
+
 # ---------------------------------------------------------------------------
 # Jaccard helper
 # ---------------------------------------------------------------------------
@@ -106,10 +159,17 @@ class SmartMatcher:
 
         # Pre-compute normalised title map for Tier 1
         self._norm_map: Dict[str, Dict[str, Any]] = {}
+        # All tables per normalised title, in workbook order (name fallbacks)
+        self._by_norm_title: Dict[str, List[_TableProfile]] = {}
+        # Titled tables in workbook order, for Tier 2/3 scoring
+        self._profiles: List[_TableProfile] = []
         for t in tables:
             key = _norm(t.get("title", ""))
+            prof = _TableProfile(t, key)
             if key:
                 self._norm_map[key] = t
+                self._profiles.append(prof)
+            self._by_norm_title.setdefault(key, []).append(prof)
 
         # User overrides: maps shape alt-title (or name) → forced table title
         self._overrides: Dict[str, str] = {}
@@ -327,35 +387,32 @@ class SmartMatcher:
         alt_row_hash = alt.get("row_hash")
         alt_col_hash = alt.get("col_hash")
 
+        alt_rows = None if alt_row_hash else {_norm(r) for r in alt.get("row_labels", [])}
+        alt_cols = None if alt_col_hash else {_norm(c) for c in alt.get("col_labels", [])}
+
         candidates: List[MatchCandidate] = []
 
-        for t in self._tables:
-            t_title = _norm(t.get("title", ""))
-            if not t_title:
-                continue
+        for prof in self._profiles:
+            t = prof.table
 
             # Title similarity (SequenceMatcher)
-            title_sim = SequenceMatcher(None, norm_alt, t_title).ratio()
+            title_sim = SequenceMatcher(None, norm_alt, prof.norm_title).ratio()
 
             # Row label Jaccard
             row_sim = 0.0
             if alt_row_hash:
-                t_row_hash = label_hash(t.get("row_labels", []))
-                row_sim = 1.0 if alt_row_hash == t_row_hash else 0.0
+                row_sim = 1.0 if alt_row_hash == prof.row_hash() else 0.0
             else:
-                alt_rows = {_norm(r) for r in alt.get("row_labels", [])}
-                t_rows   = {_norm(r) for r in t.get("row_labels", [])}
+                t_rows = prof.row_set()
                 if alt_rows or t_rows:
                     row_sim = _jaccard(alt_rows, t_rows)
 
             # Column label Jaccard
             col_sim = 0.0
             if alt_col_hash:
-                t_col_hash = label_hash(t.get("col_labels", []))
-                col_sim = 1.0 if alt_col_hash == t_col_hash else 0.0
+                col_sim = 1.0 if alt_col_hash == prof.col_hash() else 0.0
             else:
-                alt_cols = {_norm(c) for c in alt.get("col_labels", [])}
-                t_cols   = {_norm(c) for c in t.get("col_labels", [])}
+                t_cols = prof.col_set()
                 if alt_cols or t_cols:
                     col_sim = _jaccard(alt_cols, t_cols)
 
@@ -431,12 +488,9 @@ class SmartMatcher:
         # Build candidate list for the prompt (top 3 from fuzzy)
         norm_alt = _norm(alt_title)
         scored: List[MatchCandidate] = []
-        for t in self._tables:
-            t_title = _norm(t.get("title", ""))
-            if not t_title:
-                continue
-            title_sim = SequenceMatcher(None, norm_alt, t_title).ratio()
-            scored.append(MatchCandidate(table=t, score=title_sim, title_score=title_sim))
+        for prof in self._profiles:
+            title_sim = SequenceMatcher(None, norm_alt, prof.norm_title).ratio()
+            scored.append(MatchCandidate(table=prof.table, score=title_sim, title_score=title_sim))
 
         scored.sort(key=lambda c: c.score, reverse=True)
         top3 = scored[:3]
@@ -522,15 +576,17 @@ class SmartMatcher:
 
         Returns ``(table_or_None, col_key)``.
         """
-        if name.startswith("CHART_"):
-            return self._parse_chart_underscore(name, col_key)
-        if name.startswith("TABLE_"):
-            return self._parse_table_underscore(name)
-        if name.startswith("CHART:"):
+        m = _NAME_TAG_RE.match(name)
+        if m is None:
+            return None, col_key
+        kind, sep = m.group(1), m.group(2)
+        if kind == "CHART":
+            if sep == "_":
+                return self._parse_chart_underscore(name, col_key)
             return self._parse_chart_colon(name, col_key)
-        if name.startswith("TABLE:"):
-            return self._parse_table_colon(name)
-        return None, col_key
+        if sep == "_":
+            return self._parse_table_underscore(name)
+        return self._parse_table_colon(name)
 
     def _parse_chart_underscore(self, name: str, col_key: Optional[str]) -> tuple:
         name_parts = name[6:].split("_")
@@ -538,40 +594,27 @@ class SmartMatcher:
             potential_col = name_parts[-1]
             table_title = "_".join(name_parts[:-1])
             norm_title = _norm(table_title)
-            for t in self._tables:
-                if _norm(t.get("title", "")) == norm_title:
-                    if potential_col in t.get("col_labels", []):
-                        return t, potential_col
-                    full_title = "_".join(name_parts)
-                    if _norm(t.get("title", "")) == _norm(full_title):
-                        return t, col_key
+            for prof in self._by_norm_title.get(norm_title, ()):
+                if prof.has_col(potential_col):
+                    return prof.table, potential_col
+                full_title = "_".join(name_parts)
+                if norm_title == _norm(full_title):
+                    return prof.table, col_key
         return None, col_key
 
     def _parse_table_underscore(self, name: str) -> tuple:
         table_title = name[6:].replace("_", " ")
-        norm_title = _norm(table_title)
-        for t in self._tables:
-            if _norm(t.get("title", "")) == norm_title:
-                return t, None
-        return None, None
+        titled = self._by_norm_title.get(_norm(table_title))
+        return (titled[0].table if titled else None), None
 
     def _parse_chart_colon(self, name: str, col_key: Optional[str]) -> tuple:
-        parts = name.split(":", 2)
-        if len(parts) >= 2:
-            table_title = parts[1].strip()
-            ck = parts[2].strip() if len(parts) == 3 else col_key
-            norm_title = _norm(table_title)
-            for t in self._tables:
-                if _norm(t.get("title", "")) == norm_title:
-                    return t, ck
+        # "CHART:<title>[:<col>]" — the column, when present, may be empty
+        table_title, has_col, col = name[6:].partition(":")
+        titled = self._by_norm_title.get(_norm(table_title.strip()))
+        if titled:
+            return titled[0].table, (col.strip() if has_col else col_key)
         return None, col_key
 
     def _parse_table_colon(self, name: str) -> tuple:
-        parts = name.split(":", 1)
-        if len(parts) == 2:
-            table_title = parts[1].strip()
-            norm_title = _norm(table_title)
-            for t in self._tables:
-                if _norm(t.get("title", "")) == norm_title:
-                    return t, None
-        return None, None
+        titled = self._by_norm_title.get(_norm(name[6:].strip()))
+        return (titled[0].table if titled else None), None
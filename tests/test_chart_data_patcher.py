@@ -181,6 +181,34 @@ class TestPatchChartData:
         assert "300" in vals
         assert len(vals) == 2  # None is skipped
 
+    def test_identical_patch_keeps_existing_caches(self):
+        shape, _ = _make_chart_shape(["A", "B"], (10, 20))
+        chart = shape.chart
+        ns = {"c": _C_NS}
+        patch_chart_data(chart, ["X", "Y"], [0.5, None], value_format="percentage")
+        tree = chart.part._element
+        str_cache = tree.find(".//c:cat//c:strCache", ns)
+        num_cache = tree.find(".//c:val//c:numCache", ns)
+
+        patch_chart_data(chart, ["X", "Y"], [0.5, None], value_format="percentage")
+
+        assert tree.find(".//c:cat//c:strCache", ns) is str_cache
+        assert tree.find(".//c:val//c:numCache", ns) is num_cache
+
+    def test_changed_patch_rebuilds_caches(self):
+        shape, _ = _make_chart_shape(["A", "B"], (10, 20))
+        chart = shape.chart
+        ns = {"c": _C_NS}
+        patch_chart_data(chart, ["X", "Y"], [0.5, 0.6], value_format="percentage")
+        num_cache = chart.part._element.find(".//c:val//c:numCache", ns)
+
+        patch_chart_data(chart, ["X", "Y"], [0.5, 0.6], value_format="number")
+
+        assert chart.part._element.find(".//c:val//c:numCache", ns) is not num_cache
+        cats, vals = _read_chart_values(chart)
+        assert cats == ["X", "Y"]
+        assert vals == ["0.5", "0.6"]
+
 
 # ---------------------------------------------------------------------------
 # patch_chart_series (multi-series)
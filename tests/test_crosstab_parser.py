@@ -1,11 +1,13 @@
 """Tests for crosstab_parser.py — Excel workbook parsing into table dicts."""
 
+import io
 import json
 
+import pandas as pd
 import pytest
 from openpyxl import Workbook
 
-from crosstab_parser import parse_workbook, to_json
+from crosstab_parser import _NA_STRINGS, _is_legacy_xls, _read_sheets, parse_workbook, to_json
 
 
 def _save_wb(wb, tmp_path, name="test.xlsx"):
@@ -84,6 +86,71 @@ class TestStandardTwoRowHeader:
             for val in row:
                 assert val is None or isinstance(val, (int, float))
 
+    def test_base_and_total_indices_in_meta(self, tmp_path):
+        wb = _make_standard_wb()
+        ws = wb["Data"]
+        ws.cell(row=7, column=1, value="Base: All respondents")
+        for c in range(2, 9):
+            ws.cell(row=7, column=c, value=500)
+        path = _save_wb(wb, tmp_path)
+        t = parse_workbook(path)["tables"][0]
+        assert t["meta"]["base_row_idx"] == t["row_labels"].index("Base: All respondents")
+        # Banner "Total" sits under a metric group, so there is no plain "Total" label
+        assert t["meta"]["total_col_idx"] is None
+
+    def test_missing_cells_are_none(self, tmp_path):
+        wb = _make_standard_wb()
+        path = _save_wb(wb, tmp_path)
+        t = parse_workbook(path)["tables"][0]
+        # "Other" and "55+" are empty for every body row
+        other = t["col_labels"].index("Other | Gender")
+        assert [row[other] for row in t["values"]] == [None, None, None]
+
+    def test_file_like_source_matches_path(self, tmp_path):
+        wb = _make_standard_wb()
+        path = _save_wb(wb, tmp_path)
+        with open(path, "rb") as f:
+            from_buf = parse_workbook(io.BytesIO(f.read()))
+        assert to_json(from_buf) == to_json(parse_workbook(path))
+
+    def test_na_strings_read_as_missing(self, tmp_path):
+        wb = _make_standard_wb()
+        ws = wb["Data"]
+        for r, label in enumerate(["None", "N/A", "Brand B"], start=7):
+            ws.cell(row=r, column=1, value=label)
+            for c in range(2, 8):
+                ws.cell(row=r, column=c, value=10 + c)
+        ws.cell(row=4, column=4, value="#N/A")
+        path = _save_wb(wb, tmp_path)
+
+        # Same raw frame as pandas' own Excel reader with its default na_values
+        raw = dict(_read_sheets(path))["Data"]
+        expected = pd.read_excel(path, header=None, sheet_name="Data")
+        pd.testing.assert_frame_equal(raw, expected, check_dtype=False)
+
+        t = parse_workbook(path)["tables"][0]
+        assert "None" not in t["row_labels"]
+        assert "N/A" not in t["row_labels"]
+        assert "Brand B" in t["row_labels"]
+
+    def test_na_string_set_matches_pandas(self, tmp_path):
+        wb = Workbook()
+        ws = wb.active
+        for r, text in enumerate(sorted(_NA_STRINGS - {""}) + ["n.a.", "Nil"], start=1):
+            ws.cell(row=r, column=1, value=text)
+            ws.cell(row=r, column=2, value=r)
+        path = _save_wb(wb, tmp_path)
+        raw = _read_sheets(path)[0][1]
+        expected = pd.read_excel(path, header=None)
+        pd.testing.assert_frame_equal(raw, expected, check_dtype=False)
+
+    def test_legacy_xls_detected(self, tmp_path):
+        ole = io.BytesIO(b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1" + b"\0" * 504)
+        assert _is_legacy_xls(ole) is True
+        assert ole.tell() == 0
+        path = _save_wb(_make_standard_wb(), tmp_path)
+        assert _is_legacy_xls(path) is False
+
 
 # ---------------------------------------------------------------------------
 # Single-row header (no metric row)
@@ -272,6 +339,31 @@ class TestEmptySheet:
         assert result["tables"] == []
 
 
+# ---------------------------------------------------------------------------
+# Multiple sheets
+# ---------------------------------------------------------------------------
+
+class TestMultipleSheets:
+    @pytest.mark.parametrize("max_workers", [None, 1, 4])
+    def test_sheet_order_preserved(self, tmp_path, max_workers):
+        wb = _make_standard_wb()
+        for name in ("Second", "Third", "Fourth"):
+            src = wb["Data"]
+            ws = wb.copy_worksheet(src)
+            ws.title = name
+        path = _save_wb(wb, tmp_path)
+        tables = parse_workbook(path, parse_options={"max_workers": max_workers})["tables"]
+        assert [t["id"] for t in tables] == ["Data#1", "Second#1", "Third#1", "Fourth#1"]
+
+    def test_repeated_labels_share_one_object(self, tmp_path):
+        wb = _make_standard_wb()
+        wb.copy_worksheet(wb["Data"]).title = "Second"
+        path = _save_wb(wb, tmp_path)
+        first, second = parse_workbook(path)["tables"]
+        assert all(a is b for a, b in zip(first["col_labels"], second["col_labels"]))
+        assert all(a is b for a, b in zip(first["row_labels"], second["row_labels"]))
+
+
 # ---------------------------------------------------------------------------
 # Custom parse_options
 # ---------------------------------------------------------------------------
@@ -0,0 +1,133 @@
+"""Tests for mapping_helper.py — package-level shape listing and mapping files."""
+
+import pytest
+from pptx import Presentation
+from pptx.chart.data import CategoryChartData
+from pptx.enum.chart import XL_CHART_TYPE
+from pptx.enum.shapes import MSO_CONNECTOR
+from pptx.util import Inches
+
+from mapping_helper import _load_mapping_file, list_all_shapes
+
+P_NS = "{http://schemas.openxmlformats.org/presentationml/2006/main}"
+
+
+def _set_descr(shape, text):
+    next(shape.element.iter(P_NS + "cNvPr")).set("descr", text)
+
+
+def _pptx_fields(shape):
+    """What python-pptx reports for *shape*, in list_all_shapes' terms."""
+    if shape.has_chart:
+        shape_type = "chart"
+    elif shape.has_table:
+        shape_type = "table"
+    elif shape.has_text_frame and shape.text_frame.text.strip():
+        shape_type = "text"
+    else:
+        shape_type = "other"
+    alt_text = ""
+    if shape.element.tag in (P_NS + "sp", P_NS + "graphicFrame"):
+        alt_text = next(shape.element.iter(P_NS + "cNvPr")).get("descr") or ""
+    return {
+        "name": shape.name,
+        "has_chart": shape.has_chart,
+        "has_table": shape.has_table,
+        "type": shape_type,
+        "alt_text": alt_text,
+    }
+
+
+@pytest.fixture
+def shapes_pptx(tmp_path):
+    """Two slides covering every spTree child kind list_all_shapes types."""
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+
+    chart_data = CategoryChartData()
+    chart_data.categories = ["A", "B"]
+    chart_data.add_series("Total", (1, 2))
+    chart = slide.shapes.add_chart(XL_CHART_TYPE.BAR_CLUSTERED, 0, 0,
+                                   Inches(4), Inches(3), chart_data)
+    chart.name = "CHART_awareness"
+    _set_descr(chart, "table_title: Brand Awareness\ntype: chart")
+
+    table = slide.shapes.add_table(2, 2, 0, Inches(3), Inches(4), Inches(1))
+    table.name = "TABLE_base"
+    _set_descr(table, "note only")
+
+    box = slide.shapes.add_textbox(Inches(5), 0, Inches(3), Inches(1))
+    box.text_frame.text = "Question: Which brands?"
+    blank = slide.shapes.add_textbox(Inches(5), Inches(1), Inches(3), Inches(1))
+    blank.text_frame.text = "   "
+    slide.shapes.add_connector(MSO_CONNECTOR.STRAIGHT, 0, 0, Inches(1), Inches(1))
+
+    group = slide.shapes.add_group_shape()
+    group.name = "Legend group"
+    for i in range(2):
+        child = group.shapes.add_textbox(Inches(5), Inches(2 + i), Inches(2), Inches(1))
+        child.text_frame.text = f"Legend {i}"
+        _set_descr(child, "type: text_question")
+
+    second = prs.slides.add_slide(prs.slide_layouts[1])
+    second.shapes.title.text = "Second slide"
+
+    path = tmp_path / "shapes.pptx"
+    prs.save(str(path))
+    return str(path)
+
+
+class TestListAllShapes:
+    def test_matches_python_pptx_shapes(self, shapes_pptx):
+        expected = [
+            dict(_pptx_fields(shape), slide=slide_num, shape_num=shape_num)
+            for slide_num, slide in enumerate(Presentation(shapes_pptx).slides, 1)
+            for shape_num, shape in enumerate(slide.shapes, 1)
+        ]
+        keys = ("slide", "shape_num", "name", "has_chart", "has_table", "type", "alt_text")
+        listed = [{k: s[k] for k in keys} for s in list_all_shapes(shapes_pptx)]
+        assert listed == expected
+
+    def test_group_children_skipped(self, shapes_pptx):
+        shapes = list_all_shapes(shapes_pptx)
+        names = [s["name"] for s in shapes]
+        assert "Legend group" in names
+        assert not any(s["alt_text"] == "type: text_question" for s in shapes)
+
+    def test_mapping_status(self, shapes_pptx):
+        status = {s["name"]: s["mapping_status"] for s in list_all_shapes(shapes_pptx)}
+        assert status["CHART_awareness"] == "mapped"
+        assert status["TABLE_base"] == "named_but_unmapped"
+        assert status["Legend group"] == "unmapped"
+
+
+class TestLoadMappingFile:
+    def test_json_template(self, tmp_path):
+        path = tmp_path / "mapping.json"
+        path.write_text('{"mappings": {"CHART_a": {"table_title": "Q1"}}}')
+        assert _load_mapping_file(str(path)) == {"mappings": {"CHART_a": {"table_title": "Q1"}}}
+
+    def test_py_literal_loaded(self, tmp_path):
+        path = tmp_path / "mapping.py"
+        path.write_text(
+            "# legacy template\n"
+            "MAPPINGS = {\n"
+            "    'CHART_a': {'table_title': 'Q1', 'columns': ['Total', 'Male']},\n"
+            "}\n"
+            "VERSION = 2\n"
+        )
+        assert _load_mapping_file(str(path)) == {
+            "MAPPINGS": {"CHART_a": {"table_title": "Q1", "columns": ["Total", "Male"]}},
+            "VERSION": 2,
+        }
+
+    def test_call_expressions_skipped_not_executed(self, tmp_path):
+        marker = tmp_path / "executed"
+        path = tmp_path / "mapping.py"
+        path.write_text(
+            "MAPPINGS = dict(a=1)\n"
+            f"SIDE_EFFECT = __import__('pathlib').Path({str(marker)!r}).touch()\n"
+            "KEPT = {'b': 2}\n"
+        )
+        assert _load_mapping_file(str(path)) == {"KEPT": {"b": 2}}
+        assert not marker.exists()
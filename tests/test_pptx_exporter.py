@@ -0,0 +1,210 @@
+"""Tests for pptx_exporter.py — deck building, report metadata and batch export."""
+
+import io
+import json
+import multiprocessing
+import zipfile
+
+import numpy as np
+import openpyxl
+import pytest
+from lxml import etree
+from pptx import Presentation
+from pptx.chart.data import CategoryChartData
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+
+import pptx_exporter
+from pptx_exporter import REPORT_META_PARTNAME, export_pptx
+
+
+def _table(i):
+    return {
+        "id": f"Sheet1#{i}",
+        "sheet": "Sheet1",
+        "title": f"Q{i} Brand Awareness",
+        "row_labels": ["Base", "Aided", "Unaided", "Mean"],
+        "col_labels": ["Total", "Male", "Female"],
+        "values": [
+            [1500, 700, 800],
+            [0.85 - i / 100, 0.80, 0.90],
+            [0.45, 0.42, 0.48],
+            [3.2, 3.1, 3.3],
+        ],
+    }
+
+
+@pytest.fixture
+def blank_template(monkeypatch):
+    """Build decks on python-pptx's default template instead of the branded one."""
+    monkeypatch.setattr(pptx_exporter, "_open_template", Presentation)
+    monkeypatch.setattr(pptx_exporter, "LAYOUT", {
+        **pptx_exporter.LAYOUT,
+        "title_slide": 0, "section_header": 2,
+        "primary_chart": 6, "one_two_third_alt": 6,
+    })
+
+
+@pytest.fixture
+def tables():
+    return [_table(i) for i in range(5)]
+
+
+@pytest.fixture
+def selections(tables):
+    kinds = ["bar_h", "table_only", "chart_table", "grouped_bar_2", "donut"]
+    return {
+        t["id"]: {"chart_type": k, "column_keys": ["Total", "Male"],
+                  "callouts": [{"row_label": "Aided"}]}
+        for t, k in zip(tables, kinds)
+    }
+
+
+def _export(tables, selections, **kwargs):
+    buf = io.BytesIO()
+    export_pptx(tables, selections, buf, **kwargs)
+    buf.seek(0)
+    return buf
+
+
+def _report_meta(prs):
+    parts = [rel.target_part for rel in prs.part.rels.values()
+             if rel.reltype == RT.CUSTOM_XML]
+    assert [str(p.partname) for p in parts] == [REPORT_META_PARTNAME]
+    root = etree.fromstring(parts[0].blob)
+    assert root.tag == "reportMeta"
+    return json.loads(root.text)
+
+
+# ---------------------------------------------------------------------------
+# Report metadata part
+# ---------------------------------------------------------------------------
+
+class TestReportMeta:
+    def test_entries_keyed_by_slide_id(self, blank_template, tables, selections):
+        prs = Presentation(_export(tables, selections))
+        meta = _report_meta(prs)
+        table_slides = list(prs.slides)[1:]  # after the cover
+        assert [m["slide_id"] for m in meta] == [s.slide_id for s in table_slides]
+        assert [m["table_key"] for m in meta] == [t["title"] for t in tables]
+        assert meta[1]["chart_kind"] == "table_only"
+        assert meta[0]["callout_count"] == 1
+
+    def test_no_data_meta_textbox(self, blank_template, tables, selections):
+        prs = Presentation(_export(tables, selections))
+        names = {sh.name for slide in prs.slides for sh in slide.shapes}
+        assert "DATA_META" not in names
+
+
+# ---------------------------------------------------------------------------
+# Batched export + OPC merge
+# ---------------------------------------------------------------------------
+
+def _deck_summary(buf):
+    """Slide-by-slide shape names, alt text and chart data of a saved deck."""
+    buf.seek(0)
+    prs = Presentation(buf)
+    slides = []
+    for slide in prs.slides:
+        shapes = []
+        for sh in slide.shapes:
+            descr = next(sh.element.iter(pptx_exporter._P_CNVPR)).get("descr")
+            chart = None
+            if sh.has_chart:
+                plot = sh.chart.plots[0]
+                chart = (list(plot.categories),
+                         [(s.name, list(s.values)) for s in plot.series])
+            shapes.append((sh.name, descr, chart))
+        slides.append(shapes)
+    meta = _report_meta(prs)
+    # slide ids are remapped on merge; compare them as deck positions
+    positions = {s.slide_id: i for i, s in enumerate(prs.slides)}
+    for m in meta:
+        m["slide_id"] = positions[m["slide_id"]]
+    return slides, meta
+
+
+def _export_streaming(tables, selections, **kwargs):
+    buf = io.BytesIO()
+    pptx_exporter.export_pptx_streaming(tables, selections, buf, **kwargs)
+    buf.seek(0)
+    return buf
+
+
+class TestExportStreaming:
+    @pytest.mark.parametrize("batch_size", [1, 2, 50])
+    def test_matches_single_deck_export(self, blank_template, tables, selections,
+                                        batch_size):
+        insights = {tables[0]["title"]: {"takeaway": "Up", "analysis": "Aided rose"}}
+        expected = _deck_summary(_export(tables, selections, ai_insights=insights))
+        merged = _export_streaming(tables, selections, ai_insights=insights,
+                                   batch_size=batch_size)
+        assert _deck_summary(merged) == expected
+
+    @pytest.mark.skipif(multiprocessing.get_start_method() != "fork",
+                        reason="workers only inherit the template patch when forked")
+    def test_worker_processes_match_serial_run(self, blank_template, tables, selections):
+        serial = _deck_summary(_export_streaming(tables, selections, batch_size=2))
+        parallel = _export_streaming(tables, selections, batch_size=2, workers=2)
+        assert _deck_summary(parallel) == serial
+
+    def test_merged_zip_has_unique_members(self, blank_template, tables, selections):
+        merged = _export_streaming(tables, selections, batch_size=1)
+        with zipfile.ZipFile(merged) as z:
+            names = z.namelist()
+            assert z.testzip() is None
+        assert len(names) == len(set(names))
+
+    def test_merged_deck_resaves(self, blank_template, tables, selections):
+        prs = Presentation(_export_streaming(tables, selections, batch_size=2))
+        assert len(prs.slides) == 1 + len(tables)
+        prs.save(io.BytesIO())
+
+    def test_batch_size_below_one_rejected(self, tables, selections):
+        with pytest.raises(ValueError):
+            pptx_exporter.export_pptx_streaming(tables, selections, io.BytesIO(),
+                                                batch_size=0)
+
+
+# ---------------------------------------------------------------------------
+# Embedded chart workbook
+# ---------------------------------------------------------------------------
+
+def _sheet_values(blob):
+    wb = openpyxl.load_workbook(io.BytesIO(blob))
+    return [[c.value for c in row] for row in wb["Sheet1"].iter_rows()]
+
+
+def _chart_data_pair(categories, series):
+    pair = (CategoryChartData(), pptx_exporter._ChartData())
+    for cd in pair:
+        cd.categories = categories
+        for name, values in series:
+            cd.add_series(name, values)
+    return pair
+
+
+class TestChartWorkbook:
+    def test_cells_match_python_pptx_workbook(self):
+        ref, ours = _chart_data_pair(
+            ["Aided", "A & B <c>", None, 7, " padded "],
+            [("Total", [0.5, None, 3, np.float64(0.25), np.int64(4)]),
+             ("Male & <Female>", [1, 2, 3, 4, 5]),
+             ("Other", [0.1, 0.2, None, 0.4, 0.5])],
+        )
+        assert _sheet_values(ours.xlsx_blob) == _sheet_values(ref.xlsx_blob)
+
+    def test_wide_chart_columns(self):
+        ref, ours = _chart_data_pair(
+            [f"r{i}" for i in range(12)],
+            [(f"s{k}", [float(i * k) for i in range(12)]) for k in range(28)],
+        )
+        assert _sheet_values(ours.xlsx_blob) == _sheet_values(ref.xlsx_blob)
+
+    def test_multi_level_categories_fall_back(self, monkeypatch):
+        ours = pptx_exporter._ChartData()
+        group = ours.add_category("Gender")
+        group.add_sub_category("Male")
+        group.add_sub_category("Female")
+        ours.add_series("Total", (1, 2))
+        monkeypatch.setattr(CategoryChartData, "xlsx_blob", property(lambda self: b"stock"))
+        assert ours.xlsx_blob == b"stock"
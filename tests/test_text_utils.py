@@ -152,7 +152,8 @@ class TestSafeUpdateText:
     def test_preserve_font_false(self):
         tb = self._make_textbox()
         tb.text_frame.text = "original"
-        result = safe_update_text(tb, "updated", preserve_font=False)
+        with pytest.warns(DeprecationWarning):
+            result = safe_update_text(tb, "updated", preserve_font=False)
         assert result is True
         assert tb.text_frame.text == "updated"
 
@@ -164,7 +165,8 @@ class TestSafeUpdateText:
         p.runs[0].font.bold = True
         p.runs[0].font.size = Pt(18)
 
-        result = safe_update_text(tb, "world", preserve_font=True)
+        with pytest.warns(DeprecationWarning):
+            result = safe_update_text(tb, "world", preserve_font=True)
         assert result is True
         assert tb.text_frame.text == "world"
 
@@ -180,13 +182,34 @@ class TestSafeUpdateText:
         run2 = p.add_run()
         run2.text = " not bold"
 
-        result = safe_update_text(tb, "replaced", preserve_font=True)
+        with pytest.warns(DeprecationWarning):
+            result = safe_update_text(tb, "replaced", preserve_font=True)
         assert result is True
         assert tb.text_frame.text == "replaced"
         assert len(p.runs) == 1
         assert p.runs[0].font.bold is True
         assert p.runs[0].font.size == Pt(14)
 
+    def test_multiple_runs_keep_first_run_properties(self):
+        tb = self._make_textbox()
+        tf = tb.text_frame
+        tf.text = "first"
+        p = tf.paragraphs[0]
+        p.runs[0].font.underline = True
+        p.add_line_break()
+        p.add_run().text = "second"
+
+        safe_update_text(tb, "replaced")
+        assert tb.text_frame.text == "replaced"
+        assert len(p.runs) == 1
+        assert p.runs[0].font.underline is True
+
+    def test_default_call_does_not_warn(self, recwarn):
+        tb = self._make_textbox()
+        tb.text_frame.text = "old"
+        safe_update_text(tb, "new")
+        assert not [w for w in recwarn if issubclass(w.category, DeprecationWarning)]
+
     def test_returns_false_for_object_without_text(self):
         class Dummy:
             pass
@@ -7,8 +7,11 @@ from lxml import etree
 from pptx import Presentation
 from pptx.util import Inches
 
+import deck_update
 from chart_data_patcher import _C_NS
+from crosstab_parser import parse_workbook
 from deck_update import update_presentation
+from smart_match import SmartMatcher
 
 P_NS = "http://schemas.openxmlformats.org/presentationml/2006/main"
 
@@ -175,3 +178,41 @@ class TestProgressCallback:
 
         assert len(progress_values) >= 1
         assert progress_values[-1] == pytest.approx(1.0)
+
+
+# ---------------------------------------------------------------------------
+# test workbook parse reuse
+# ---------------------------------------------------------------------------
+
+class TestWorkbookReuse:
+    @pytest.fixture
+    def parse_calls(self, monkeypatch):
+        calls = []
+        real = deck_update.parse_workbook
+
+        def _counting(src, *args, **kwargs):
+            calls.append(src)
+            return real(src, *args, **kwargs)
+
+        monkeypatch.setattr(deck_update, "parse_workbook", _counting)
+        deck_update._parse_workbook_at.cache_clear()
+        yield calls
+        deck_update._parse_workbook_at.cache_clear()
+
+    def test_unchanged_path_parsed_once(self, mini_pptx, sample_crosstab_xlsx, tmp_path, parse_calls):
+        update_presentation(mini_pptx, sample_crosstab_xlsx, str(tmp_path / "a.pptx"))
+        update_presentation(mini_pptx, sample_crosstab_xlsx, str(tmp_path / "b.pptx"))
+        assert len(parse_calls) == 1
+
+    def test_modified_file_reparsed(self, mini_pptx, sample_crosstab_xlsx, tmp_path, parse_calls):
+        update_presentation(mini_pptx, sample_crosstab_xlsx, str(tmp_path / "a.pptx"))
+        st = os.stat(sample_crosstab_xlsx)
+        os.utime(sample_crosstab_xlsx, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        update_presentation(mini_pptx, sample_crosstab_xlsx, str(tmp_path / "b.pptx"))
+        assert len(parse_calls) == 2
+
+    def test_supplied_matcher_skips_parse(self, mini_pptx, sample_crosstab_xlsx, tmp_path, parse_calls):
+        tables = parse_workbook(sample_crosstab_xlsx)["tables"]
+        update_presentation(mini_pptx, sample_crosstab_xlsx, str(tmp_path / "a.pptx"),
+                            matcher=SmartMatcher(tables))
+        assert parse_calls == []
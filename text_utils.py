@@ -8,6 +8,7 @@ app.py, deck_update.py, and pptx_exporter.py.
 
 import logging
 import re
+import warnings
 from typing import Dict, Optional, Union
 
 logger = logging.getLogger("report_relay.text_utils")
@@ -28,6 +29,10 @@ def format_number_with_commas(number) -> Optional[str]:
 # Base text parsing / formatting
 # ---------------------------------------------------------------------------
 
+# A digit run that may contain thousands separators, e.g. "1,448"
+_BASE_N_RE = re.compile(r"[\d,]*\d[\d,]*")
+
+
 def parse_base_text(text: str) -> Dict[str, object]:
     """Extract description and N value from a base string.
 
@@ -43,32 +48,21 @@ def parse_base_text(text: str) -> Dict[str, object]:
     if not text or "Base:" not in text:
         return result
 
-    parts_by_period = text.split(".")
-    if len(parts_by_period) >= 2:
-        desc = parts_by_period[0].replace("Base:", "").strip()
-        desc = desc.rstrip(" =").strip()
-        result["description"] = desc
-
-        remainder = ".".join(parts_by_period[1:])
-        nums = re.findall(r"[\d,]+", remainder)
-        for n in nums:
-            cleaned = n.replace(",", "")
-            if cleaned.isdigit():
-                result["n_value"] = int(cleaned)
-                break
+    head, sep, remainder = text.partition(".")
+    if sep:
+        result["description"] = head.replace("Base:", "").strip().rstrip(" =").strip()
+        m = _BASE_N_RE.search(remainder)
+        if m:
+            result["n_value"] = int(m.group().replace(",", ""))
     else:
         tokens = text.split()
-        if len(tokens) >= 3:
-            try:
-                base_idx = tokens.index("Base:")
-            except ValueError:
-                return result
+        if len(tokens) >= 3 and "Base:" in tokens:
             desc_tokens = []
-            for i in range(base_idx + 1, len(tokens)):
-                if tokens[i].replace(",", "").isdigit():
-                    result["n_value"] = int(tokens[i].replace(",", ""))
+            for tok in tokens[tokens.index("Base:") + 1:]:
+                if _BASE_N_RE.fullmatch(tok):
+                    result["n_value"] = int(tok.replace(",", ""))
                     break
-                desc_tokens.append(tokens[i])
+                desc_tokens.append(tok)
             result["description"] = " ".join(desc_tokens).rstrip(" =").strip()
 
     return result
@@ -88,24 +82,32 @@ def format_base_text(description: str, n_value: Optional[int] = None) -> str:
 
 def _get_text_frame(target):
     """Return the text_frame for a shape or table cell."""
-    if hasattr(target, "text_frame"):
+    try:
         return target.text_frame
-    return None
+    except AttributeError:
+        return None
 
 
-def safe_update_text(target, new_text: str, *, preserve_font: bool = False) -> bool:
+def safe_update_text(target, new_text: str, *, preserve_font: Optional[bool] = None) -> bool:
     """Update text content while preserving paragraph/run formatting.
 
     Works with both shapes (via shape.text_frame) and table cells
     (via cell.text_frame).
 
-    When *preserve_font* is True and the first paragraph has multiple runs,
-    the paragraph is cleared and a single new run is created with font
-    properties copied from the original first run (name, size, bold,
-    italic, colour).
+    When the first paragraph has multiple runs, all but the first are
+    removed so the text does not concatenate; the first run's font is kept
+    as-is.  *preserve_font* is deprecated and ignored: the first run's
+    formatting is always preserved.  Passing it emits a DeprecationWarning.
 
     Returns True if the update was applied, False otherwise.
     """
+    if preserve_font is not None:
+        warnings.warn(
+            "safe_update_text(preserve_font=...) is ignored and will be removed; "
+            "the first run's formatting is always preserved",
+            DeprecationWarning,
+            stacklevel=2,
+        )
     tf = _get_text_frame(target)
     if tf is None:
         # Last resort for table cells with a .text attribute
@@ -114,65 +116,27 @@ def safe_update_text(target, new_text: str, *, preserve_font: bool = False) -> b
             return True
         return False
 
-    if not hasattr(tf, "paragraphs") or len(tf.paragraphs) == 0:
+    # Each .paragraphs / .runs access builds fresh proxies, so read once
+    paragraphs = getattr(tf, "paragraphs", None)
+    if not paragraphs:
         tf.text = new_text
         return True
 
-    paragraph = tf.paragraphs[0]
+    paragraph = paragraphs[0]
+    runs = paragraph.runs
 
-    if not paragraph.runs:
+    if not runs:
         run = paragraph.add_run()
         run.text = new_text
         return True
 
-    first_run = paragraph.runs[0]
-
-    if preserve_font and len(paragraph.runs) > 1:
-        font_props = _snapshot_font(first_run.font)
-        paragraph.clear()
-        new_run = paragraph.add_run()
-        new_run.text = new_text
-        _apply_font_snapshot(new_run.font, font_props)
-    else:
-        first_run.text = new_text
-        # Clear extra runs to prevent concatenation
-        if len(paragraph.runs) > 1:
-            font_props = _snapshot_font(first_run.font)
-            paragraph.clear()
-            new_run = paragraph.add_run()
-            new_run.text = new_text
-            _apply_font_snapshot(new_run.font, font_props)
-
+    first_run = runs[0]
+    if len(runs) > 1:
+        # Drop every other run/break/field in place; the first run keeps
+        # its own rPr, so nothing has to be copied onto a rebuilt run.
+        p_el, keep = paragraph._p, first_run._r
+        for el in p_el.content_children:
+            if el is not keep:
+                p_el.remove(el)
+    first_run.text = new_text
     return True
-
-
-def _snapshot_font(font) -> dict:
-    """Capture font properties that we want to preserve across a clear."""
-    props: dict = {}
-    for attr in ("name", "size", "bold", "italic"):
-        try:
-            props[attr] = getattr(font, attr)
-        except Exception:
-            props[attr] = None
-    try:
-        if hasattr(font.color, "rgb") and font.color.rgb is not None:
-            props["color_rgb"] = font.color.rgb
-    except Exception:
-        pass
-    return props
-
-
-def _apply_font_snapshot(font, props: dict):
-    """Re-apply previously captured font properties."""
-    for attr in ("name", "size", "bold", "italic"):
-        val = props.get(attr)
-        if val is not None:
-            try:
-                setattr(font, attr, val)
-            except Exception:
-                pass
-    if "color_rgb" in props:
-        try:
-            font.color.rgb = props["color_rgb"]
-        except Exception:
-            pass